@@ -0,0 +1,42 @@
+from app.cli.job import PARSER_CHOICES
+
+from pathlib import Path as pathlib_Path
+import sys
+import time
+import click
+
+
+@click.command()
+@click.argument("folder", default="sample", type=click.Path(exists=True, file_okay=False))
+@click.option("--reference", type=click.Choice(PARSER_CHOICES), default="camelot", show_default=True)
+@click.option("--candidate", type=click.Choice(PARSER_CHOICES), default="text", show_default=True)
+def main(folder, reference, candidate):
+    from app.models.parsers import cross_check, get_parser
+
+    reference_parser = get_parser(reference)
+    candidate_parser = get_parser(candidate)
+
+    pdfs = sorted(pathlib_Path(folder).rglob("*.pdf"))
+    failed = 0
+    for pdf in pdfs:
+        start = time.perf_counter()
+        try:
+            differences = cross_check(pdf, reference_parser, candidate_parser)
+        except Exception as e:
+            differences = [f"{type(e).__name__}: {e}"]
+        elapsed = time.perf_counter() - start
+
+        if differences:
+            failed += 1
+            print(f"✗ {pdf} ({elapsed:.2f}s)")
+            for difference in differences:
+                print(f"    {difference}")
+        else:
+            print(f"✓ {pdf} ({elapsed:.2f}s)")
+
+    print(f"{len(pdfs) - failed}/{len(pdfs)} files match between '{reference}' and '{candidate}'.")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
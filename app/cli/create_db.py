@@ -1,14 +1,50 @@
-from app.utils.functions.util_functions import concurrent_ASFT
-from app.utils.excel_db import add_data_to_db
+from app.cli.job import (
+    PARSER_CHOICES,
+    RUNWAY_MATERIAL_CHOICES,
+    STORAGE_CHOICES,
+    SURFACE_CONDITION_CHOICES,
+    WEATHER_CHOICES,
+    ask_missing,
+    job_option,
+    resolve_options,
+)
+from app.cli.progress import Progress, report_timings, timings_option
+from app.utils.instrumentation import TimingRecorder
+from app.utils.manifest import DUPLICATE, FAILED, OK, IngestManifest
 
 from pathlib import Path as pathlib_Path
-from inquirer import prompt, List, Path, Text
+from inquirer import List, Path, Text
 import click
 from yaspin import yaspin
 
 
 @click.command()
-def main():
+@job_option
+@click.option("--folder", "folder_path", type=click.Path(exists=True, file_okay=False), help="Carpeta de mediciones.")
+@click.option("--db", "db_file", type=click.Path(dir_okay=False), help="Archivo de base de datos.")
+@click.option("--runway-length", type=int, help="Longitud de la pista (múltiplos de 10).")
+@click.option("--starting-point-1", type=int, help="Punto de inicio para cabecera ∈ [01 - 18] (múltiplos de 10).")
+@click.option("--starting-point-2", type=int, help="Punto de inicio para cabecera ∈ [19 - 36] (múltiplos de 10).")
+@click.option("--operator", help="Operador.")
+@click.option("--temperature", type=int, help="Temperatura.")
+@click.option("--surface-condition", type=click.Choice(SURFACE_CONDITION_CHOICES), help="Condición de superficie.")
+@click.option("--weather", type=click.Choice(WEATHER_CHOICES), help="Condición metereológica.")
+@click.option("--runway-material", type=click.Choice(RUNWAY_MATERIAL_CHOICES), help="Tipo de pavimento.")
+@click.option("--workers", type=int, help="Cantidad de procesos para leer las mediciones.")
+@click.option("--parser", type=click.Choice(PARSER_CHOICES), help="Lector de PDF (por defecto camelot).")
+@click.option(
+    "--storage", type=click.Choice(STORAGE_CHOICES), help="Tipo de base de datos (por defecto según la extensión)."
+)
+@click.option(
+    "--parquet",
+    "parquet_dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Carpeta de una copia en Parquet de la base de datos, particionada por aeropuerto y año.",
+)
+@click.option("--force", is_flag=True, default=None, help="Procesar también los archivos ya incorporados.")
+@timings_option
+def main(job_file, timings_file, **options):
     folder_path_question = Path("folder_path", message="Carpeta de mediciones", exists=True)
     db_file_question = Path("db_file", message="Archivo de base de datos")
 
@@ -22,16 +58,12 @@ def main():
     operator_question = Text("operator", message="Operador:")
     temperature_question = Text("temperature", message="Temperatura:")
     surface_condition_question = List(
-        "surface_condition", message="Condición de superficie:", choices=["Seco", "Húmedo"]
+        "surface_condition", message="Condición de superficie:", choices=SURFACE_CONDITION_CHOICES
     )
-    weather_question = List(
-        "weather",
-        message="Condición metereológica:",
-        choices=["Bueno", "Nublado", "Soleado", "Lluvioso", "Escarcha"],
-    )
-    runway_material_question = List("runway_material", message="Tipo de pavimento:", choices=["Asfalto", "Hormigón"])
+    weather_question = List("weather", message="Condición metereológica:", choices=WEATHER_CHOICES)
+    runway_material_question = List("runway_material", message="Tipo de pavimento:", choices=RUNWAY_MATERIAL_CHOICES)
 
-    answers = prompt(
+    answers = ask_missing(
         [
             folder_path_question,
             db_file_question,
@@ -43,9 +75,16 @@ def main():
             surface_condition_question,
             weather_question,
             runway_material_question,
-        ]
+        ],
+        resolve_options(job_file, options),
     )
 
+    from app.models.parsers import get_parser
+    from app.utils.functions.util_functions import iter_ASFT, ParseError
+    from app.utils.parse_cache import ParseCache
+    from app.utils.databases import get_storage
+    from app.utils.storage import StorageGroup
+
     folder_path = pathlib_Path(answers["folder_path"]).resolve()
     db_file = pathlib_Path(answers["db_file"]).resolve()
     measurements = folder_path
@@ -55,9 +94,27 @@ def main():
         if item.is_file():
             file_list.append(item)
 
-    with yaspin(text="Cargando...", spinner="line") as spinner:
-        data = concurrent_ASFT(file_list)
-        for i in data:
+    manifest = IngestManifest(db_file)
+    if not answers.get("force"):
+        pending = manifest.pending(file_list)
+        if len(pending) < len(file_list):
+            print(f"Skipping {len(file_list) - len(pending)} files already in the database.")
+        file_list = pending
+
+    parser = get_parser(answers.get("parser", "camelot"))
+    storage = get_storage(db_file, answers.get("storage"))
+    if answers.get("parquet_dir") is not None:
+        storage = StorageGroup(storage, get_storage(answers["parquet_dir"], "parquet"))
+
+    added = []
+    progress = Progress(len(file_list))
+    with yaspin(text="Cargando...", spinner="line") as spinner, TimingRecorder() as recorder, storage as db:
+        for i in iter_ASFT(file_list, cache=ParseCache(), max_workers=answers.get("workers"), parser=parser):
+            spinner.text = progress.update()
+            if isinstance(i, ParseError):
+                print(f"Error processing {i}")
+                manifest.record(i.file_path, FAILED, error=f"{i.error_type}: {i.message}")
+                continue
             i.operator = answers["operator"]
             i.temperature = int(answers["temperature"])
             i.surface_condition = answers["surface_condition"]
@@ -65,20 +122,33 @@ def main():
             i.runway_material = answers["runway_material"]
             i.runway_length = int(answers["runway_length"])
             try:
+                if i.key_1 in db:
+                    print(f"{i.filename} is already in the database.")
+                    manifest.record(i.file_path, DUPLICATE, key_1=i.key_1)
+                    continue
                 if int(i.numbering) <= 18:
                     i.starting_point = int(answers["starting_point_1"])
-                    add_data_to_db(i, db_file)
+                    db.add(i)
                 else:
                     i.starting_point = int(answers["starting_point_2"])
-                    add_data_to_db(i, db_file)
+                    db.add(i)
+                added.append(i)
                 print(f"Added {i.filename} to the database.")
             except Exception as e:
                 print(f"Error processing {i.filename}: {e}")
+                manifest.record(i.file_path, FAILED, error=str(e))
                 continue
 
         spinner.text = "¡Listo!"
         spinner.ok("✓")
 
+    report_timings(recorder, timings_file)
+
+    # Only reached once the database is saved, so the files of an interrupted batch are processed again.
+    for i in added:
+        manifest.record(i.file_path, OK, key_1=i.key_1)
+    manifest.save()
+
 
 if __name__ == "__main__":
     main()
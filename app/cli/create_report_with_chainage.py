@@ -1,13 +1,35 @@
-from app.utils.functions.util_functions import concurrent_ASFT
-from app.utils.report import write_report_with_chainage
+from app.cli.job import (
+    PARSER_CHOICES,
+    RUNWAY_MATERIAL_CHOICES,
+    WEATHER_CHOICES,
+    ask_missing,
+    job_option,
+    resolve_options,
+)
+from app.cli.progress import report_timings, timings_option
+from app.utils.instrumentation import TimingRecorder
 from pathlib import Path as pathlib_Path
-from inquirer import prompt, List, Path, Text
+from inquirer import List, Path, Text
 import click
 from yaspin import yaspin
 
 
-def run_write_report(left_file, right_file, weather, runway_material, runway_length, starting_point, output_folder):
-    L, R = concurrent_ASFT(left_file, right_file)
+def run_write_report(
+    left_file,
+    right_file,
+    weather,
+    runway_material,
+    runway_length,
+    starting_point,
+    output_folder,
+    max_workers=None,
+    parser=None,
+):
+    from app.utils.functions.util_functions import concurrent_ASFT
+    from app.utils.parse_cache import ParseCache
+    from app.utils.report import write_report_with_chainage
+
+    L, R = concurrent_ASFT(left_file, right_file, cache=ParseCache(), max_workers=max_workers, parser=parser)
     L.weather = weather
     L.runway_material = runway_material
     L.runway_length = int(runway_length)
@@ -17,20 +39,27 @@ def run_write_report(left_file, right_file, weather, runway_material, runway_len
 
 
 @click.command()
-def main():
+@job_option
+@click.option("--left", "left_file", type=click.Path(exists=True, dir_okay=False), help="Medición lado izquierdo.")
+@click.option("--right", "right_file", type=click.Path(exists=True, dir_okay=False), help="Medición lado derecho.")
+@click.option("--output", "output_folder", type=click.Path(exists=True, file_okay=False), help="Carpeta de destino.")
+@click.option("--weather", type=click.Choice(WEATHER_CHOICES), help="Condición metereológica.")
+@click.option("--runway-material", type=click.Choice(RUNWAY_MATERIAL_CHOICES), help="Tipo de pavimento.")
+@click.option("--runway-length", type=int, help="Longitud de la pista (múltiplos de 10).")
+@click.option("--starting-point", type=int, help="Punto de inicio (múltiplos de 10).")
+@click.option("--workers", type=int, help="Cantidad de procesos para leer las mediciones.")
+@click.option("--parser", type=click.Choice(PARSER_CHOICES), help="Lector de PDF (por defecto camelot).")
+@timings_option
+def main(job_file, timings_file, **options):
     left_file_question = Path("left_file", message="Medición lado izquierdo:", exists=True)
     right_file_question = Path("right_file", message="Medición lado derecho:", exists=True)
     output_folder_question = Path("output_folder", message="Carpeta de destino", exists=True)
-    weather_question = List(
-        "weather",
-        message="Condición metereológica:",
-        choices=["Bueno", "Nublado", "Soleado", "Lluvioso", "Escarcha"],
-    )
-    runway_material_question = List("runway_material", message="Tipo de pavimento:", choices=["Asfalto", "Hormigón"])
+    weather_question = List("weather", message="Condición metereológica:", choices=WEATHER_CHOICES)
+    runway_material_question = List("runway_material", message="Tipo de pavimento:", choices=RUNWAY_MATERIAL_CHOICES)
     runway_length_question = Text("runway_length", message="Longitud de la pista (múltiplos de 10):")
     starting_point_question = Text("starting_point", message="Punto de inicio (múltiplos de 10):")
 
-    answers = prompt(
+    answers = ask_missing(
         [
             left_file_question,
             right_file_question,
@@ -39,9 +68,12 @@ def main():
             runway_material_question,
             runway_length_question,
             starting_point_question,
-        ]
+        ],
+        resolve_options(job_file, options),
     )
 
+    from app.models.parsers import get_parser
+
     left_file = pathlib_Path(answers["left_file"]).resolve()
     right_file = pathlib_Path(answers["right_file"]).resolve()
     weather = answers["weather"]
@@ -49,12 +81,25 @@ def main():
     output_folder = pathlib_Path(answers["output_folder"]).resolve()
     runway_length = answers["runway_length"]
     starting_point = answers["starting_point"]
+    parser = get_parser(answers.get("parser", "camelot"))
 
-    with yaspin(text="Cargando...", spinner="line") as spinner:
-        run_write_report(left_file, right_file, weather, runway_material, runway_length, starting_point, output_folder)
+    with yaspin(text="Cargando...", spinner="line") as spinner, TimingRecorder() as recorder:
+        run_write_report(
+            left_file,
+            right_file,
+            weather,
+            runway_material,
+            runway_length,
+            starting_point,
+            output_folder,
+            answers.get("workers"),
+            parser,
+        )
         spinner.text = "¡Listo!"
         spinner.ok("✓")
 
+    report_timings(recorder, timings_file)
+
 
 if __name__ == "__main__":
     main()
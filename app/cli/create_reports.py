@@ -0,0 +1,107 @@
+from app.cli.job import (
+    PARSER_CHOICES,
+    RUNWAY_MATERIAL_CHOICES,
+    WEATHER_CHOICES,
+    ask_missing,
+    job_option,
+    resolve_options,
+)
+from app.cli.progress import Progress, report_timings, timings_option
+from app.utils.instrumentation import TimingRecorder
+
+from pathlib import Path as pathlib_Path
+from inquirer import Confirm, List, Path, Text
+import click
+from yaspin import yaspin
+
+
+@click.command()
+@job_option
+@click.option("--folder", "folder_path", type=click.Path(exists=True, file_okay=False), help="Carpeta de mediciones.")
+@click.option("--output", "output_folder", type=click.Path(exists=True, file_okay=False), help="Carpeta de destino.")
+@click.option("--chainage/--no-chainage", default=None, help="Informes con o sin progresivas.")
+@click.option("--weather", type=click.Choice(WEATHER_CHOICES), help="Condición metereológica.")
+@click.option("--runway-material", type=click.Choice(RUNWAY_MATERIAL_CHOICES), help="Tipo de pavimento.")
+@click.option("--runway-length", type=int, help="Longitud de la pista (múltiplos de 10).")
+@click.option("--starting-point-1", type=int, help="Punto de inicio para cabecera ∈ [01 - 18] (múltiplos de 10).")
+@click.option("--starting-point-2", type=int, help="Punto de inicio para cabecera ∈ [19 - 36] (múltiplos de 10).")
+@click.option("--workers", type=int, help="Cantidad de procesos para leer las mediciones y escribir los informes.")
+@click.option("--parser", type=click.Choice(PARSER_CHOICES), help="Lector de PDF (por defecto camelot).")
+@timings_option
+def main(job_file, timings_file, **options):
+    folder_path_question = Path("folder_path", message="Carpeta de mediciones", exists=True)
+    output_folder_question = Path("output_folder", message="Carpeta de destino", exists=True)
+    chainage_question = Confirm("chainage", message="¿Informes con progresivas?", default=True)
+    weather_question = List("weather", message="Condición metereológica:", choices=WEATHER_CHOICES)
+    runway_material_question = List("runway_material", message="Tipo de pavimento:", choices=RUNWAY_MATERIAL_CHOICES)
+    runway_length_question = Text("runway_length", message="Longitud de la pista (múltiplos de 10):")
+    starting_point_1_question = Text(
+        "starting_point_1", message="Punto de inicio para cabecera ∈ [01 - 18] (múltiplos de 10):"
+    )
+    starting_point_2_question = Text(
+        "starting_point_2", message="Punto de inicio para cabecera ∈ [19 - 36] (múltiplos de 10):"
+    )
+
+    answers = ask_missing(
+        [folder_path_question, output_folder_question, chainage_question, weather_question, runway_material_question],
+        resolve_options(job_file, options),
+    )
+    chainage = bool(answers["chainage"])
+    if chainage:
+        answers = ask_missing([runway_length_question, starting_point_1_question, starting_point_2_question], answers)
+
+    from app.models.parsers import get_parser
+    from app.utils.functions.util_functions import iter_ASFT, ParseError
+    from app.utils.batch_report import ReportSettings, batch_reports
+    from app.utils.parse_cache import ParseCache
+
+    folder_path = pathlib_Path(answers["folder_path"]).resolve()
+    output_folder = pathlib_Path(answers["output_folder"]).resolve()
+    settings = ReportSettings(
+        weather=answers["weather"],
+        runway_material=answers["runway_material"],
+        runway_length=int(answers["runway_length"]) if chainage else None,
+        starting_point_1=int(answers["starting_point_1"]) if chainage else None,
+        starting_point_2=int(answers["starting_point_2"]) if chainage else None,
+    )
+    max_workers = answers.get("workers")
+    parser = get_parser(answers.get("parser", "camelot"))
+
+    file_list = [item for item in folder_path.iterdir() if item.is_file()]
+    cache = ParseCache()
+
+    with yaspin(text="Cargando...", spinner="line") as spinner, TimingRecorder() as recorder:
+        runs = []
+        progress = Progress(len(file_list))
+        for i in iter_ASFT(file_list, cache=cache, max_workers=max_workers, header_only=True, parser=parser):
+            spinner.text = f"Leyendo mediciones: {progress.update()}"
+            if isinstance(i, ParseError):
+                print(f"Error processing {i}")
+                continue
+            runs.append(i)
+
+        # Every pair writes the report of two runs.
+        progress = Progress(len(runs) // 2)
+
+        def report_done(name: str) -> None:
+            spinner.text = f"Escribiendo informes: {progress.update()}"
+
+        result = batch_reports(runs, settings, output_folder, chainage, cache, max_workers, parser, report_done)
+
+        for name in sorted(result.written):
+            print(f"Written Datos {name}.xlsx")
+        for message in result.unpaired:
+            print(f"Unpaired {message}")
+        for message in result.mismatched:
+            print(f"Mismatched {message}")
+        for message in result.failed:
+            print(f"Error writing {message}")
+
+        spinner.text = "¡Listo!"
+        spinner.ok("✓")
+
+    report_timings(recorder, timings_file)
+
+
+if __name__ == "__main__":
+    main()
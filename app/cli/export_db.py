@@ -0,0 +1,27 @@
+from pathlib import Path as pathlib_Path
+import click
+from yaspin import yaspin
+
+
+@click.command()
+@click.argument("db_file", type=click.Path(exists=True, dir_okay=False))
+@click.argument("excel_file", type=click.Path(dir_okay=False))
+@click.option("--backend", default=None, help="Tipo de base de datos (por defecto según la extensión del archivo).")
+def main(db_file, excel_file, backend):
+    from app.utils.databases import get_storage
+    from app.utils.excel_db import export_to_excel
+
+    db_file = pathlib_Path(db_file).resolve()
+    excel_file = pathlib_Path(excel_file).resolve()
+
+    with yaspin(text="Cargando...", spinner="line") as spinner:
+        with get_storage(db_file, backend) as storage:
+            export_to_excel(storage, excel_file)
+            print(f"Exported {len(storage)} runs to {excel_file}.")
+
+        spinner.text = "¡Listo!"
+        spinner.ok("✓")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import json
+import sys
+import click
+
+from inquirer import prompt
+from inquirer.questions import Question
+from typing import Any, Dict, List, Optional
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+SURFACE_CONDITION_CHOICES = ["Seco", "Húmedo"]
+WEATHER_CHOICES = ["Bueno", "Nublado", "Soleado", "Lluvioso", "Escarcha"]
+RUNWAY_MATERIAL_CHOICES = ["Asfalto", "Hormigón"]
+# Names of app.models.parsers.PARSERS and app.utils.databases.STORAGES, listed here so the options can be declared
+# without importing pandas, camelot or openpyxl. get_parser and get_storage reject any other name.
+PARSER_CHOICES = ["camelot", "text"]
+STORAGE_CHOICES = ["excel", "sqlite", "parquet"]
+
+job_option = click.option(
+    "--job",
+    "job_file",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Archivo de trabajo YAML o JSON con los valores de las opciones.",
+)
+
+
+def load_job(job_file: Optional[str]) -> Dict[str, Any]:
+    """
+    Read a job file holding the values of the options of a command, by option name (e.g. "folder", "runway_length" or
+    "runway-length"). Files ending in .yaml or .yml are read as YAML, which requires PyYAML, and any other file as JSON.
+
+    Args:
+        job_file (Optional[str]): Path to the job file.
+
+    Returns:
+        Dict[str, Any]: The values of the options, with underscores in their names. Empty if there is no job file.
+
+    Raises:
+        click.UsageError: If the file cannot be read as a mapping of options.
+    """
+    if job_file is None:
+        return {}
+
+    path = Path(job_file)
+    with open(path, encoding="utf-8") as file:
+        if path.suffix.lower() in (".yaml", ".yml"):
+            if yaml is None:
+                raise click.UsageError("PyYAML is required to read YAML job files.")
+            job = yaml.safe_load(file) or {}
+        else:
+            job = json.load(file)
+
+    if not isinstance(job, dict):
+        raise click.UsageError(f"The job file {job_file} must hold a mapping of option names to values.")
+    return {key.replace("-", "_"): value for key, value in job.items()}
+
+
+def resolve_options(job_file: Optional[str], options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge the values of a job file with the options given in the command line, which take precedence. Must be called
+    from the command, as the job values are checked and converted by the options of the current click command, e.g.
+    {"folder": "sample", "temperature": "20"} becomes {"folder_path": "sample", "temperature": 20}.
+
+    Args:
+        job_file (Optional[str]): Path to the job file.
+        options (Dict[str, Any]): The options of the command, None when not given.
+
+    Returns:
+        Dict[str, Any]: The merged values, by parameter name of the command.
+
+    Raises:
+        click.UsageError: If the job file holds an unknown option or a value its option does not accept.
+    """
+    ctx = click.get_current_context()
+    params = _job_params(ctx.command)
+
+    values = {}
+    for key, value in load_job(job_file).items():
+        param = params.get(key)
+        if param is None:
+            raise click.UsageError(f"Unknown option '{key}' in the job file {job_file}.")
+        try:
+            values[param.name] = param.type_cast_value(ctx, value)
+        except click.BadParameter as e:
+            raise click.UsageError(f"Invalid value for '{key}' in the job file {job_file}: {e.format_message()}")
+
+    values.update({name: value for name, value in options.items() if value is not None})
+    return values
+
+
+def _job_params(command: click.Command) -> Dict[str, click.Parameter]:
+    """
+    Returns:
+        Dict[str, click.Parameter]: The options of a command that a job file can set, by option name (e.g. "folder"
+        for --folder) and by parameter name (e.g. "folder_path"), with underscores in the names.
+    """
+    params = {}
+    for param in command.params:
+        if not isinstance(param, click.Option) or param.name == "job_file":
+            continue
+        params[param.name] = param
+        for opt in param.opts:
+            params[opt.lstrip("-").replace("-", "_")] = param
+    return params
+
+
+def ask_missing(questions: List[Question], values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Prompt only the questions whose value was not given as an option or in the job file.
+
+    Args:
+        questions (List[Question]): The questions of the command, named after its options.
+        values (Dict[str, Any]): The values already known, as returned by `resolve_options`.
+
+    Returns:
+        Dict[str, Any]: The known values together with the answers.
+
+    Raises:
+        click.UsageError: If some values are missing and there is no terminal to prompt them.
+    """
+    missing = [question for question in questions if values.get(question.name) is None]
+    if not missing:
+        return values
+
+    if not sys.stdin.isatty():
+        raise click.UsageError(f"Missing values: {', '.join(question.name for question in missing)}.")
+
+    answers = prompt(missing, answers=dict(values))
+    if answers is None:
+        raise click.Abort()
+    return {**values, **answers}
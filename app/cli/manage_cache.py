@@ -0,0 +1,42 @@
+from app.utils.parse_cache import ParseCache
+
+from pathlib import Path as pathlib_Path
+import click
+
+
+@click.group()
+@click.option("--cache-dir", type=click.Path(file_okay=False), default=None, help="Carpeta de la caché.")
+@click.pass_context
+def main(ctx, cache_dir):
+    ctx.obj = ParseCache(cache_dir)
+
+
+@main.command()
+@click.pass_obj
+def clear(cache: ParseCache):
+    removed = cache.clear()
+    print(f"Removed {removed} entries from {cache.cache_dir}.")
+
+
+@main.command()
+@click.argument("files", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.pass_obj
+def invalidate(cache: ParseCache, files):
+    from app.models.parsers import PARSERS
+
+    for file in files:
+        namespaces = [f"{parser.name}-{parser.version}" for parser in PARSERS.values()]
+        if any([cache.invalidate(pathlib_Path(file), namespace) for namespace in namespaces]):
+            print(f"Invalidated {file}.")
+        else:
+            print(f"{file} was not cached.")
+
+
+@main.command()
+@click.pass_obj
+def info(cache: ParseCache):
+    print(f"{cache.cache_dir}: {cache.size() / 1024 / 1024:.1f} MB of {cache.max_bytes / 1024 / 1024:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import datetime
+import time
+import click
+
+from app.utils.instrumentation import TimingRecorder
+from typing import Optional
+
+timings_option = click.option(
+    "--timings",
+    "timings_file",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Archivo JSON donde guardar los tiempos de cada etapa.",
+)
+
+
+class Progress:
+    """
+    Files done, throughput and estimated time left of a batch, as the text of the CLI spinner.
+
+    Example:
+        progress = Progress(len(file_list))
+        for data in iter_ASFT(file_list):
+            spinner.text = progress.update()
+    """
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.done = 0
+        self._start = time.perf_counter()
+
+    def update(self, count: int = 1) -> str:
+        """
+        Count finished files.
+
+        Args:
+            count (int, optional): Number of files finished. Defaults to 1.
+
+        Returns:
+            str: The updated progress text.
+        """
+        self.done += count
+        return self.text
+
+    @property
+    def text(self) -> str:
+        elapsed = time.perf_counter() - self._start
+        rate = self.done / elapsed if elapsed else 0.0
+        text = f"{self.done}/{self.total} archivos, {rate:.2f} archivos/s"
+        if rate and self.done < self.total:
+            eta = datetime.timedelta(seconds=round((self.total - self.done) / rate))
+            text += f", faltan {eta}"
+        return text
+
+
+def report_timings(recorder: TimingRecorder, timings_file: Optional[str] = None) -> None:
+    """
+    Print the per-stage summary of the recorded timings and, if given, write them to a JSON file.
+
+    Args:
+        recorder (TimingRecorder): The timings of the run.
+        timings_file (Optional[str], optional): JSON file for the timings. Defaults to None.
+    """
+    summary = recorder.summary()
+    if summary:
+        print(f"{'stage':<8} {'files':>6} {'total s':>10} {'mean s':>10} {'max s':>10}")
+        for stage, stats in summary.items():
+            print(
+                f"{stage:<8} {stats['files']:>6} {stats['total_s']:>10.3f} {stats['mean_s']:>10.3f} "
+                f"{stats['max_s']:>10.3f}"
+            )
+
+    if timings_file is not None:
+        recorder.to_json(timings_file)
+        print(f"Timings written to {timings_file}")
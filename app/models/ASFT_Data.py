@@ -1,10 +1,16 @@
 import pandas as pd
+import numpy as np
 import datetime
+import functools
 from pathlib import Path
-import camelot
 import re
 
-from typing import Optional, NamedTuple
+from app.models.color_policy import DEFAULT_POLICY, ColorPolicy, classify_friction, color_names
+from app.models.measurements import CompactMeasurements
+from app.models.parsers import CamelotParser, ParserBackend
+from app.utils.instrumentation import timed
+from app.utils.parse_cache import ParseCache
+from typing import Dict, Optional, NamedTuple, Tuple
 
 
 class RunwayConfig(NamedTuple):
@@ -14,17 +20,79 @@ class RunwayConfig(NamedTuple):
     separation: int
 
 
+class HeaderData(NamedTuple):
+    key_1: str
+    key_2: str
+    configuration: str
+    date: datetime.datetime
+    org_type: str
+    equipment: str
+    pilot: str
+    ice_level: int
+    location: str
+    tyre_type: str
+    tyre_pressure: float
+    water_film: str
+    average_speed: int
+    system_distance: float
+    iata: str
+    numbering: str
+    relative_side: str
+    side: str
+    separation: int
+    runway: str
+    fric_A: float
+    fric_B: float
+    fric_C: float
+
+
+class Smoothing(NamedTuple):
+    window_size: int = 10
+    center: bool = True
+    digits: int = 2
+
+
 class ASFT_Data:
     DATE_FORMAT = "%y-%m-%d %H:%M:%S"
+    SECTIONS = ("friction_measure_report", "result_summary", "measurements")
+
+    def __init__(
+        self,
+        file_path: Path,
+        cache: Optional[ParseCache] = None,
+        tables: Optional[Dict[str, pd.DataFrame]] = None,
+        parser: Optional[ParserBackend] = None,
+    ) -> None:
+        """
+        The PDF is parsed lazily: page 1 is read the first time a header field is accessed, and the measurement pages
+        the first time the measurements are accessed.
 
-    def __init__(self, file_path: Path) -> None:
-        self.filename: str = file_path.stem
-        self.table = camelot.read_pdf(str(file_path), pages="all")
+        Args:
+            file_path (Path): Path to the ASFT PDF report.
+            cache (Optional[ParseCache], optional): Parse cache used to skip the table extraction. Defaults to None.
+            tables (Optional[Dict[str, pd.DataFrame]], optional): Tables already extracted from the file, by section name
+                (e.g. by a worker process). Missing sections are parsed on demand. Defaults to None.
+            parser (Optional[ParserBackend], optional): Backend used to extract the tables from the PDF. Defaults to
+                CamelotParser.
+        """
+        self.file_path: Path = Path(file_path)
+        self.filename: str = self.file_path.stem
+        self.parser: ParserBackend = parser or CamelotParser()
+        self._cache: Optional[ParseCache] = cache
+        self._cache_key: Optional[str] = None
 
         # CACHE
         self._fmr: Optional[pd.DataFrame] = None
         self._rs: Optional[pd.DataFrame] = None
         self._m: Optional[pd.DataFrame] = None
+        self._header: Optional[HeaderData] = None
+        self._derived: Optional[pd.DataFrame] = None
+        self._derived_settings: Optional[Tuple[Smoothing, ColorPolicy]] = None
+        self._smoothing: Smoothing = Smoothing()
+        self._color_policy: ColorPolicy = DEFAULT_POLICY
+
+        if tables is not None:
+            self._load_tables(tables)
 
         # PROPERTIES MANUALLY SET
         self._operator: str = ""
@@ -47,7 +115,7 @@ class ASFT_Data:
         Returns:
             Number of rows in the measurements table.
         """
-        return len(self.measurements)
+        return len(self._measurements())
 
     @property
     def friction_measure_report(self) -> pd.DataFrame:
@@ -67,23 +135,79 @@ class ASFT_Data:
         """
         return self._result_summary()
 
+    @property
+    def header(self) -> HeaderData:
+        """
+        The header fields, parsed once from the friction measure report and the result summary and reused until
+        those tables change.
+
+        Returns:
+            HeaderData(key_1='2303101119RGL07L3', key_2='RGL07-25', configuration='RGL RWY 07 L3', ...)
+        """
+        if self._header is None:
+            self._header = self._parse_header()
+        return self._header
+
+    @property
+    def header_tables(self) -> Dict[str, pd.DataFrame]:
+        """
+        Returns:
+            The friction measure report and result summary tables, by section name. Only page 1 of the PDF is parsed.
+        """
+        return {
+            "friction_measure_report": self._friction_measure_report(),
+            "result_summary": self._result_summary(),
+        }
+
+    @property
+    def tables(self) -> Dict[str, pd.DataFrame]:
+        """
+        Returns:
+            The extracted friction measure report, result summary and raw measurements (Distance, Friction, Speed)
+            tables, by section name.
+        """
+        return {
+            **self.header_tables,
+            "measurements": self._measurements().copy(),
+        }
+
     @property
     def measurements(self) -> pd.DataFrame:
         """
+        The measurements with the derived "Av. Friction 100m" and "Color Code" columns. The derived columns are computed
+        once and cached until the smoothing parameters or the color policy change. Every access returns a copy of the
+        cached frame, so callers can modify it without affecting other callers.
+
+        Returns:
+            Distance Friction Speed  Av. Friction 100m Color Code
+                10     0.80    61               0.00      white
+                20     0.65    63               0.00      white
+                30     0.53    64               0.00      white
+                40     0.84    67               0.00      white
+                50     0.86    69               0.00      white
+                ...    ...     ...              ...        ...
+                1760   0.88    66               0.81      green
+        """
+        settings = (self._smoothing, self._color_policy)
+        if self._derived is None or self._derived_settings != settings:
+            df = self._measurements().copy()
+            with timed("derive", self.file_path):
+                df["Av. Friction 100m"] = self._rolling_average(df["Friction"], *self._smoothing)
+                df["Color Code"] = self._color_assignment(df["Av. Friction 100m"])
+            self._derived = df
+            self._derived_settings = settings
+        return self._derived.copy()
+
+    @property
+    def compact_measurements(self) -> CompactMeasurements:
+        """
+        The measurements with the derived columns packed in small typed arrays, for keeping many runs in memory.
+        Use `CompactMeasurements.to_frame` to get the DataFrame back.
+
         Returns:
-            Distance Friction Speed  Av. Friction 100m
-                10     0.80    61               0.00
-                20     0.65    63               0.00
-                30     0.53    64               0.00
-                40     0.84    67               0.00
-                50     0.86    69               0.00
-                ...    ...     ...              ...
-                1760   0.88    66               0.81
+            CompactMeasurements: The packed measurements.
         """
-        df = self._measurements()
-        df["Av. Friction 100m"] = self._rolling_average(df["Friction"])
-        df["Color Code"] = self._color_assignment(df["Av. Friction 100m"])
-        return self._measurements()
+        return CompactMeasurements.from_frame(self.measurements)
 
     @property
     def measurements_with_chainage(self) -> pd.DataFrame:
@@ -136,133 +260,134 @@ class ASFT_Data:
         if not self._runway_length or not self._starting_point:
             raise ValueError("Please set the runway length and starting point before calling this function.")
 
-        numbering = int(self.numbering)
-        reverse = True if 19 <= numbering <= 36 else False if 1 <= numbering <= 18 else None
-
-        chainage = self._chainage_table(self._runway_length, reversed=reverse)
-
-        start_index = chainage[chainage["Chainage"] == self._starting_point].index[0]
-
-        if start_index + len(self.measurements) > len(chainage):
-            raise ValueError(
-                "The measurements table overflows the chainage table. Please adjust the starting point or the runway length."
-            )
+        measurements = self.measurements
+        with timed("align", self.file_path):
+            numbering = int(self.numbering)
+            reverse = 19 <= numbering <= 36
 
-        for col in self.measurements.columns:
-            if col not in chainage.columns:
-                chainage[col] = 0
+            grid = _chainage_grid(self._runway_length, 10, reverse)
+            start_indices = np.flatnonzero(grid == self._starting_point)
+            if len(start_indices) == 0:
+                raise ValueError(f"The starting point {self._starting_point} is not on the chainage table.")
+            start_index = int(start_indices[0])
 
-            for i, value in enumerate(self.measurements[col]):
-                chainage.at[start_index + i, col] = value
+            end_index = start_index + len(measurements)
+            if end_index > len(grid):
+                raise ValueError(
+                    "The measurements table overflows the chainage table. Please adjust the starting point or the runway length."
+                )
 
-        chainage["Color Code"] = chainage["Color Code"].replace(0, "white")
+            columns = {"Chainage": grid.copy()}
+            for col in measurements.columns:
+                values = measurements[col].to_numpy()
+                column = np.full(len(grid), "white" if col == "Color Code" else 0, dtype=values.dtype)
+                column[start_index:end_index] = values
+                columns[col] = column
 
-        return chainage
+            return pd.DataFrame(columns)
 
     @property
     def key_1(self) -> str:
-        return f'{self.date.strftime("%y%m%d%H%M")}{self.iata}{self.numbering}{self.relative_side}{self.separation}'
+        return self.header.key_1
 
     @property
     def key_2(self) -> str:
-        return f"{self.iata}{self.runway}"
+        return self.header.key_2
 
     @property
     def configuration(self) -> str:
-        return self.friction_measure_report["Configuration"].values[0]
+        return self.header.configuration
 
     @property
     def date(self) -> datetime.datetime:
-        return self._parse_date(self.friction_measure_report["Date and Time"][0])
+        return self.header.date
 
     @property
     def org_type(self) -> str:
-        return self.friction_measure_report["Type"][0]
+        return self.header.org_type
 
     @property
     def equipment(self) -> str:
-        return self.friction_measure_report["Equipment"][0]
+        return self.header.equipment
 
     @property
     def pilot(self) -> str:
-        return self.friction_measure_report["Pilot"][0]
+        return self.header.pilot
 
     @property
     def ice_level(self) -> str:
-        return int(self.friction_measure_report["Ice Level"][0])
+        return self.header.ice_level
 
     @property
     def location(self) -> str:
-        return self.friction_measure_report["Location"][0]
+        return self.header.location
 
     @property
     def tyre_type(self) -> str:
-        return self.friction_measure_report["Tyre Type"][0]
+        return self.header.tyre_type
 
     @property
     def tyre_pressure(self) -> str:
-        return float(self.friction_measure_report["Tyre Pressure"][0])
+        return self.header.tyre_pressure
 
     @property
     def water_film(self) -> str:
-        return self.friction_measure_report["Water Film"][0]
+        return self.header.water_film
 
     @property
     def average_speed(self) -> str:
-        return int(self.friction_measure_report["Average Speed"][0])
+        return self.header.average_speed
 
     @property
     def system_distance(self) -> str:
-        return float(self.friction_measure_report["System Distance"][0])
+        return self.header.system_distance
 
     @property
     def iata(self) -> str:
-        config = self._get_configuration(self.friction_measure_report["Configuration"][0])
-        return config.iata
+        return self.header.iata
 
     @property
     def numbering(self) -> str:
-        config = self._get_configuration(self.friction_measure_report["Configuration"][0])
-        return f"{config.numbering:02d}"
+        return self.header.numbering
 
     @property
     def relative_side(self) -> str:
-        config = self._get_configuration(self.friction_measure_report["Configuration"][0])
-        return config.relative_side
+        return self.header.relative_side
 
     @property
     def side(self) -> str:
-        if int(self.numbering) <= 18:
-            return self.relative_side
-        else:
-            if self.relative_side == "L":
-                return "R"
-            elif self.relative_side == "R":
-                return "L"
+        return self.header.side
 
     @property
     def separation(self) -> str:
-        config = self._get_configuration(self.friction_measure_report["Configuration"][0])
-        return config.separation
+        return self.header.separation
 
     @property
     def runway(self) -> str:
-        return self._get_runway()
+        return self.header.runway
 
     @property
     def fric_A(self) -> float:
-        return float(self.result_summary["Fric. A"][0])
+        return self.header.fric_A
 
     @property
     def fric_B(self) -> float:
-        return float(self.result_summary["Fric. B"][0])
+        return self.header.fric_B
 
     @property
     def fric_C(self) -> float:
-        return float(self.result_summary["Fric. C"][0])
+        return self.header.fric_C
 
     # PROPERTIES MANUALLY SET
 
+    @property
+    def smoothing(self) -> Smoothing:
+        return self._smoothing
+
+    @property
+    def color_policy(self) -> ColorPolicy:
+        return self._color_policy
+
     @property
     def runway_length(self) -> int:
         return self._runway_length
@@ -291,6 +416,14 @@ class ASFT_Data:
     def runway_material(self) -> str:
         return self._runway_material
 
+    @smoothing.setter
+    def smoothing(self, value: Smoothing):
+        self._smoothing = Smoothing(*value)
+
+    @color_policy.setter
+    def color_policy(self, value: ColorPolicy):
+        self._color_policy = value
+
     @runway_length.setter
     def runway_length(self, value: int):
         self._runway_length = value
@@ -319,6 +452,76 @@ class ASFT_Data:
     def runway_material(self, value: str):
         self._runway_material = value
 
+    def _load_tables(self, tables: Dict[str, pd.DataFrame]) -> None:
+        """
+        Fill the table caches with already extracted tables.
+
+        Args:
+            tables (Dict[str, pd.DataFrame]): Tables by section name. Missing sections are left to be parsed on demand.
+        """
+        if "friction_measure_report" in tables or "result_summary" in tables:
+            self._header = None
+        if "measurements" in tables:
+            self._derived = None
+        self._fmr = tables.get("friction_measure_report", self._fmr)
+        self._rs = tables.get("result_summary", self._rs)
+        self._m = tables.get("measurements", self._m)
+
+    def _load_from_cache(self, *sections: str) -> bool:
+        """
+        Load the given sections from the parse cache.
+
+        Args:
+            *sections (str): Names of the sections to load.
+
+        Returns:
+            bool: True if every section was found in the cache, False otherwise.
+        """
+        if self._cache is None:
+            return False
+        if self._cache_key is None:
+            self._cache_key = self._cache.key(self.file_path, namespace=f"{self.parser.name}-{self.parser.version}")
+
+        tables = {section: self._cache.get(self._cache_key, section) for section in sections}
+        if any(table is None for table in tables.values()):
+            return False
+        self._load_tables(tables)
+        return True
+
+    def _store_in_cache(self, tables: Dict[str, pd.DataFrame]) -> None:
+        """
+        Store freshly parsed sections in the parse cache, if any.
+
+        Args:
+            tables (Dict[str, pd.DataFrame]): Tables by section name.
+        """
+        if self._cache is not None:
+            self._cache.put(self._cache_key, tables)
+
+    def _load_header(self) -> None:
+        """
+        Parse page 1 of the PDF, which holds the friction measure report and the result summary.
+        """
+        if self._load_from_cache("friction_measure_report", "result_summary"):
+            return
+
+        with timed("parse", self.file_path):
+            self._fmr, self._rs = self.parser.read_header(self.file_path)
+        self._header = None
+        self._store_in_cache({"friction_measure_report": self._fmr, "result_summary": self._rs})
+
+    def _load_measurements(self) -> None:
+        """
+        Parse the measurement pages of the PDF (page 2 onwards).
+        """
+        if self._load_from_cache("measurements"):
+            return
+
+        with timed("parse", self.file_path):
+            self._m = self.parser.read_measurements(self.file_path)
+        self._derived = None
+        self._store_in_cache({"measurements": self._m})
+
     def _friction_measure_report(self) -> pd.DataFrame:
         """
         Retrieve and cache the measure report data as a pandas DataFrame.
@@ -327,13 +530,7 @@ class ASFT_Data:
             pd.DataFrame: A DataFrame containing the measure report data.
         """
         if self._fmr is None:
-            fmr: pd.DataFrame = self.table[0].df
-            columns: pd.Series = pd.concat([fmr[0], fmr[2]], ignore_index=True)
-            values: pd.Series = pd.concat([fmr[1], fmr[3]], ignore_index=True)
-            columns = columns[columns != ""]
-            values = values[values != ""]
-            df: pd.DataFrame = pd.DataFrame([values.values], columns=columns)
-            self._fmr = df
+            self._load_header()
         return self._fmr
 
     def _result_summary(self) -> pd.DataFrame:
@@ -344,14 +541,7 @@ class ASFT_Data:
             pd.DataFrame: A DataFrame containing the result summary data.
         """
         if self._rs is None:
-            rs: pd.DataFrame = self.table[1].df
-            columns: pd.Series = rs.iloc[0]
-            columns.loc[3] = "Fric. C"
-            columns.loc[4] = columns.loc[4].replace("Fric. C ", "")
-            values: pd.Series = rs.iloc[1].values
-            df: pd.DataFrame = pd.DataFrame([values], columns=columns.values)
-            df = df.replace({"µ": ""}, regex=True)
-            self._rs = df
+            self._load_header()
         return self._rs
 
     def _measurements(self) -> pd.DataFrame:
@@ -362,17 +552,7 @@ class ASFT_Data:
             pd.DataFrame: A DataFrame containing the measurements data with columns: Distance, Friction, and Speed.
         """
         if self._m is None:
-            m: pd.DataFrame = pd.concat([table.df for table in self.table[2:]], axis=0, ignore_index=True)
-            row_index: int = m[(m[0] == "Distance") & (m[1] == "Friction")].index[0]
-            columns: pd.Series = m.iloc[row_index, :3]
-            values: pd.DataFrame = m.iloc[row_index + 1 : -3, :3]
-            df = pd.DataFrame(values.values, columns=columns.values)
-
-            df["Distance"] = df["Distance"].astype(int)
-            df["Speed"] = df["Speed"].astype(int)
-            df["Friction"] = df["Friction"].astype(float)
-
-            self._m = df
+            self._load_measurements()
         return self._m
 
     def _get_configuration(self, configuration: str) -> RunwayConfig:
@@ -406,15 +586,16 @@ class ASFT_Data:
         """
         return datetime.datetime.strptime(date, format)
 
-    def _get_runway(self) -> str:
+    def _get_runway(self, numbering: int) -> str:
         """
-        Get the runway numbering based on the configuration data.
+        Get the runway designation from the numbering of one of its headers.
+
+        Args:
+            numbering (int): The runway numbering from the configuration data.
 
         Returns:
             str: The runway numbering in the format "XX-YY".
         """
-        config = self._get_configuration(self.friction_measure_report["Configuration"][0])
-        numbering = int(config.numbering)
         if numbering == 18:
             return "00-18"
         exit_num = (numbering + 18) % 36
@@ -424,6 +605,53 @@ class ASFT_Data:
             return f"{exit_num:02d}-{numbering:02d}"
         return f"{numbering:02d}-{exit_num:02d}"
 
+    def _parse_header(self) -> HeaderData:
+        """
+        Parse every header field from the friction measure report and the result summary.
+
+        Returns:
+            HeaderData: The parsed header fields.
+        """
+        fmr = self.friction_measure_report
+        rs = self.result_summary
+
+        configuration: str = fmr["Configuration"].values[0]
+        config = self._get_configuration(configuration)
+        date = self._parse_date(fmr["Date and Time"][0])
+        numbering = f"{config.numbering:02d}"
+
+        side = config.relative_side
+        if config.numbering > 18:
+            side = {"L": "R", "R": "L"}.get(config.relative_side)
+
+        runway = self._get_runway(config.numbering)
+
+        return HeaderData(
+            key_1=f'{date.strftime("%y%m%d%H%M")}{config.iata}{numbering}{config.relative_side}{config.separation}',
+            key_2=f"{config.iata}{runway}",
+            configuration=configuration,
+            date=date,
+            org_type=fmr["Type"][0],
+            equipment=fmr["Equipment"][0],
+            pilot=fmr["Pilot"][0],
+            ice_level=int(fmr["Ice Level"][0]),
+            location=fmr["Location"][0],
+            tyre_type=fmr["Tyre Type"][0],
+            tyre_pressure=float(fmr["Tyre Pressure"][0]),
+            water_film=fmr["Water Film"][0],
+            average_speed=int(fmr["Average Speed"][0]),
+            system_distance=float(fmr["System Distance"][0]),
+            iata=config.iata,
+            numbering=numbering,
+            relative_side=config.relative_side,
+            side=side,
+            separation=config.separation,
+            runway=runway,
+            fric_A=float(rs["Fric. A"][0]),
+            fric_B=float(rs["Fric. B"][0]),
+            fric_C=float(rs["Fric. C"][0]),
+        )
+
     def _rolling_average(
         self, series: pd.Series, window_size: int = 10, center: bool = True, digits: int = 2
     ) -> pd.Series:
@@ -444,40 +672,24 @@ class ASFT_Data:
     def _color_assignment(self, series: pd.Series) -> pd.Series:
         """
         Assign a color to each friction average in a given pandas series based on the friction average,
-        and propagate 'red' color to a window of 5 positions before and after each 'red' friction average.
+        and propagate 'red' color to a window of positions before and after each 'red' friction average.
 
-        The color assignment rules are as follows:
-        - None for friction average equal to 0.0
-        - 'red' for friction average less than 0.5
-        - 'yellow' for friction average less than 0.6 but not less than 0.5
+        The thresholds and propagation window are taken from `color_policy` (see ColorPolicy):
+        - 'white' for friction average equal to 0.0
+        - 'red' for friction average less than `color_policy.red_below` (0.5 by default)
+        - 'yellow' for friction average less than `color_policy.yellow_below` (0.6 by default) but not red
         - 'green' otherwise
 
         Args:
             series (pd.Series): The input pandas series of friction averages for which the color is to be assigned.
 
         Returns:
-            pd.Series: A pandas series with assigned colors, where 'red' color is propagated
-            to 5 positions before and after each 'red' friction average.
+            pd.Series: A pandas series with assigned colors, where 'red' color is propagated to the
+            `color_policy.spread_before` positions before and the `color_policy.spread_after` positions after each
+            'red' friction average (5 and 4 by default).
         """
-
-        def color_assign(friction_average):
-            if friction_average == 0.0:
-                return "white"
-            elif friction_average < 0.5:
-                return "red"
-            elif friction_average < 0.6:
-                return "yellow"
-            else:
-                return "green"
-
-        new_column = series.apply(color_assign)
-
-        mask = new_column == "red"
-        for i in range(-5, 5):
-            mask |= new_column.shift(i) == "red"
-        new_column.loc[mask] = "red"
-
-        return new_column
+        codes = classify_friction(series.to_numpy(), self._color_policy)
+        return pd.Series(color_names(codes), index=series.index)
 
     def _chainage_table(self, runway_length: int, step: int = 10, reversed: bool = False) -> pd.DataFrame:
         """
@@ -492,13 +704,28 @@ class ASFT_Data:
             pd.DataFrame: A pandas DataFrame containing a single column named "chainage" with chainage values at the
             specified step intervals, starting from 0 and ending with the runway_length value.
         """
-        chainage = list(range(0, runway_length + 1, step))
-        if chainage[-1] != runway_length:
-            chainage.append(runway_length)
+        return pd.DataFrame({"Chainage": _chainage_grid(runway_length, step, bool(reversed)).copy()})
+
+
+@functools.lru_cache(maxsize=32)
+def _chainage_grid(runway_length: int, step: int, reversed: bool) -> np.ndarray:
+    """
+    Chainage values at a specified step interval up to a given runway_length, shared by every run on the same runway.
+
+    Args:
+        runway_length (int): The total length of the runway, which should be a positive integer value.
+        step (int): The step interval for generating chainage values.
+        reversed (bool): Whether to reverse the order of the values.
 
-        df = pd.DataFrame(chainage, columns=["Chainage"])
+    Returns:
+        np.ndarray: A read-only array of chainage values, starting from 0 and ending with the runway_length value.
+    """
+    grid = np.arange(0, runway_length + 1, step, dtype=np.int64)
+    if grid[-1] != runway_length:
+        grid = np.append(grid, runway_length)
 
-        if reversed:
-            df = df[::-1].reset_index(drop=True)
+    if reversed:
+        grid = grid[::-1].copy()
 
-        return df
+    grid.flags.writeable = False
+    return grid
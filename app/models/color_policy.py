@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+from typing import NamedTuple, Optional, Union
+
+COLORS = ("white", "red", "yellow", "green")
+WHITE, RED, YELLOW, GREEN = range(len(COLORS))
+
+
+class ColorPolicy(NamedTuple):
+    """
+    Thresholds used to color code friction averages.
+
+    - 'white' for friction average equal to 0.0 (no measurement)
+    - 'red' for friction average less than `red_below`
+    - 'yellow' for friction average less than `yellow_below` but not less than `red_below`
+    - 'green' otherwise
+
+    Every 'red' value is then propagated to the `spread_before` rows before it and the `spread_after` rows after it.
+    """
+
+    red_below: float = 0.5
+    yellow_below: float = 0.6
+    spread_before: int = 5
+    spread_after: int = 4
+
+
+DEFAULT_POLICY = ColorPolicy()
+
+
+def classify_friction(
+    values: Union[np.ndarray, pd.Series], policy: ColorPolicy = DEFAULT_POLICY, groups: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Color code an array of friction averages.
+
+    Args:
+        values (Union[np.ndarray, pd.Series]): Friction averages, in measurement order.
+        policy (ColorPolicy, optional): Thresholds and red propagation window. Defaults to DEFAULT_POLICY.
+        groups (Optional[np.ndarray], optional): Run identifier of each value, for classifying many runs stacked in a
+            single array. Rows of a run must be contiguous, and 'red' is not propagated across runs. Defaults to None.
+
+    Returns:
+        np.ndarray: A uint8 array of indices into COLORS.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+
+    codes = np.select(
+        [values == 0.0, values < policy.red_below, values < policy.yellow_below],
+        [WHITE, RED, YELLOW],
+        default=GREEN,
+    ).astype(np.uint8)
+    if n == 0:
+        return codes
+
+    # Window dilation of the red mask: row p turns red if any row in [p - spread_after, p + spread_before] is red.
+    positions = np.arange(n)
+    low = positions - policy.spread_after
+    high = positions + policy.spread_before
+    if groups is None:
+        low = np.maximum(low, 0)
+        high = np.minimum(high, n - 1)
+    else:
+        groups = np.asarray(groups)
+        boundaries = np.flatnonzero(groups[1:] != groups[:-1]) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [n])) - 1
+        lengths = ends - starts + 1
+        low = np.maximum(low, np.repeat(starts, lengths))
+        high = np.minimum(high, np.repeat(ends, lengths))
+
+    red_count = np.concatenate(([0], np.cumsum(codes == RED)))
+    codes[red_count[high + 1] - red_count[low] > 0] = RED
+    return codes
+
+
+def color_names(codes: np.ndarray) -> np.ndarray:
+    """
+    Convert color codes to their names.
+
+    Args:
+        codes (np.ndarray): Indices into COLORS, as returned by `classify_friction`.
+
+    Returns:
+        np.ndarray: An object array of color names.
+    """
+    return np.asarray(COLORS, dtype=object)[codes]
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+
+from app.models.color_policy import COLORS
+from typing import List, Optional
+
+FRICTION_SCALE = 100
+
+
+def _smallest_int(values: np.ndarray, *dtypes: type) -> np.ndarray:
+    """
+    Cast integer values to the first of the given dtypes that holds all of them, or int64 if none does.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    for dtype in dtypes:
+        info = np.iinfo(dtype)
+        if len(values) == 0 or (values.min() >= info.min and values.max() <= info.max):
+            return values.astype(dtype)
+    return values
+
+
+def _pack_friction(values: np.ndarray) -> np.ndarray:
+    """
+    Store friction values as int16 hundredths when that is exact, which is the case for the two decimals of the ASFT
+    reports and of the rounded rolling average. Other values are kept as float64.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scaled = np.round(values * FRICTION_SCALE)
+    info = np.iinfo(np.int16)
+    if (
+        np.isfinite(values).all()
+        and np.array_equal(scaled / FRICTION_SCALE, values)
+        and (len(values) == 0 or (scaled.min() >= info.min and scaled.max() <= info.max))
+    ):
+        return scaled.astype(np.int16)
+    return values
+
+
+def _unpack_friction(values: np.ndarray) -> np.ndarray:
+    if values.dtype == np.int16:
+        return values / FRICTION_SCALE
+    return values.copy()
+
+
+class CompactMeasurements:
+    """
+    Measurements of a run held in the smallest numpy arrays that represent them exactly:
+
+    - Distance: int32
+    - Speed: uint8 (km/h), or a wider integer type if a value does not fit
+    - Friction and Av. Friction 100m: int16 hundredths, or float64 if a value has more than two decimals
+    - Color Code: uint8 indices into COLORS
+
+    A run takes about 6 bytes per row instead of the ~90 bytes of the measurements DataFrame, whose color codes are
+    Python strings. The DataFrame is only built on demand by `to_frame`.
+
+    Example:
+        compact = CompactMeasurements.from_frame(data.measurements)
+        compact.to_frame()
+    """
+
+    __slots__ = ("distance", "friction", "speed", "average", "color_codes")
+
+    def __init__(
+        self,
+        distance: np.ndarray,
+        friction: np.ndarray,
+        speed: np.ndarray,
+        average: Optional[np.ndarray] = None,
+        color_codes: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Args:
+            distance (np.ndarray): Distance of every row, in meters.
+            friction (np.ndarray): Friction of every row.
+            speed (np.ndarray): Speed of every row.
+            average (Optional[np.ndarray], optional): "Av. Friction 100m" of every row. Defaults to None.
+            color_codes (Optional[np.ndarray], optional): Color code of every row, as indices into COLORS (see
+                app.models.color_policy.classify_friction). Defaults to None.
+
+        Raises:
+            ValueError: If the arrays do not have the same length.
+        """
+        self.distance: np.ndarray = _smallest_int(distance, np.int32)
+        self.friction: np.ndarray = _pack_friction(friction)
+        self.speed: np.ndarray = _smallest_int(speed, np.uint8, np.int16, np.int32)
+        self.average: Optional[np.ndarray] = None if average is None else _pack_friction(average)
+        self.color_codes: Optional[np.ndarray] = None if color_codes is None else np.asarray(color_codes, np.uint8)
+
+        lengths = {len(array) for array in self._arrays()}
+        if len(lengths) > 1:
+            raise ValueError("Every measurement array must have the same length.")
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            Number of rows of the measurements.
+        """
+        return len(self.distance)
+
+    @classmethod
+    def from_frame(cls, measurements: pd.DataFrame) -> "CompactMeasurements":
+        """
+        Pack a measurements table, as returned by ASFT_Data.measurements or ASFT_Data.tables["measurements"].
+
+        Args:
+            measurements (pd.DataFrame): Columns: Distance, Friction and Speed, and optionally "Av. Friction 100m"
+                and "Color Code".
+
+        Returns:
+            CompactMeasurements: The packed measurements.
+        """
+        average = color_codes = None
+        if "Av. Friction 100m" in measurements:
+            average = measurements["Av. Friction 100m"].to_numpy()
+        if "Color Code" in measurements:
+            if not measurements["Color Code"].isin(COLORS).all():
+                raise ValueError(f"Unknown color code, expected one of {COLORS}.")
+            color_codes = pd.Categorical(measurements["Color Code"], categories=COLORS).codes
+        return cls(
+            measurements["Distance"].to_numpy(),
+            measurements["Friction"].to_numpy(),
+            measurements["Speed"].to_numpy(),
+            average,
+            color_codes,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: Size of the arrays, in bytes.
+        """
+        return sum(array.nbytes for array in self._arrays())
+
+    def to_frame(self, categorical: bool = False) -> pd.DataFrame:
+        """
+        Build the measurements table, with the same columns and values as ASFT_Data.measurements.
+
+        Args:
+            categorical (bool, optional): Whether to return the color codes as a pandas Categorical instead of
+                strings. Defaults to False.
+
+        Returns:
+            pd.DataFrame: Columns: Distance, Friction, Speed, and "Av. Friction 100m" and "Color Code" if present.
+        """
+        columns = {
+            "Distance": self.distance.astype(np.int64),
+            "Friction": _unpack_friction(self.friction),
+            "Speed": self.speed.astype(np.int64),
+        }
+        if self.average is not None:
+            columns["Av. Friction 100m"] = _unpack_friction(self.average)
+        if self.color_codes is not None:
+            colors = pd.Categorical.from_codes(self.color_codes, categories=COLORS)
+            columns["Color Code"] = colors if categorical else np.asarray(colors, dtype=object)
+        return pd.DataFrame(columns)
+
+    def _arrays(self) -> List[np.ndarray]:
+        arrays = (self.distance, self.friction, self.speed, self.average, self.color_codes)
+        return [array for array in arrays if array is not None]
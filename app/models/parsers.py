@@ -0,0 +1,380 @@
+import pandas as pd
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
+
+# camelot (with OpenCV and Ghostscript) and pdfminer take seconds to import, so they are only imported when a PDF is
+# actually read. Runs loaded from the parse cache never import them.
+if TYPE_CHECKING:
+    from pdfminer.layout import LAParams
+
+
+class ParserBackend(ABC):
+    """
+    Extracts the friction measure report, result summary and measurements tables from an ASFT PDF report.
+
+    Page 1 of the report holds the friction measure report and the result summary, and the measurements start on
+    page 2. Implementations must return the same DataFrames regardless of how they read the PDF.
+    """
+
+    name: str = ""
+    version: str = "1"
+
+    @abstractmethod
+    def read_header(self, file_path: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Read page 1 of the report.
+
+        Args:
+            file_path (Path): Path to the ASFT PDF report.
+
+        Returns:
+            Tuple[pd.DataFrame, pd.DataFrame]: The friction measure report and the result summary, as single row
+            DataFrames of strings.
+        """
+
+    @abstractmethod
+    def read_measurements(self, file_path: Path) -> pd.DataFrame:
+        """
+        Read the measurement pages of the report.
+
+        Args:
+            file_path (Path): Path to the ASFT PDF report.
+
+        Returns:
+            pd.DataFrame: A DataFrame with columns: Distance (int), Friction (float) and Speed (int).
+        """
+
+    @staticmethod
+    def _typed_measurements(df: pd.DataFrame) -> pd.DataFrame:
+        df["Distance"] = df["Distance"].astype(int)
+        df["Speed"] = df["Speed"].astype(int)
+        df["Friction"] = df["Friction"].astype(float)
+        return df
+
+
+class CamelotParser(ParserBackend):
+    """
+    Parser backend based on camelot's lattice table detection.
+    """
+
+    name = "camelot"
+
+    def read_header(self, file_path: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        import camelot
+
+        tables = camelot.read_pdf(str(file_path), pages="1")
+        return self._parse_friction_measure_report(tables[0].df), self._parse_result_summary(tables[1].df)
+
+    def read_measurements(self, file_path: Path) -> pd.DataFrame:
+        import camelot
+
+        tables = camelot.read_pdf(str(file_path), pages="2-end")
+        return self._parse_measurements([table.df for table in tables])
+
+    @staticmethod
+    def _parse_friction_measure_report(fmr: pd.DataFrame) -> pd.DataFrame:
+        """
+        Build the measure report from the first table of page 1.
+
+        Args:
+            fmr (pd.DataFrame): The raw camelot table, with two label/value column pairs.
+
+        Returns:
+            pd.DataFrame: A single row DataFrame with a column per label.
+        """
+        columns: pd.Series = pd.concat([fmr[0], fmr[2]], ignore_index=True)
+        values: pd.Series = pd.concat([fmr[1], fmr[3]], ignore_index=True)
+        columns = columns[columns != ""]
+        values = values[values != ""]
+        return pd.DataFrame([values.values], columns=columns)
+
+    @staticmethod
+    def _parse_result_summary(rs: pd.DataFrame) -> pd.DataFrame:
+        """
+        Build the result summary from the second table of page 1.
+
+        Args:
+            rs (pd.DataFrame): The raw camelot table, with a header row and a values row.
+
+        Returns:
+            pd.DataFrame: A single row DataFrame with a column per header.
+        """
+        columns: pd.Series = rs.iloc[0]
+        columns.loc[3] = "Fric. C"
+        columns.loc[4] = columns.loc[4].replace("Fric. C ", "")
+        values: pd.Series = rs.iloc[1].values
+        df: pd.DataFrame = pd.DataFrame([values], columns=columns.values)
+        return df.replace({"µ": ""}, regex=True)
+
+    @classmethod
+    def _parse_measurements(cls, tables: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Build the measurements table from the raw tables of the measurement pages.
+
+        Args:
+            tables (List[pd.DataFrame]): The raw camelot tables, in page order.
+
+        Returns:
+            pd.DataFrame: A DataFrame with columns: Distance, Friction, and Speed.
+        """
+        m: pd.DataFrame = pd.concat(tables, axis=0, ignore_index=True)
+        row_index: int = m[(m[0] == "Distance") & (m[1] == "Friction")].index[0]
+        columns: pd.Series = m.iloc[row_index, :3]
+        values: pd.DataFrame = m.iloc[row_index + 1 : -3, :3]
+        df = pd.DataFrame(values.values, columns=columns.values)
+        return cls._typed_measurements(df)
+
+
+class TextLine(NamedTuple):
+    x0: float
+    x1: float
+    top: float
+    text: str
+
+    @property
+    def center(self) -> float:
+        return (self.x0 + self.x1) / 2
+
+
+class TextLayerParser(ParserBackend):
+    """
+    Parser backend that reads the PDF text layer directly.
+
+    ASFT reports are machine generated with a fixed layout, so the tables can be rebuilt from the position of each
+    text line without running a general purpose table detection:
+
+    - Friction measure report: two label/value column pairs between the "Friction Measure Report" and "Results" titles.
+      A value spanning several lines is joined with newlines, as camelot does.
+    - Result summary: a header row and a values row below the "Results" title.
+    - Measurements: the "Distance / Friction / Speed ..." header row on page 2, followed by one row per measurement on
+      every following page. Cells are assigned to the header with the nearest center.
+    """
+
+    name = "text"
+
+    FMR_TITLE = "Friction Measure Report"
+    RS_TITLE = "Results"
+    RS_END_TITLE = "Results Summary"
+    ROW_TOLERANCE = 3.0
+    COLUMN_GAP = 10.0
+
+    def __init__(self, laparams: Optional["LAParams"] = None) -> None:
+        # A small char_margin keeps neighbouring table cells on separate lines. None until the first PDF is read, so
+        # pdfminer is not imported before it is needed.
+        self.laparams: Optional["LAParams"] = laparams
+
+    def read_header(self, file_path: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        lines = self._text_lines(file_path, [0])[0]
+        return self._parse_friction_measure_report(lines), self._parse_result_summary(lines)
+
+    def read_measurements(self, file_path: Path) -> pd.DataFrame:
+        pages = self._text_lines(file_path, None)[1:]
+
+        header: Optional[List[TextLine]] = None
+        rows: List[List[str]] = []
+        for lines in pages:
+            if header is None:
+                distance = next((line for line in lines if line.text == "Distance"), None)
+                if distance is None:
+                    continue
+                header = sorted(self._same_row(lines, distance.top), key=lambda line: line.x0)
+                lines = [line for line in lines if line.top < distance.top - self.ROW_TOLERANCE]
+
+            for row in self._rows(lines):
+                cells = self._assign_to_columns(row, header)
+                if cells[0].isdigit() and all(cells[:3]):
+                    rows.append(cells[:3])
+
+        if header is None:
+            raise ValueError("The measurements header (Distance / Friction / Speed) was not found.")
+
+        df = pd.DataFrame(rows, columns=[line.text for line in header[:3]])
+        return self._typed_measurements(df)
+
+    def _text_lines(self, file_path: Path, page_numbers: Optional[List[int]]) -> List[List[TextLine]]:
+        """
+        Extract the text lines of the given pages, from top to bottom.
+
+        Args:
+            file_path (Path): Path to the ASFT PDF report.
+            page_numbers (Optional[List[int]]): 0-based page numbers to read, or None to read all the pages.
+
+        Returns:
+            List[List[TextLine]]: The text lines of each page.
+        """
+        from pdfminer.high_level import extract_pages
+        from pdfminer.layout import LAParams, LTTextContainer, LTTextLine
+
+        if self.laparams is None:
+            self.laparams = LAParams(char_margin=0.5, line_margin=0.1)
+
+        pages = []
+        for page in extract_pages(str(file_path), page_numbers=page_numbers, laparams=self.laparams):
+            lines = []
+            for element in page:
+                if not isinstance(element, LTTextContainer):
+                    continue
+                for line in element:
+                    text = line.get_text().strip() if isinstance(line, LTTextLine) else ""
+                    if text:
+                        lines.append(TextLine(line.x0, line.x1, line.y1, text))
+            pages.append(sorted(lines, key=lambda line: (-line.top, line.x0)))
+        return pages
+
+    def _parse_friction_measure_report(self, lines: List[TextLine]) -> pd.DataFrame:
+        top = self._find(lines, self.FMR_TITLE).top
+        bottom = self._find(lines, self.RS_TITLE).top
+        cells = [line for line in lines if bottom + self.ROW_TOLERANCE < line.top < top - self.ROW_TOLERANCE]
+
+        clusters = self._column_clusters(cells)
+        if len(clusters) != 4:
+            raise ValueError(f"Expected 4 columns in the friction measure report. Found {len(clusters)}")
+
+        report: Dict[str, List[str]] = {}
+        for label_column, value_column in [(0, 1), (2, 3)]:
+            labels = [line for line in cells if clusters[label_column][0] <= line.x0 <= clusters[label_column][1]]
+            values = [line for line in cells if clusters[value_column][0] <= line.x0 <= clusters[value_column][1]]
+            for label in labels:
+                report[label.text] = []
+            for value in values:
+                above = [label for label in labels if label.top >= value.top - self.ROW_TOLERANCE]
+                if above:
+                    report[min(above, key=lambda label: label.top).text].append(value.text)
+
+        return pd.DataFrame([["\n".join(values) for values in report.values()]], columns=list(report.keys()))
+
+    def _parse_result_summary(self, lines: List[TextLine]) -> pd.DataFrame:
+        top = self._find(lines, self.RS_TITLE).top
+        end = next((line for line in lines if line.text == self.RS_END_TITLE), None)
+        bottom = end.top if end is not None else float("-inf")
+        rows = self._rows([line for line in lines if bottom + self.ROW_TOLERANCE < line.top < top - self.ROW_TOLERANCE])
+        if len(rows) < 2:
+            raise ValueError("The result summary header and values rows were not found.")
+
+        header = sorted(rows[0], key=lambda line: line.x0)
+        values = [value.replace("µ", "") for value in self._assign_to_columns(rows[1], header)]
+        return pd.DataFrame([values], columns=[line.text for line in header])
+
+    def _find(self, lines: List[TextLine], text: str) -> TextLine:
+        for line in lines:
+            if line.text == text:
+                return line
+        raise ValueError(f"'{text}' was not found in the PDF text layer.")
+
+    def _same_row(self, lines: List[TextLine], top: float) -> List[TextLine]:
+        return [line for line in lines if abs(line.top - top) <= self.ROW_TOLERANCE]
+
+    def _rows(self, lines: List[TextLine]) -> List[List[TextLine]]:
+        """
+        Group text lines into table rows by their vertical position, from top to bottom.
+        """
+        rows: List[List[TextLine]] = []
+        for line in sorted(lines, key=lambda line: -line.top):
+            if rows and abs(rows[-1][0].top - line.top) <= self.ROW_TOLERANCE:
+                rows[-1].append(line)
+            else:
+                rows.append([line])
+        return rows
+
+    def _column_clusters(self, lines: List[TextLine]) -> List[Tuple[float, float]]:
+        """
+        Group the left edges of text lines into columns.
+
+        Returns:
+            List[Tuple[float, float]]: (min x0, max x0) of each column, from left to right.
+        """
+        clusters: List[Tuple[float, float]] = []
+        for x0 in sorted(line.x0 for line in lines):
+            if clusters and x0 - clusters[-1][1] <= self.COLUMN_GAP:
+                clusters[-1] = (clusters[-1][0], x0)
+            else:
+                clusters.append((x0, x0))
+        return clusters
+
+    def _assign_to_columns(self, row: List[TextLine], header: List[TextLine]) -> List[str]:
+        """
+        Assign each cell of a row to the header with the nearest center.
+
+        Returns:
+            List[str]: The text of each column, "" for empty cells.
+        """
+        cells = [""] * len(header)
+        for line in row:
+            index = min(range(len(header)), key=lambda i: abs(header[i].center - line.center))
+            cells[index] = f"{cells[index]} {line.text}".strip()
+        return cells
+
+
+PARSERS = {CamelotParser.name: CamelotParser, TextLayerParser.name: TextLayerParser}
+
+
+def get_parser(name: str) -> ParserBackend:
+    """
+    Instantiate a parser backend by name.
+
+    Args:
+        name (str): Name of the backend ("camelot" or "text").
+
+    Raises:
+        ValueError: If there is no backend with that name.
+
+    Returns:
+        ParserBackend: The parser backend.
+    """
+    if name not in PARSERS:
+        raise ValueError(f"Unknown parser backend '{name}'. Available backends: {', '.join(PARSERS)}")
+    return PARSERS[name]()
+
+
+def _diff_tables(section: str, reference: pd.DataFrame, candidate: pd.DataFrame) -> List[str]:
+    """
+    Describe the differences between two tables. String cells are compared without surrounding whitespace.
+
+    Returns:
+        List[str]: A message per difference, empty if the tables are equal.
+    """
+    if list(reference.columns) != list(candidate.columns):
+        return [f"{section}: columns differ: {list(reference.columns)} != {list(candidate.columns)}"]
+    if len(reference) != len(candidate):
+        return [f"{section}: row count differs: {len(reference)} != {len(candidate)}"]
+
+    differences = []
+    for column in reference.columns:
+        ref = reference[column].reset_index(drop=True)
+        cand = candidate[column].reset_index(drop=True)
+        if ref.dtype == object:
+            ref = ref.str.strip()
+        if cand.dtype == object:
+            cand = cand.str.strip()
+        if ref.dtype != cand.dtype:
+            differences.append(f"{section}: '{column}' dtype differs: {ref.dtype} != {cand.dtype}")
+            continue
+        mismatches = ref != cand
+        for row in mismatches[mismatches].index[:5]:
+            differences.append(f"{section}: '{column}' row {row}: {ref[row]!r} != {cand[row]!r}")
+        if mismatches.sum() > 5:
+            differences.append(f"{section}: '{column}' {mismatches.sum() - 5} more mismatching rows")
+    return differences
+
+
+def cross_check(file_path: Path, reference: ParserBackend, candidate: ParserBackend) -> List[str]:
+    """
+    Parse a report with two backends and describe every difference between their tables.
+
+    Args:
+        file_path (Path): Path to the ASFT PDF report.
+        reference (ParserBackend): The trusted backend.
+        candidate (ParserBackend): The backend being checked.
+
+    Returns:
+        List[str]: A message per difference, empty if both backends agree.
+    """
+    ref_fmr, ref_rs = reference.read_header(file_path)
+    cand_fmr, cand_rs = candidate.read_header(file_path)
+    return (
+        _diff_tables("friction_measure_report", ref_fmr, cand_fmr)
+        + _diff_tables("result_summary", ref_rs, cand_rs)
+        + _diff_tables("measurements", reference.read_measurements(file_path), candidate.read_measurements(file_path))
+    )
@@ -0,0 +1,191 @@
+import numpy as np
+import pandas as pd
+
+from app.models.ASFT_Data import ASFT_Data, Smoothing
+from app.models.color_policy import DEFAULT_POLICY, ColorPolicy, classify_friction, color_names
+from typing import Iterable, List
+
+
+class RunCollection:
+    """
+    Measurements of many ASFT runs stacked into a single long table keyed by key_1.
+
+    Every calculation done per ASFT_Data instance (rolling average, color code, thirds and 100 m interval means) is
+    computed here for all the runs at once, with grouped and vectorized operations instead of a Python-level pass per
+    run. The rows of each run are kept contiguous and in measurement order.
+    """
+
+    MEASUREMENT_COLUMNS = ["key_1", "Distance", "Friction", "Speed"]
+    INFORMATION_COLUMNS = [
+        "key_1",
+        "date",
+        "iata",
+        "numbering",
+        "side",
+        "separation",
+        "runway",
+        "fric_A",
+        "fric_B",
+        "fric_C",
+    ]
+
+    def __init__(self, measurements: pd.DataFrame, information: pd.DataFrame) -> None:
+        """
+        Args:
+            measurements (pd.DataFrame): Stacked measurements with columns: key_1, Distance, Friction and Speed.
+            information (pd.DataFrame): One row per run with at least the columns: key_1, fric_A, fric_B and fric_C.
+        """
+        codes, _ = pd.factorize(measurements["key_1"])
+        order = np.argsort(codes, kind="stable")
+        self.measurements: pd.DataFrame = measurements.iloc[order].reset_index(drop=True)
+        self.information: pd.DataFrame = information.drop_duplicates("key_1").set_index("key_1", drop=False)
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            Number of runs in the collection.
+        """
+        return len(self.information)
+
+    @classmethod
+    def from_runs(cls, runs: Iterable[ASFT_Data]) -> "RunCollection":
+        """
+        Stack the measurements of ASFT_Data objects.
+
+        Args:
+            runs (Iterable[ASFT_Data]): The runs to stack.
+
+        Returns:
+            RunCollection: The collection of runs.
+        """
+        measurements: List[pd.DataFrame] = []
+        information: List[dict] = []
+        for run in runs:
+            m = run.tables["measurements"]
+            m.insert(0, "key_1", run.key_1)
+            measurements.append(m)
+            information.append({column: getattr(run, column) for column in cls.INFORMATION_COLUMNS})
+
+        if not measurements:
+            return cls(pd.DataFrame(columns=cls.MEASUREMENT_COLUMNS), pd.DataFrame(columns=cls.INFORMATION_COLUMNS))
+        return cls(pd.concat(measurements, ignore_index=True), pd.DataFrame(information))
+
+    @classmethod
+    def from_db(cls, measurements: pd.DataFrame, information: pd.DataFrame) -> "RunCollection":
+        """
+        Build a collection from the Measurements and Information tables of the database (see app.utils.excel_db).
+
+        The chainage padding rows (distance 0) are dropped, so the calculations run on the measured rows only.
+
+        Args:
+            measurements (pd.DataFrame): The Measurements table.
+            information (pd.DataFrame): The Information table.
+
+        Returns:
+            RunCollection: The collection of runs.
+        """
+        m = measurements[measurements["distance"] != 0]
+        m = m.rename(columns={"distance": "Distance", "friction": "Friction", "speed": "Speed"})
+        return cls(m[cls.MEASUREMENT_COLUMNS], information)
+
+    @property
+    def keys(self) -> pd.Index:
+        """
+        Returns:
+            pd.Index: The key_1 of every run in the collection.
+        """
+        return self.information.index
+
+    def rolling_average(self, smoothing: Smoothing = Smoothing()) -> pd.Series:
+        """
+        Rolling average of the friction of every run, as ASFT_Data does per run.
+
+        Args:
+            smoothing (Smoothing, optional): Window size, centering and rounding digits. Defaults to Smoothing().
+
+        Returns:
+            pd.Series: The rolling average of each row of `measurements`.
+        """
+        rolling = (
+            self.measurements.groupby("key_1", sort=False)["Friction"]
+            .rolling(window=smoothing.window_size, center=smoothing.center)
+            .mean()
+            .reset_index(level=0, drop=True)
+        )
+        return rolling.sort_index().fillna(0).round(smoothing.digits).rename("Av. Friction 100m")
+
+    def color_codes(self, smoothing: Smoothing = Smoothing(), policy: ColorPolicy = DEFAULT_POLICY) -> pd.Series:
+        """
+        Color code of every row, as ASFT_Data does per run. Red is not propagated across runs.
+
+        Args:
+            smoothing (Smoothing, optional): Smoothing of the friction averages. Defaults to Smoothing().
+            policy (ColorPolicy, optional): Thresholds and red propagation window. Defaults to DEFAULT_POLICY.
+
+        Returns:
+            pd.Series: The color name of each row of `measurements`.
+        """
+        averages = self.rolling_average(smoothing).to_numpy()
+        codes = classify_friction(averages, policy, self.measurements["key_1"].to_numpy())
+        return pd.Series(color_names(codes), index=self.measurements.index, name="Color Code")
+
+    def friction_thirds(self) -> pd.Series:
+        """
+        Fric. A, Fric. B or Fric. C of the run of every row, depending on the third of the run the row falls in, as
+        app.utils.functions.report_functions.friction_thirds does per run.
+
+        Returns:
+            pd.Series: The friction of the third of each row of `measurements`.
+        """
+        grouped = self.measurements.groupby("key_1", sort=False)
+        row = grouped.cumcount().to_numpy()
+        third = grouped["key_1"].transform("size").to_numpy() / 3
+
+        keys = self.measurements["key_1"]
+        fric_A = keys.map(self.information["fric_A"]).to_numpy(dtype=float)
+        fric_B = keys.map(self.information["fric_B"]).to_numpy(dtype=float)
+        fric_C = keys.map(self.information["fric_C"]).to_numpy(dtype=float)
+
+        thirds = np.select(
+            [row <= np.round(third - 1), row <= np.round(2 * third - 1)],
+            [fric_A, fric_B],
+            default=fric_C,
+        )
+        return pd.Series(thirds, index=self.measurements.index, name="Thirds")
+
+    def friction_interval_mean(self, values: str = "Friction", interval: int = 10) -> pd.Series:
+        """
+        Mean of every complete block of `interval` rows of each run, assigned to every row of the block, as
+        app.utils.functions.report_functions.friction_interval_mean does per run. Rows of an incomplete trailing block
+        are NaN.
+
+        Args:
+            values (str, optional): Column to average. Defaults to "Friction".
+            interval (int, optional): Number of rows per block. Defaults to 10.
+
+        Returns:
+            pd.Series: The block mean of each row of `measurements`.
+        """
+        block = self.measurements.groupby("key_1", sort=False).cumcount() // interval
+        grouped = self.measurements.groupby([self.measurements["key_1"], block], sort=False)[values]
+        means = grouped.transform("mean")
+        return means.where(grouped.transform("size") == interval).rename("Average Friction 100m")
+
+    def derived(self, smoothing: Smoothing = Smoothing(), policy: ColorPolicy = DEFAULT_POLICY) -> pd.DataFrame:
+        """
+        The stacked measurements with every derived column.
+
+        Args:
+            smoothing (Smoothing, optional): Smoothing of the friction averages. Defaults to Smoothing().
+            policy (ColorPolicy, optional): Thresholds and red propagation window. Defaults to DEFAULT_POLICY.
+
+        Returns:
+            pd.DataFrame: key_1, Distance, Friction, Speed, Av. Friction 100m, Color Code, Average Friction 100m and
+            Thirds columns.
+        """
+        df = self.measurements.copy()
+        df["Av. Friction 100m"] = self.rolling_average(smoothing)
+        df["Color Code"] = self.color_codes(smoothing, policy)
+        df["Average Friction 100m"] = self.friction_interval_mean()
+        df["Thirds"] = self.friction_thirds()
+        return df
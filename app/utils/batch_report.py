@@ -0,0 +1,219 @@
+from app.models.ASFT_Data import ASFT_Data
+from app.models.parsers import ParserBackend
+import concurrent.futures
+import os
+
+from app.utils.functions.report_functions import get_file_name, validate_attributes
+from app.utils.instrumentation import StageTiming, TimingRecorder, emit
+from app.utils.parse_cache import ParseCache
+from app.utils.report import REPORT_ATTRIBUTES, write_report_no_chainage, write_report_with_chainage
+
+from collections import Counter, defaultdict
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+from pathlib import Path
+
+
+class ReportSettings(NamedTuple):
+    """
+    Values entered by the user that are shared by every report of a batch. The runway length and starting points are
+    only needed for reports with chainage.
+    """
+
+    weather: str
+    runway_material: str
+    runway_length: Optional[int] = None
+    starting_point_1: Optional[int] = None
+    starting_point_2: Optional[int] = None
+
+    def starting_point(self, numbering: str) -> Optional[int]:
+        """
+        Starting point for a runway header: `starting_point_1` for headers 01 to 18, `starting_point_2` otherwise.
+        """
+        return self.starting_point_1 if int(numbering) <= 18 else self.starting_point_2
+
+
+class ReportPair(NamedTuple):
+    left_file: str
+    right_file: str
+    name: str
+
+
+class BatchResult(NamedTuple):
+    written: List[str]
+    unpaired: List[str]
+    mismatched: List[str]
+    failed: List[str]
+
+
+def pair_runs(runs: List[ASFT_Data]) -> Tuple[List[ReportPair], List[str], List[str]]:
+    """
+    Pair the L and R runs of the same measurement.
+
+    Runs are grouped by iata, runway, numbering, separation and date, and within each group the L and R runs are
+    paired in time order. Every pair is checked with the same attributes as the report writers.
+
+    A pair is named after its L run (see get_file_name). When several pairs of the same day would get the same name,
+    each of them is named with the time of its L run as well, e.g. "RGL RWY07 3m 2023-03-10 111912", so no report
+    overwrites another.
+
+    Args:
+        runs (List[ASFT_Data]): The runs to pair. Only their header is used.
+
+    Returns:
+        Tuple[List[ReportPair], List[str], List[str]]: The pairs, a message for every run without a counterpart or
+        whose header cannot be read, and a message for every pair whose attributes do not match.
+    """
+    groups: Dict[tuple, Dict[str, List[ASFT_Data]]] = defaultdict(lambda: {"L": [], "R": []})
+    unpaired: List[str] = []
+    for run in runs:
+        try:
+            side = run.side
+            key = (run.iata, run.runway, run.numbering, run.separation, run.date.date())
+        except Exception as e:
+            unpaired.append(f"{run.filename}: skipped, the header could not be read: {type(e).__name__}: {e}")
+            continue
+        if side not in ("L", "R"):
+            unpaired.append(f"{run.filename}: unknown side '{side}'")
+            continue
+        groups[key][side].append(run)
+
+    matched: List[Tuple[ASFT_Data, ASFT_Data]] = []
+    mismatched: List[str] = []
+    for sides in groups.values():
+        left_runs = sorted(sides["L"], key=lambda run: run.date)
+        right_runs = sorted(sides["R"], key=lambda run: run.date)
+        for L, R in zip(left_runs, right_runs):
+            try:
+                validate_attributes(L, R, REPORT_ATTRIBUTES)
+            except ValueError as e:
+                mismatched.append(f"{L.filename} / {R.filename}: {e}")
+                continue
+            matched.append((L, R))
+
+        for run in left_runs[len(right_runs) :] + right_runs[len(left_runs) :]:
+            unpaired.append(f"{run.filename}: no {'R' if run.side == 'L' else 'L'} run found")
+
+    names = Counter(get_file_name(L) for L, _ in matched)
+    pairs: List[ReportPair] = []
+    for L, R in matched:
+        name = get_file_name(L)
+        if names[name] > 1:
+            name = f"{name} {L.date:%H%M%S}"
+        pairs.append(ReportPair(str(L.file_path), str(R.file_path), name))
+
+    return pairs, unpaired, mismatched
+
+
+def write_pair_report(
+    pair: ReportPair,
+    settings: ReportSettings,
+    output_folder: Union[str, Path],
+    chainage: bool,
+    cache: Optional[ParseCache] = None,
+    parser: Optional[ParserBackend] = None,
+) -> Tuple[str, List[StageTiming]]:
+    """
+    Write the report of a pair of runs. Runs in the worker processes of `write_reports`.
+
+    Returns:
+        Tuple[str, List[StageTiming]]: The name of the report and the stage timings of the worker.
+    """
+    with TimingRecorder() as recorder:
+        L = ASFT_Data(pair.left_file, cache, parser=parser)
+        R = ASFT_Data(pair.right_file, cache, parser=parser)
+        L.weather = settings.weather
+        L.runway_material = settings.runway_material
+
+        if chainage:
+            write_report_with_chainage(
+                L, R, settings.runway_length, settings.starting_point(L.numbering), output_folder, pair.name
+            )
+        else:
+            write_report_no_chainage(L, R, output_folder, pair.name)
+    return pair.name, recorder.timings
+
+
+def write_reports(
+    pairs: List[ReportPair],
+    settings: ReportSettings,
+    output_folder: Union[str, Path],
+    chainage: bool,
+    cache: Optional[ParseCache] = None,
+    max_workers: Optional[int] = None,
+    parser: Optional[ParserBackend] = None,
+    on_done: Optional[Callable[[str], None]] = None,
+) -> Tuple[List[str], List[str]]:
+    """
+    Write the reports of many pairs of runs concurrently in a process pool.
+
+    Args:
+        pairs (List[ReportPair]): The pairs of runs, as returned by `pair_runs`.
+        settings (ReportSettings): Values shared by every report.
+        output_folder (Union[str, Path]): Folder where the reports are written.
+        chainage (bool): Whether to write reports with chainage.
+        cache (Optional[ParseCache], optional): Parse cache used to skip the extraction of already parsed files.
+            Defaults to None.
+        max_workers (Optional[int], optional): Number of worker processes. Defaults to the number of CPU cores.
+        parser (Optional[ParserBackend], optional): Backend used to extract the tables. Defaults to CamelotParser.
+        on_done (Optional[Callable[[str], None]], optional): Called with the name of every report once it is written
+            or has failed, e.g. to show progress. Defaults to None.
+
+    Returns:
+        Tuple[List[str], List[str]]: The names of the written reports and a message for every report that failed.
+    """
+    if not pairs:
+        return [], []
+
+    written: List[str] = []
+    failed: List[str] = []
+    max_workers = min(max_workers or os.cpu_count() or 1, len(pairs))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(write_pair_report, pair, settings, output_folder, chainage, cache, parser): pair
+            for pair in pairs
+        }
+        for future in concurrent.futures.as_completed(futures):
+            pair = futures[future]
+            try:
+                name, timings = future.result()
+            except Exception as e:
+                failed.append(f"{pair.name}: {type(e).__name__}: {e}")
+            else:
+                emit(timings)
+                written.append(name)
+            if on_done is not None:
+                on_done(pair.name)
+    return written, failed
+
+
+def batch_reports(
+    runs: List[ASFT_Data],
+    settings: ReportSettings,
+    output_folder: Union[str, Path],
+    chainage: bool,
+    cache: Optional[ParseCache] = None,
+    max_workers: Optional[int] = None,
+    parser: Optional[ParserBackend] = None,
+    on_done: Optional[Callable[[str], None]] = None,
+) -> BatchResult:
+    """
+    Pair the runs of a folder and write all their reports.
+
+    Args:
+        runs (List[ASFT_Data]): The runs, usually extracted with `header_only=True`.
+        settings (ReportSettings): Values shared by every report.
+        output_folder (Union[str, Path]): Folder where the reports are written.
+        chainage (bool): Whether to write reports with chainage.
+        cache (Optional[ParseCache], optional): Parse cache used to skip the extraction of already parsed files.
+            Defaults to None.
+        max_workers (Optional[int], optional): Number of worker processes. Defaults to the number of CPU cores.
+        parser (Optional[ParserBackend], optional): Backend used to extract the tables. Defaults to CamelotParser.
+        on_done (Optional[Callable[[str], None]], optional): Called with the name of every report once it is written
+            or has failed, e.g. to show progress. Defaults to None.
+
+    Returns:
+        BatchResult: The written reports and the unpaired, mismatched and failed files.
+    """
+    pairs, unpaired, mismatched = pair_runs(runs)
+    written, failed = write_reports(pairs, settings, output_folder, chainage, cache, max_workers, parser, on_done)
+    return BatchResult(written, unpaired, mismatched, failed)
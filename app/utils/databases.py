@@ -0,0 +1,40 @@
+from app.utils.excel_db import ExcelDatabase
+from app.utils.parquet_db import ParquetDatabase
+from app.utils.sqlite_db import SQLiteDatabase
+from app.utils.storage import Storage
+
+from typing import Dict, Optional, Type, Union
+from pathlib import Path
+
+STORAGES: Dict[str, Type[Storage]] = {
+    ExcelDatabase.name: ExcelDatabase,
+    SQLiteDatabase.name: SQLiteDatabase,
+    ParquetDatabase.name: ParquetDatabase,
+}
+
+
+def get_storage(db_file: Union[str, Path], backend: Optional[str] = None) -> Storage:
+    """
+    Get the storage of a database file.
+
+    Args:
+        db_file (Union[str, Path]): Path to the database file.
+        backend (Optional[str], optional): Name of the storage backend. Defaults to None, which picks the backend from
+            the file suffix.
+
+    Returns:
+        Storage: An unopened storage of the database file.
+
+    Raises:
+        ValueError: If the backend is unknown or cannot be deduced from the file suffix.
+    """
+    if backend is None:
+        suffix = Path(db_file).suffix.lower()
+        for storage in STORAGES.values():
+            if suffix in storage.suffixes:
+                return storage(db_file)
+        raise ValueError(f"Unknown database file type '{suffix}'.")
+
+    if backend not in STORAGES:
+        raise ValueError(f"Unknown storage backend '{backend}'. Available backends: {', '.join(STORAGES)}.")
+    return STORAGES[backend](db_file)
@@ -1,11 +1,44 @@
 from app.models.ASFT_Data import ASFT_Data
 import pandas as pd
 
-from app.utils.functions.excel_functions import append_dataframe_to_excel
+from app.utils.functions.excel_functions import save_workbook_atomic, write_dataframes_to_excel
+from app.utils.instrumentation import timed
+from app.utils.storage import Storage
 
-from typing import Union
+from openpyxl import load_workbook, Workbook
+from openpyxl.worksheet.worksheet import Worksheet
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple, Union
 from pathlib import Path
 
+MEASUREMENT_COLUMNS = ["key_1", "chainage", "distance", "friction", "speed", "av. friction 100m", "color code"]
+INFORMATION_COLUMNS = [
+    "key_1",
+    "key_2",
+    "date",
+    "iata",
+    "numbering",
+    "side",
+    "separation",
+    "runway",
+    "average speed",
+    "fric_A",
+    "fric_B",
+    "fric_C",
+    "runway length",
+    "starting point",
+    "equipment",
+    "pilot",
+    "ice level",
+    "tyre pressure",
+    "water film",
+    "system distance",
+    "operator",
+    "temperature",
+    "surface condition",
+    "weather",
+    "runway material",
+]
+
 
 def measurements_table(data: ASFT_Data) -> pd.DataFrame:
     measurements = data.measurements_with_chainage
@@ -56,16 +89,301 @@ def information_table(data: ASFT_Data) -> pd.DataFrame:
     )
 
 
-def add_data_to_db(data: ASFT_Data, excel_file: Union[str, Path]):
-    measurements = measurements_table(data)
-    information = information_table(data)
+class KeyLocation(NamedTuple):
+    """
+    Rows of a run in the Excel database (1-based, as in openpyxl). first_row and last_row are None for a run with an
+    Information row but no Measurements rows.
+    """
+
+    first_row: Optional[int]
+    last_row: Optional[int]
+    information_row: int
+
+
+class ExcelDatabase(Storage):
+    """
+    Write session over the Excel database.
+
+    The workbook is opened and the key index is read once when the session starts, every added run is appended in
+    memory and the workbook is saved once, atomically, when the session ends. Used as a context manager, the workbook
+    is only saved if the block exits without an exception.
+
+    The key index is kept in the hidden sheet INDEX_SHEET, which maps every key_1 to the rows of its run in the
+    Measurements and Information sheets, so runs can be looked up, replaced or deleted without scanning the sheets.
+    It is rebuilt from the sheets if it is missing or does not match them (e.g. after a manual edit). As sorting a
+    sheet in Excel moves rows without changing their number, the key_1 cells at the indexed rows of a run are also
+    checked before the run is located, deleted or replaced.
+
+    Example:
+        with ExcelDatabase("db.xlsx") as db:
+            for data in runs:
+                db.add(data)
+    """
+
+    name = "excel"
+    suffixes = (".xlsx",)
+    INDEX_SHEET = "_Index"
+
+    def __init__(self, excel_file: Union[str, Path]) -> None:
+        super().__init__(excel_file)
+        self._wb: Optional[Workbook] = None
+        self._index: Dict[str, KeyLocation] = {}
+        self._changed: bool = False
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def open(self) -> None:
+        """
+        Load the workbook, or start an empty one if the file does not exist, and load the key index.
 
-    file_path = Path(excel_file)
-    if file_path.exists():
-        existing_information_table = pd.read_excel(excel_file, sheet_name="Information")
+        Raises:
+            Exception: If the index has to be rebuilt and a run has Measurements rows but no Information row.
+        """
+        if self.file_path.exists():
+            self._wb = load_workbook(self.file_path)
+        else:
+            self._wb = Workbook()
+            self._wb.remove(self._wb.active)
 
-        if any(information["key_1"].isin(existing_information_table["key_1"])):
+        self._index = self._read_index()
+        self._changed = False
+        if not self._index_matches_sheets():
+            self._index = self._build_index()
+            self._changed = True
+
+    def locate(self, key: str) -> Optional[KeyLocation]:
+        """
+        Find the rows of a run.
+
+        Args:
+            key (str): key_1 of the run.
+
+        Returns:
+            Optional[KeyLocation]: The rows of the run, or None if the key is not in the database.
+        """
+        self._check_open()
+        location = self._index.get(key)
+        if location is not None and not self._location_matches(key, location):
+            self._index = self._build_index()
+            self._changed = True
+            location = self._index.get(key)
+        return location
+
+    def add(self, data: ASFT_Data) -> None:
+        """
+        Append the Measurements and Information rows of a run.
+
+        Args:
+            data (ASFT_Data): The run to add.
+
+        Raises:
+            Exception: If the key of the run already exists in the database.
+        """
+        self._check_open()
+        if data.key_1 in self._index:
             raise Exception("The key already exists in the database.")
 
-    append_dataframe_to_excel(measurements, excel_file, "Measurements")
-    append_dataframe_to_excel(information, excel_file, "Information")
+        first_row, last_row = self._append(measurements_table(data), "Measurements")
+        information_row, _ = self._append(information_table(data), "Information")
+        self._index[data.key_1] = KeyLocation(first_row, last_row, information_row)
+        self._changed = True
+
+    def delete(self, key: str) -> None:
+        """
+        Delete the Measurements and Information rows of a run.
+
+        Args:
+            key (str): key_1 of the run.
+
+        Raises:
+            Exception: If the key does not exist in the database.
+        """
+        location = self.locate(key)
+        if location is None:
+            raise Exception("The key does not exist in the database.")
+
+        del self._index[key]
+        count = 0
+        if location.first_row is not None:
+            count = location.last_row - location.first_row + 1
+            self._wb["Measurements"].delete_rows(location.first_row, count)
+        self._wb["Information"].delete_rows(location.information_row, 1)
+
+        for other, (first_row, last_row, information_row) in self._index.items():
+            if count and first_row is not None and first_row > location.last_row:
+                first_row, last_row = first_row - count, last_row - count
+            if information_row > location.information_row:
+                information_row -= 1
+            self._index[other] = KeyLocation(first_row, last_row, information_row)
+        self._changed = True
+
+    def save(self) -> None:
+        """
+        Write the key index and save the workbook, replacing the file atomically. Nothing is written if the session
+        made no changes.
+        """
+        self._check_open()
+        if not self._changed:
+            return
+
+        if self.INDEX_SHEET in self._wb:
+            self._wb.remove(self._wb[self.INDEX_SHEET])
+        ws = self._wb.create_sheet(self.INDEX_SHEET)
+        ws.append(["key_1", *KeyLocation._fields])
+        for key, location in self._index.items():
+            ws.append([key, *location])
+        ws.sheet_state = "hidden"
+
+        with timed("save", self.file_path):
+            save_workbook_atomic(self._wb, self.file_path)
+
+    def close(self) -> None:
+        """
+        Release the workbook, discarding unsaved changes.
+        """
+        self._wb = None
+
+    def information(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: The Information sheet.
+        """
+        return self._sheet_dataframe("Information")
+
+    def measurements(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: The Measurements sheet.
+        """
+        return self._sheet_dataframe("Measurements")
+
+    def _sheet_dataframe(self, sheet_name: str) -> pd.DataFrame:
+        self._check_open()
+        if sheet_name not in self._wb:
+            return pd.DataFrame()
+        rows = self._wb[sheet_name].iter_rows(values_only=True)
+        header = next(rows, ())
+        return pd.DataFrame(list(rows), columns=list(header))
+
+    def _check_open(self) -> None:
+        if self._wb is None:
+            raise Exception("The database is not open.")
+
+    def _read_index(self) -> Dict[str, KeyLocation]:
+        if self.INDEX_SHEET not in self._wb:
+            return {}
+        rows = self._wb[self.INDEX_SHEET].iter_rows(min_row=2, values_only=True)
+        return {key: KeyLocation(*location) for key, *location in rows if key is not None}
+
+    def _index_matches_sheets(self) -> bool:
+        """
+        Cheap consistency check of the key index: the number of runs and the last indexed rows must match the sheets.
+        """
+        if "Information" not in self._wb or "Measurements" not in self._wb:
+            return not self._index
+        if len(self._index) != self._wb["Information"].max_row - 1:
+            return False
+        last_row = max((location.last_row for location in self._index.values() if location.last_row), default=1)
+        return last_row == self._wb["Measurements"].max_row
+
+    def _location_matches(self, key: str, location: KeyLocation) -> bool:
+        """
+        Check that the key_1 cells at the first and last Measurements rows and at the Information row of a run hold
+        its key.
+        """
+        cells = [("Information", location.information_row)]
+        if location.first_row is not None:
+            cells += [("Measurements", location.first_row), ("Measurements", location.last_row)]
+        return all(self._key_at(sheet_name, row) == key for sheet_name, row in cells)
+
+    def _key_at(self, sheet_name: str, row: int) -> Optional[str]:
+        if sheet_name not in self._wb:
+            return None
+        ws = self._wb[sheet_name]
+        # Rows past the end are not read, since openpyxl creates the cells it is asked for.
+        if not 2 <= row <= ws.max_row:
+            return None
+        header = [cell.value for cell in ws[1]]
+        if "key_1" not in header:
+            return None
+        return ws.cell(row, header.index("key_1") + 1).value
+
+    def _build_index(self) -> Dict[str, KeyLocation]:
+        """
+        Build the key index by scanning the key_1 column of the Measurements and Information sheets. Runs with an
+        Information row but no Measurements rows are indexed too.
+
+        Raises:
+            Exception: If a run has Measurements rows but no Information row.
+        """
+        information_rows = dict(self._key_column("Information"))
+        index: Dict[str, KeyLocation] = {}
+        for key, row in self._key_column("Measurements"):
+            location = index.get(key)
+            if location is None:
+                if key not in information_rows:
+                    raise Exception(
+                        f"The run {key} has Measurements rows but no Information row in {self.file_path}. "
+                        "Add its Information row or delete its Measurements rows."
+                    )
+                index[key] = KeyLocation(row, row, information_rows[key])
+            else:
+                index[key] = location._replace(last_row=row)
+        for key, row in information_rows.items():
+            if key not in index:
+                index[key] = KeyLocation(None, None, row)
+        return index
+
+    def _key_column(self, sheet_name: str) -> Iterator[Tuple[str, int]]:
+        if sheet_name not in self._wb:
+            return
+        rows = self._wb[sheet_name].iter_rows(values_only=True)
+        header = next(rows, ())
+        if "key_1" not in header:
+            return
+        column = header.index("key_1")
+        for row_idx, row in enumerate(rows, start=2):
+            if row[column] is not None:
+                yield row[column], row_idx
+
+    def _sheet(self, sheet_name: str, columns: list) -> Worksheet:
+        if sheet_name in self._wb:
+            return self._wb[sheet_name]
+        ws = self._wb.create_sheet(sheet_name)
+        ws.append(columns)
+        return ws
+
+    def _append(self, dataframe: pd.DataFrame, sheet_name: str) -> Tuple[int, int]:
+        """
+        Append the rows of a DataFrame to a sheet.
+
+        Returns:
+            Tuple[int, int]: The first and last rows written.
+        """
+        ws = self._sheet(sheet_name, list(dataframe.columns))
+        first_row = ws.max_row + 1
+        for row in dataframe.itertuples(index=False, name=None):
+            ws.append(row)
+        return first_row, first_row + len(dataframe) - 1
+
+
+def export_to_excel(storage: Storage, excel_file: Union[str, Path]) -> None:
+    """
+    Write the tables of an open storage to a new Excel database.
+
+    Args:
+        storage (Storage): The open storage to export.
+        excel_file (Union[str, Path]): The path to the Excel file. It is overwritten if it exists.
+    """
+    write_dataframes_to_excel(
+        {"Measurements": storage.measurements(), "Information": storage.information()}, excel_file
+    )
+
+
+def add_data_to_db(data: ASFT_Data, excel_file: Union[str, Path]):
+    with ExcelDatabase(excel_file) as db:
+        db.add(data)
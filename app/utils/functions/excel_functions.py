@@ -1,11 +1,15 @@
 import os
+import stat
+import tempfile
 import pandas as pd
 from openpyxl import load_workbook, Workbook
+from openpyxl.cell.cell import Cell
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.worksheet.table import Table
 from openpyxl.utils import column_index_from_string
-from typing import Optional, Union
+from typing import Dict, List, Optional, Union
 from pathlib import Path
 
 
@@ -152,6 +156,75 @@ def write_column_to_excel(
             cell.value = value
 
 
+def write_block_to_excel(
+    worksheet: Worksheet,
+    start_row: int,
+    start_column: str,
+    data: pd.DataFrame,
+    formats: Optional[Dict[str, Union[str, dict]]] = None,
+) -> None:
+    """
+    Writes a pandas DataFrame to a block of adjacent Excel worksheet columns in a single pass, with optional formatting
+    per column. The cells are formatted as with `write_column_to_excel`.
+
+    The values and formatting attributes of each column are prepared in one go. The attributes are set on the first
+    cell of each column and original cell style only, and the other cells share the resulting style, so fonts, fills
+    and number formats are not looked up in the workbook style tables once per cell.
+
+    Args:
+        worksheet (Worksheet): The Openpyxl Worksheet object where the data will be written.
+        start_row (int): The row index at which the data writing should start (1-based indexing).
+        start_column (str): The column name (e.g. 'A', 'B', 'C', etc.) where the first DataFrame column is written.
+        data (pd.DataFrame): The DataFrame to write. Its columns are written in order to consecutive worksheet columns.
+        formats (Optional[Dict[str, Union[str, dict]]], optional): The formatting of the cells, by DataFrame column. A
+            string sets the number format (and the values are written as floats), a dictionary sets cell attributes.
+            Columns without an entry are written as they are. Defaults to None.
+
+    Examples:
+        Write two columns to 'B' and 'C' starting at row 11, the second one with two decimals:
+            write_block_to_excel(worksheet, 11, 'B', df[['Distance', 'Friction']], {'Friction': '0.00'})
+
+    Returns:
+        None
+    """
+    if data.empty:
+        return
+    formats = formats or {}
+
+    columns = []
+    for name in data.columns:
+        format = formats.get(name)
+        if isinstance(format, str):
+            columns.append((data[name].astype(float).tolist(), [("number_format", format)]))
+        elif isinstance(format, dict):
+            attributes = [(attr, val) for attr, val in format.items() if attr in dir(Cell)]
+            columns.append((data[name].tolist(), attributes))
+        else:
+            columns.append((data[name].tolist(), []))
+
+    min_col = column_index_from_string(start_column)
+    rows = worksheet.iter_rows(
+        min_row=start_row, max_row=start_row + len(data) - 1, min_col=min_col, max_col=min_col + len(columns) - 1
+    )
+
+    # Formatted style of each column, by the style the cells had before (None for unstyled cells): the attributes are
+    # only set on the first cell with a given style, and the other cells get a copy of its formatted style.
+    styles: List[Dict[Optional[int], StyleArray]] = [{} for _ in columns]
+    for i, row in enumerate(rows):
+        for cell, (values, attributes), column_styles in zip(row, columns, styles):
+            cell.value = values[i]
+            if not attributes:
+                continue
+            original = cell.style_id if cell.has_style else None
+            style = column_styles.get(original)
+            if style is None:
+                for attr, val in attributes:
+                    setattr(cell, attr, val)
+                column_styles[original] = StyleArray(cell._style)
+            else:
+                cell._style = StyleArray(style)
+
+
 def merge_columns_into_thirds(number_of_rows: int, col: str, ws: Worksheet, start_row) -> pd.Series:
     """
     Merges cells in the given column into thirds.
@@ -191,6 +264,9 @@ def append_dataframe_to_excel(dataframe: pd.DataFrame, excel_file: Union[str, Pa
     """
     Appends a pandas DataFrame to an existing or new Excel file in a specified sheet.
 
+    A new file is written in streaming mode (see `write_dataframes_to_excel`). An existing file has to be loaded whole
+    to be appended to.
+
     Args:
         dataframe (pd.DataFrame): The DataFrame to be appended to the Excel file.
         excel_file (Union[str, Path]): The path to the Excel file where the DataFrame will be appended.
@@ -202,26 +278,78 @@ def append_dataframe_to_excel(dataframe: pd.DataFrame, excel_file: Union[str, Pa
     file_path = Path(excel_file)
 
     if not file_path.exists():
-        wb = Workbook()
-        ws = wb.active
-        ws.title = sheet_name
-        ws.append(list(dataframe.columns))
-        for index, row in dataframe.iterrows():
-            row_list = list(row)
-            ws.append(row_list)
-        wb.save(excel_file)
+        write_dataframes_to_excel({sheet_name: dataframe}, excel_file)
         return
 
+    wb = load_workbook(file_path)
+    if sheet_name in wb:
+        ws = wb[sheet_name]
     else:
-        wb = load_workbook(file_path)
-        if sheet_name in wb:
-            ws = wb[sheet_name]
-        else:
-            ws = wb.create_sheet(sheet_name)
-            ws.append(list(dataframe.columns))
+        ws = wb.create_sheet(sheet_name)
+        ws.append(list(dataframe.columns))
 
-    for index, row in dataframe.iterrows():
-        row_list = list(row)
-        ws.append(row_list)
+    for row in dataframe.itertuples(index=False, name=None):
+        ws.append(row)
 
     wb.save(excel_file)
+
+
+def write_dataframes_to_excel(sheets: Dict[str, pd.DataFrame], excel_file: Union[str, Path]) -> None:
+    """
+    Writes pandas DataFrames to a new Excel file, one sheet per DataFrame with its columns as header.
+
+    The workbook is written in openpyxl's write-only mode, row tuples streamed straight from the DataFrames, so memory
+    use does not grow with the number of rows. The file is replaced atomically if it exists.
+
+    Args:
+        sheets (Dict[str, pd.DataFrame]): The DataFrames to write, by sheet name, in sheet order.
+        excel_file (Union[str, Path]): The path to the Excel file.
+
+    Returns:
+        None
+    """
+    wb = Workbook(write_only=True)
+    for sheet_name, dataframe in sheets.items():
+        ws = wb.create_sheet(sheet_name)
+        ws.append(list(dataframe.columns))
+        for row in dataframe.itertuples(index=False, name=None):
+            ws.append(row)
+    save_workbook_atomic(wb, excel_file)
+
+
+def save_workbook_atomic(wb: Workbook, excel_file: Union[str, Path]) -> None:
+    """
+    Saves a workbook to a temporary file next to the target and then replaces the target with it, so an interrupted
+    save never leaves a truncated Excel file behind.
+
+    Args:
+        wb (Workbook): The workbook to save.
+        excel_file (Union[str, Path]): The path to the Excel file.
+
+    Returns:
+        None
+    """
+    file_path = Path(excel_file)
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.stem}.", suffix=file_path.suffix)
+    os.close(fd)
+    try:
+        wb.save(tmp_path)
+        # mkstemp creates the file with mode 0600: keep the mode of the replaced file, or the umask default.
+        os.chmod(tmp_path, _file_mode(file_path))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _file_mode(file_path: Path) -> int:
+    """
+    Returns:
+        int: The permission bits of an existing file, or those of a new file under the current umask.
+    """
+    try:
+        return stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
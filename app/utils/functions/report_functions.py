@@ -1,9 +1,16 @@
 from app.models.ASFT_Data import ASFT_Data
-from typing import List, Tuple, Any
+from typing import Any, Dict, List, Optional, Tuple
+from copy import copy, deepcopy
+from importlib import resources
+from io import BytesIO
+from itertools import count
+import functools
 from openpyxl import load_workbook, Workbook
+from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.styles.borders import Border, Side
-from openpyxl.styles import Alignment
+from openpyxl.styles.fills import Fill
+from openpyxl.styles import Alignment, Font, NamedStyle
 import pandas as pd
 
 # TODO: fix friction_thirds (rename and fix types) and friction_interval_mean (rename and fix types)
@@ -53,18 +60,56 @@ def validate_attributes(L: ASFT_Data, R: ASFT_Data, attributes: List[str]) -> No
             raise ValueError(f"{attribute} values must be the same for both objects. Found '{value1}' and '{value2}'")
 
 
-def setup_workbook(template_path: str, title: str) -> Tuple[Workbook, Worksheet]:
+@functools.lru_cache(maxsize=None)
+def _template(template_name: str) -> Workbook:
+    """
+    Loads a report template from the app.templates package. Cached, so each template is parsed once per process. The
+    cached workbook must not be modified; `load_template` returns copies of it.
+    """
+    return load_workbook(BytesIO(resources.files("app.templates").joinpath(template_name).read_bytes()))
+
+
+def _clone_workbook(wb: Workbook) -> Workbook:
+    """
+    Copies a workbook in memory, style tables included.
+
+    A plain deepcopy leaves the style tables of the copy empty: deepcopy fills the lookup dictionary of an IndexedList
+    before its items, so they look already present and are never appended. The tables are rebuilt here and passed to
+    deepcopy in its memo.
+    """
+    memo: Dict[int, Any] = {}
+    for value in vars(wb).values():
+        if isinstance(value, IndexedList):
+            memo[id(value)] = IndexedList(deepcopy(list(value), memo))
+    return deepcopy(wb, memo)
+
+
+def load_template(template_name: str) -> Workbook:
+    """
+    Returns a fresh report template workbook, copied in memory from the cached template so the template XML is not
+    parsed again.
+
+    Args:
+        template_name (str): File name of the template in app/templates (e.g. "report_template_with_chainage.xlsx").
+
+    Returns:
+        Workbook: The template workbook, which can be freely modified.
+    """
+    return _clone_workbook(_template(template_name))
+
+
+def setup_workbook(template_name: str, title: str) -> Tuple[Workbook, Worksheet]:
     """
     Sets up the workbook using the provided template.
 
     Args:
-        template_path (str): Path to the template file.
-        L (ASFT_Data): ASFT_Data object with side 'L'.
+        template_name (str): File name of the template in app/templates.
+        title (str): Title of the active worksheet.
 
     Returns:
         Tuple[Workbook, Worksheet]: Loaded workbook and active worksheet.
     """
-    wb = load_workbook(template_path)
+    wb = load_template(template_name)
     ws = wb.active
     ws.title = title
     ws.page_setup.paperSize = ws.PAPERSIZE_A4
@@ -95,20 +140,63 @@ def friction_interval_mean(df: pd.DataFrame, values: str, interval: int = 10) ->
     return get_friction_mean(df[values]).reindex(range(len(df))).bfill()
 
 
-def center_and_bold_cells(ws: Worksheet, min_row: int, min_col: int) -> None:
-    # TODO: add a max_row and max_col or a range
-    border = Border(
-        left=Side(border_style="medium", color="000000"),
-        right=Side(border_style="medium", color="000000"),
-        top=Side(border_style="medium", color="000000"),
-        bottom=Side(border_style="medium", color="000000"),
-    )
-    for row in ws.iter_rows(min_row=min_row, min_col=min_col):
-        if row[0].row == 1:
-            continue
+REPORT_CELL_STYLE = "Report cell"
+
+
+def center_and_bold_cells(
+    ws: Worksheet, min_row: int, min_col: int, max_row: Optional[int] = None, max_col: Optional[int] = None
+) -> None:
+    """
+    Applies a medium black border and centered alignment to a block of cells.
+
+    The formatting is registered once in the workbook as a named style and applied by name, so every cell shares it
+    instead of getting its own border and alignment. As a named style also sets the number format, font and fill, one
+    named style is registered for each cell style found in the block (as identified by `cell.style_id`), and the cells
+    keep their number format, font and fill.
+
+    Args:
+        ws (Worksheet): The target worksheet.
+        min_row (int): The first row of the block. Row 1 is never styled.
+        min_col (int): The first column of the block.
+        max_row (Optional[int], optional): The last row of the block. Defaults to None, the last row of the sheet.
+        max_col (Optional[int], optional): The last column of the block. Defaults to None, the last column of the sheet.
+    """
+    wb = ws.parent
+    styles: Dict[int, str] = {}
+    for row in ws.iter_rows(min_row=max(min_row, 2), max_row=max_row, min_col=min_col, max_col=max_col):
         for cell in row:
-            cell.border = border
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+            key = cell.style_id
+            name = styles.get(key)
+            if name is None:
+                name = _add_cell_style(wb, cell.number_format, copy(cell.font), copy(cell.fill))
+                styles[key] = name
+            cell.style = name
+
+
+def _add_cell_style(wb: Workbook, number_format: str, font: Font, fill: Fill) -> str:
+    """
+    Adds a report cell named style for a number format, font and fill to the workbook.
+
+    Returns:
+        str: The name of the named style, the first of "Report cell", "Report cell 2", ... not taken yet.
+    """
+    side = Side(border_style="medium", color="000000")
+    name = next(
+        name
+        for name in (REPORT_CELL_STYLE if i == 1 else f"{REPORT_CELL_STYLE} {i}" for i in count(1))
+        if name not in wb.named_styles
+    )
+    wb.add_named_style(
+        NamedStyle(
+            name=name,
+            border=Border(left=side, right=side, top=side, bottom=side),
+            alignment=Alignment(horizontal="center", vertical="center"),
+            number_format=number_format,
+            font=font,
+            fill=fill,
+        )
+    )
+    return name
 
 
 def get_file_name(data: ASFT_Data) -> str:
@@ -1,17 +1,33 @@
 from app.models.ASFT_Data import ASFT_Data
+from app.models.parsers import ParserBackend
+from app.utils.instrumentation import StageTiming, TimingRecorder, emit
+from app.utils.parse_cache import ParseCache
 import concurrent.futures
-from typing import List, Union
+from concurrent.futures.process import BrokenProcessPool
+import itertools
+import os
+import pandas as pd
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 
-def concurrent_ASFT(*pdfs: Union[str, List[str]]) -> List[ASFT_Data]:
+class ParseError(NamedTuple):
+    file_path: str
+    error_type: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.file_path}: {self.error_type}: {self.message}"
+
+
+def flatten_pdfs(*pdfs: Union[str, List[str]]) -> List[str]:
     """
-    Processes multiple PDF files concurrently to extract ASFT_Data objects.
+    Flattens a mix of PDF file paths and lists of paths into a single list.
 
     Args:
-        *pdfs (Union[str, List[str]]): Variable length argument list of PDF file paths or a list of paths to be processed.
+        *pdfs (Union[str, List[str]]): Variable length argument list of PDF file paths or a list of paths.
 
     Returns:
-        List[ASFT_Data]: A list of ASFT_Data objects extracted from the provided PDF files.
+        List[str]: The PDF file paths, in the given order.
     """
     flat_pdfs = []
     for pdf in pdfs:
@@ -19,8 +35,162 @@ def concurrent_ASFT(*pdfs: Union[str, List[str]]) -> List[ASFT_Data]:
             flat_pdfs.extend(pdf)
         else:
             flat_pdfs.append(pdf)
+    return flat_pdfs
+
+
+def extract_tables(
+    pdf: str,
+    cache: Optional[ParseCache] = None,
+    header_only: bool = False,
+    parser: Optional[ParserBackend] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Extracts the tables of a single PDF file. Runs in the worker processes of `concurrent_ASFT`, so only the
+    lightweight DataFrames are sent back to the parent process instead of the whole camelot TableList.
+
+    Args:
+        pdf (str): PDF file path.
+        cache (Optional[ParseCache], optional): Parse cache used to skip the extraction of already parsed files.
+            Defaults to None.
+        header_only (bool, optional): Whether to parse only page 1 (friction measure report and result summary).
+            Defaults to False.
+        parser (Optional[ParserBackend], optional): Backend used to extract the tables. Defaults to CamelotParser.
+
+    Returns:
+        Dict[str, pd.DataFrame]: The extracted tables, by section name.
+    """
+    data = ASFT_Data(pdf, cache, parser=parser)
+    return data.header_tables if header_only else data.tables
+
+
+def _extract_tables_timed(
+    pdf: str,
+    cache: Optional[ParseCache] = None,
+    header_only: bool = False,
+    parser: Optional[ParserBackend] = None,
+) -> Tuple[Dict[str, pd.DataFrame], List[StageTiming]]:
+    """
+    `extract_tables` recording the stage timings of the worker process, so they can be passed to the hooks of the
+    parent process.
+    """
+    with TimingRecorder() as recorder:
+        tables = extract_tables(pdf, cache, header_only, parser)
+    return tables, recorder.timings
+
+
+def concurrent_ASFT(
+    *pdfs: Union[str, List[str]],
+    cache: Optional[ParseCache] = None,
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    header_only: bool = False,
+    parser: Optional[ParserBackend] = None,
+) -> List[ASFT_Data]:
+    """
+    Processes multiple PDF files concurrently in a process pool to extract ASFT_Data objects.
+
+    Args:
+        *pdfs (Union[str, List[str]]): Variable length argument list of PDF file paths or a list of paths to be processed.
+        cache (Optional[ParseCache], optional): Parse cache used to skip the extraction of already parsed files.
+            Defaults to None.
+        max_workers (Optional[int], optional): Number of worker processes. Defaults to the number of CPU cores.
+        chunksize (Optional[int], optional): Number of files submitted to a worker at once. Defaults to splitting the
+            files in about four chunks per worker.
+        header_only (bool, optional): Whether to parse only page 1 of each file. The measurements are then parsed on
+            first access. Defaults to False.
+        parser (Optional[ParserBackend], optional): Backend used to extract the tables. Defaults to CamelotParser.
+
+    Returns:
+        List[ASFT_Data]: A list of ASFT_Data objects extracted from the provided PDF files, in the given order.
+    """
+    flat_pdfs = flatten_pdfs(*pdfs)
+    if not flat_pdfs:
+        return []
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(flat_pdfs))
+    if chunksize is None:
+        chunksize = max(1, len(flat_pdfs) // (max_workers * 4))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            _extract_tables_timed,
+            flat_pdfs,
+            itertools.repeat(cache),
+            itertools.repeat(header_only),
+            itertools.repeat(parser),
+            chunksize=chunksize,
+        )
+        runs = []
+        for pdf, (tables, timings) in zip(flat_pdfs, results):
+            emit(timings)
+            runs.append(ASFT_Data(pdf, cache, tables=tables, parser=parser))
+    return runs
+
+
+def iter_ASFT(
+    *pdfs: Union[str, List[str]],
+    cache: Optional[ParseCache] = None,
+    max_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    header_only: bool = False,
+    parser: Optional[ParserBackend] = None,
+) -> Iterator[Union[ASFT_Data, ParseError]]:
+    """
+    Processes multiple PDF files concurrently in a process pool, yielding each result as soon as it is ready.
+
+    Results are yielded in completion order, not in the given order. A file that fails to parse yields a ParseError
+    instead of raising, so the remaining files are still processed. If a worker process dies, the pool is broken and
+    every file not parsed yet yields a ParseError. At most `max_in_flight` files are submitted at any
+    time, which keeps memory bounded regardless of the number of files.
+
+    Args:
+        *pdfs (Union[str, List[str]]): Variable length argument list of PDF file paths or a list of paths to be processed.
+        cache (Optional[ParseCache], optional): Parse cache used to skip the extraction of already parsed files.
+            Defaults to None.
+        max_workers (Optional[int], optional): Number of worker processes. Defaults to the number of CPU cores.
+        max_in_flight (Optional[int], optional): Maximum number of files submitted but not yet yielded. Defaults to
+            twice the number of workers.
+        header_only (bool, optional): Whether to parse only page 1 of each file. The measurements are then parsed on
+            first access. Defaults to False.
+        parser (Optional[ParserBackend], optional): Backend used to extract the tables. Defaults to CamelotParser.
+
+    Yields:
+        Union[ASFT_Data, ParseError]: An ASFT_Data object per parsed file, or a ParseError per failed file.
+    """
+    flat_pdfs = flatten_pdfs(*pdfs)
+    if not flat_pdfs:
+        return
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(flat_pdfs))
+    max_in_flight = max(max_in_flight or 2 * max_workers, 1)
+    remaining = iter(flat_pdfs)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+        unsubmitted: List[ParseError] = []
+
+        def submit(pdfs: Iterator[str]) -> None:
+            try:
+                for pdf in pdfs:
+                    pending[executor.submit(_extract_tables_timed, pdf, cache, header_only, parser)] = pdf
+            except BrokenProcessPool as error:
+                # A worker died, e.g. killed by the OS: the pool takes no more files, so every file left fails.
+                for pdf in itertools.chain([pdf], remaining):
+                    unsubmitted.append(ParseError(str(pdf), type(error).__name__, str(error)))
+
+        submit(itertools.islice(remaining, max_in_flight))
+        while pending:
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                pdf = pending.pop(future)
+                submit(itertools.islice(remaining, 1))
+
+                error = future.exception()
+                if error is not None:
+                    yield ParseError(str(pdf), type(error).__name__, str(error))
+                else:
+                    tables, timings = future.result()
+                    emit(timings)
+                    yield ASFT_Data(pdf, cache, tables=tables, parser=parser)
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=len(flat_pdfs)) as executor:
-        futures = [executor.submit(ASFT_Data, pdf) for pdf in flat_pdfs]
-        results = [future.result() for future in futures]
-    return results
+        yield from unsubmitted
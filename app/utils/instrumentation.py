@@ -0,0 +1,122 @@
+import json
+import time
+
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Union
+from pathlib import Path
+
+STAGES = ("parse", "derive", "align", "render", "save")
+
+
+class StageTiming(NamedTuple):
+    file: str
+    stage: str
+    seconds: float
+
+
+Hook = Callable[[StageTiming], None]
+
+_hooks: List[Hook] = []
+_nested: List[float] = []
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    Register a function called with every StageTiming recorded in this process.
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    _hooks.remove(hook)
+
+
+def emit(timings: Iterable[StageTiming]) -> None:
+    """
+    Pass timings to the registered hooks, e.g. timings recorded in a worker process and sent back to the parent.
+    """
+    for timing in timings:
+        for hook in list(_hooks):
+            hook(timing)
+
+
+@contextmanager
+def timed(stage: str, file: Union[str, Path]) -> Iterator[None]:
+    """
+    Time a stage of the processing of a file and report it to the registered hooks. Nothing is timed when there are
+    no hooks.
+
+    Stages may be nested, e.g. deriving the measurements while aligning them with the chainage. The time of a stage
+    excludes the time of the stages nested in it, so the durations of all the stages add up to the total time.
+
+    Args:
+        stage (str): Name of the stage, one of STAGES.
+        file (Union[str, Path]): The file being processed (a PDF, a report or a database).
+    """
+    if not _hooks:
+        yield
+        return
+
+    _nested.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        nested = _nested.pop()
+        if _nested:
+            _nested[-1] += elapsed
+        emit([StageTiming(str(file), stage, elapsed - nested)])
+
+
+class TimingRecorder:
+    """
+    Hook collecting every StageTiming. Used as a context manager, it is registered while the block runs.
+
+    Example:
+        with TimingRecorder() as recorder:
+            data.measurements_with_chainage
+        print(recorder.summary())
+    """
+
+    def __init__(self) -> None:
+        self.timings: List[StageTiming] = []
+
+    def __call__(self, timing: StageTiming) -> None:
+        self.timings.append(timing)
+
+    def __enter__(self) -> "TimingRecorder":
+        add_hook(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        remove_hook(self)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns:
+            Dict[str, Dict[str, float]]: Number of files, total, mean and maximum seconds per file of every stage.
+        """
+        per_file: Dict[str, Dict[str, float]] = {}
+        for timing in self.timings:
+            files = per_file.setdefault(timing.stage, {})
+            files[timing.file] = files.get(timing.file, 0.0) + timing.seconds
+
+        summary = {}
+        for stage in sorted(per_file, key=lambda stage: STAGES.index(stage) if stage in STAGES else len(STAGES)):
+            seconds = list(per_file[stage].values())
+            summary[stage] = {
+                "files": len(seconds),
+                "total_s": sum(seconds),
+                "mean_s": sum(seconds) / len(seconds),
+                "max_s": max(seconds),
+            }
+        return summary
+
+    def to_json(self, file_path: Union[str, Path]) -> None:
+        """
+        Write the summary and every recorded timing to a JSON file.
+        """
+        report = {"stages": self.summary(), "timings": [timing._asdict() for timing in self.timings]}
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
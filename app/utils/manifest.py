@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+from pathlib import Path
+
+OK = "ok"
+DUPLICATE = "duplicate"
+FAILED = "failed"
+DONE = (OK, DUPLICATE)
+
+
+class FileRecord(NamedTuple):
+    path: str
+    size: int
+    mtime: float
+    hash: str
+    key_1: Optional[str]
+    status: str
+    error: Optional[str] = None
+
+
+def file_hash(file_path: Union[str, Path]) -> str:
+    """
+    Returns:
+        str: Hex SHA-256 digest of the contents of a file.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class IngestManifest:
+    """
+    Record of the files ingested into a database, stored as JSON next to it (`<db file>.manifest.json`).
+
+    Every processed file is recorded with its size, modification time, content hash, the key_1 of its run and a status:
+    'ok' once its run is saved in the database, 'duplicate' if its run was already there and 'failed' if it could not
+    be parsed or added. Files recorded as 'ok' or 'duplicate' are skipped on the next ingestion without being parsed;
+    failed files are retried.
+
+    The manifest must only be saved after the database, so a crash in between makes the files of the lost batch be
+    processed again instead of being skipped. The records are ignored if the database does not exist, e.g. after it
+    was deleted, so every file is ingested again.
+    """
+
+    def __init__(self, db_file: Union[str, Path]) -> None:
+        self.db_file: Path = Path(db_file)
+        self.file_path: Path = self.db_file.with_name(f"{self.db_file.name}.manifest.json")
+        self.records: Dict[str, FileRecord] = {}
+        self._hashes: Dict[str, str] = {}
+        self.load()
+
+    def load(self) -> None:
+        """
+        Read the manifest file, if it and the database exist.
+        """
+        self.records = {}
+        if self.file_path.exists() and self.db_file.exists():
+            with open(self.file_path, encoding="utf-8") as file:
+                for record in json.load(file):
+                    self.records[record["path"]] = FileRecord(**record)
+
+    def save(self) -> None:
+        """
+        Write the manifest file, replacing it atomically.
+        """
+        tmp_path = self.file_path.with_name(f".{self.file_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump([record._asdict() for record in self.records.values()], file, indent=1, ensure_ascii=False)
+        os.replace(tmp_path, self.file_path)
+
+    def pending(self, files: Iterable[Union[str, Path]]) -> List[Path]:
+        """
+        Select the files that still have to be ingested.
+
+        A file is skipped if it is recorded as done with the same size and modification time, or if its contents are
+        the same as those of a file recorded as done (e.g. it was moved or copied).
+
+        Args:
+            files (Iterable[Union[str, Path]]): The candidate files.
+
+        Returns:
+            List[Path]: The files that are new, changed or previously failed, in the given order.
+        """
+        done_hashes = {record.hash: record for record in self.records.values() if record.status in DONE}
+
+        pending = []
+        for file in files:
+            path = Path(file).resolve()
+            stat = path.stat()
+            record = self.records.get(str(path))
+            if record is not None and record.status in DONE:
+                if record.size == stat.st_size and record.mtime == stat.st_mtime:
+                    continue
+
+            done = done_hashes.get(self._hash(path))
+            if done is not None:
+                self.records[str(path)] = done._replace(path=str(path), size=stat.st_size, mtime=stat.st_mtime)
+                continue
+            pending.append(path)
+        return pending
+
+    def record(
+        self, file_path: Union[str, Path], status: str, key_1: Optional[str] = None, error: Optional[str] = None
+    ) -> None:
+        """
+        Record the outcome of the ingestion of a file.
+
+        Args:
+            file_path (Union[str, Path]): The file.
+            status (str): OK, DUPLICATE or FAILED.
+            key_1 (Optional[str], optional): key_1 of the run of the file, if it was parsed. Defaults to None.
+            error (Optional[str], optional): Error message of a failed file. Defaults to None.
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        self.records[str(path)] = FileRecord(
+            str(path), stat.st_size, stat.st_mtime, self._hash(path), key_1, status, error
+        )
+
+    def _hash(self, path: Path) -> str:
+        key = str(path)
+        if key not in self._hashes:
+            self._hashes[key] = file_hash(path)
+        return self._hashes[key]
@@ -0,0 +1,189 @@
+from app.models.ASFT_Data import ASFT_Data
+import os
+import shutil
+import uuid
+import pandas as pd
+
+from app.utils.excel_db import INFORMATION_COLUMNS, MEASUREMENT_COLUMNS, information_table, measurements_table
+from app.utils.instrumentation import timed
+from app.utils.storage import Storage
+
+from typing import Dict, List, Set, Tuple, Union
+from pathlib import Path
+
+PARTITION_COLUMNS = ["iata", "year"]
+
+
+class ParquetDatabase(Storage):
+    """
+    Columnar storage of the Information and Measurements tables as two Parquet datasets partitioned by iata and year,
+    under `<db_file>/information` and `<db_file>/measurements`.
+
+    Each session appends new files to the partitions it touches, so the existing data is never rewritten when adding
+    runs. The datasets can be read directly with predicate filtering, e.g.:
+
+        pd.read_parquet("db.parquet/measurements", filters=[("iata", "=", "AEP"), ("year", ">=", 2023)])
+
+    The Information dataset has the columns of `information_table` plus year, and the Measurements dataset has the
+    columns of `measurements_table` plus iata and year.
+    """
+
+    name = "parquet"
+    suffixes = (".parquet",)
+    TABLES = ("information", "measurements")
+
+    def __init__(self, db_file: Union[str, Path]) -> None:
+        super().__init__(db_file)
+        self._keys: Dict[str, Tuple[str, int]] = {}
+        self._pending: Dict[str, Dict[str, pd.DataFrame]] = {}
+        self._deleted: Set[str] = set()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def open(self) -> None:
+        """
+        Read the keys of the stored runs with their partition.
+        """
+        self._pending = {}
+        self._deleted = set()
+        self._keys = {}
+        path = self.file_path / "information"
+        if path.exists():
+            keys = pd.read_parquet(path, columns=["key_1", *PARTITION_COLUMNS])
+            for key, iata, year in keys.itertuples(index=False):
+                self._keys[key] = (str(iata), int(year))
+
+    def add(self, data: ASFT_Data) -> None:
+        """
+        Stage the Measurements and Information rows of a run, to be written on `save`.
+
+        Args:
+            data (ASFT_Data): The run to add.
+
+        Raises:
+            Exception: If the key of the run already exists in the database.
+        """
+        if data.key_1 in self._keys:
+            raise Exception("The key already exists in the database.")
+
+        partition = {"iata": data.iata, "year": data.date.year}
+        self._pending[data.key_1] = {
+            "information": information_table(data).assign(**partition),
+            "measurements": measurements_table(data).assign(**partition),
+        }
+        self._keys[data.key_1] = (data.iata, data.date.year)
+
+    def delete(self, key: str) -> None:
+        """
+        Stage the deletion of the Measurements and Information rows of a run, applied on `save` by rewriting its
+        partition.
+
+        Args:
+            key (str): key_1 of the run.
+
+        Raises:
+            Exception: If the key does not exist in the database.
+        """
+        if key not in self._keys:
+            raise Exception("The key does not exist in the database.")
+
+        if self._pending.pop(key, None) is None:
+            self._deleted.add(key)
+        del self._keys[key]
+
+    def information(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: The Information table.
+        """
+        return self._read("information")
+
+    def measurements(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: The Measurements table.
+        """
+        return self._read("measurements")
+
+    def save(self) -> None:
+        """
+        Rewrite the partitions holding deleted runs and append the staged runs as new files.
+        """
+        with timed("save", self.file_path):
+            if self._deleted:
+                self._delete_from_partitions()
+
+            for table in self.TABLES:
+                frames = [tables[table] for tables in self._pending.values()]
+                if frames:
+                    pd.concat(frames, ignore_index=True).to_parquet(
+                        self.file_path / table, partition_cols=PARTITION_COLUMNS, index=False
+                    )
+        self._pending = {}
+        self._deleted = set()
+
+    def close(self) -> None:
+        """
+        Discard the staged changes.
+        """
+        self._pending = {}
+        self._deleted = set()
+
+    def _read(self, table: str) -> pd.DataFrame:
+        """
+        Read a whole dataset with the columns in the same order as the other backends, dropping the partition columns
+        that are not part of the table. Staged changes are not included.
+        """
+        columns = INFORMATION_COLUMNS if table == "information" else MEASUREMENT_COLUMNS
+        path = self.file_path / table
+        if not path.exists():
+            return pd.DataFrame(columns=columns)
+        df = pd.read_parquet(path)
+        if table == "information":
+            df["iata"] = df["iata"].astype(str)
+        # Partition columns are read back last.
+        return df[columns]
+
+    def _delete_from_partitions(self) -> None:
+        """
+        Rewrite the partitions holding deleted runs without their rows.
+
+        Each partition is written to a hidden temporary directory next to it, which the Parquet readers ignore, and
+        swapped in with `os.replace` once it is complete, so a failure while writing leaves the partition as it was.
+        """
+        information = pd.read_parquet(self.file_path / "information", columns=["key_1", *PARTITION_COLUMNS])
+        information = information[information["key_1"].isin(self._deleted)]
+        partitions: List[Tuple[str, int]] = sorted({(str(iata), int(year)) for _, iata, year in information.values})
+
+        for table in self.TABLES:
+            for iata, year in partitions:
+                path = self.file_path / table / f"iata={iata}" / f"year={year}"
+                df = pd.read_parquet(path)
+                df = df[~df["key_1"].isin(self._deleted)]
+
+                tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+                old_path = path.with_name(f".{path.name}.{os.getpid()}.old")
+                shutil.rmtree(tmp_path, ignore_errors=True)
+                try:
+                    tmp_path.mkdir()
+                    if not df.empty:
+                        df.to_parquet(tmp_path / f"{uuid.uuid4().hex}.parquet", index=False)
+                except BaseException:
+                    shutil.rmtree(tmp_path, ignore_errors=True)
+                    raise
+
+                os.replace(path, old_path)
+                if df.empty:
+                    tmp_path.rmdir()
+                else:
+                    os.replace(tmp_path, path)
+                shutil.rmtree(old_path)
+
+                # Remove the directories left empty, as pyarrow cannot read a dataset without files.
+                for directory in (path.parent, path.parent.parent):
+                    if not any(directory.iterdir()):
+                        directory.rmdir()
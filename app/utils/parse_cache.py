@@ -0,0 +1,159 @@
+import hashlib
+import os
+import shutil
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+# pandas is only imported to read an entry, so managing the cache does not pay for it.
+if TYPE_CHECKING:
+    import pandas as pd
+
+PARSER_VERSION = "1"
+DEFAULT_CACHE_DIR = Path(os.environ.get("AA2K_CACHE_DIR", Path.home() / ".cache" / "aa2k"))
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ParseCache:
+    """
+    Content-addressed on-disk cache for the tables extracted from ASFT PDF reports.
+
+    Entries are keyed by the SHA-256 of the PDF bytes together with PARSER_VERSION and the parser backend, so a renamed
+    or moved file still hits the cache and a change in the extraction logic invalidates every entry. Each entry is a
+    directory holding one Parquet file per table. When the cache grows over `max_bytes`, the least recently used
+    entries are evicted.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.cache_dir: Path = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        self.max_bytes: int = max_bytes
+
+    def key(self, file_path: Union[str, Path], namespace: str = "") -> str:
+        """
+        Compute the cache key of a PDF file.
+
+        Args:
+            file_path (Union[str, Path]): Path to the PDF file.
+            namespace (str, optional): Extra string mixed into the key, e.g. the parser backend name and version, so
+                tables extracted by different backends do not collide. Defaults to "".
+
+        Returns:
+            str: Hex digest of the file contents, the parser version and the namespace.
+        """
+        digest = hashlib.sha256(f"{PARSER_VERSION}:{namespace}".encode())
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, key: str, section: str) -> Optional["pd.DataFrame"]:
+        """
+        Retrieve a cached table and mark its entry as recently used.
+
+        Args:
+            key (str): Cache key of the PDF file, as returned by `key`.
+            section (str): Name of the table (e.g. "measurements").
+
+        Returns:
+            Optional[pd.DataFrame]: The cached table, or None if it is not in the cache.
+        """
+        import pandas as pd
+
+        path = self.cache_dir / key / f"{section}.parquet"
+        # The entry may be evicted by another process at any time, which is a cache miss.
+        try:
+            os.utime(path.parent)
+            return pd.read_parquet(path)
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, tables: Dict[str, "pd.DataFrame"]) -> None:
+        """
+        Store the tables of a PDF file and evict old entries if the cache is over its size limit.
+
+        Args:
+            key (str): Cache key of the PDF file, as returned by `key`.
+            tables (Dict[str, pd.DataFrame]): Tables to store, by section name.
+        """
+        entry = self.cache_dir / key
+        entry.mkdir(parents=True, exist_ok=True)
+        for section, df in tables.items():
+            tmp_path = entry / f".{section}.{os.getpid()}.tmp"
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, entry / f"{section}.parquet")
+        self._evict(keep=key)
+
+    def invalidate(self, file_path: Union[str, Path], namespace: str = "") -> bool:
+        """
+        Remove the cached tables of a PDF file.
+
+        Args:
+            file_path (Union[str, Path]): Path to the PDF file.
+            namespace (str, optional): Namespace the entry was stored under. Defaults to "".
+
+        Returns:
+            bool: True if an entry was removed, False if the file was not cached.
+        """
+        entry = self.cache_dir / self.key(file_path, namespace)
+        if not entry.exists():
+            return False
+        shutil.rmtree(entry, ignore_errors=True)
+        return True
+
+    def clear(self) -> int:
+        """
+        Remove every entry from the cache.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        entries = self._entries()
+        for entry, _, _ in entries:
+            shutil.rmtree(entry, ignore_errors=True)
+        return len(entries)
+
+    def size(self) -> int:
+        """
+        Returns:
+            int: Total size of the cache in bytes.
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def _entries(self) -> List[Tuple[Path, int, float]]:
+        """
+        List the cache entries with their size and last use time.
+
+        Returns:
+            List[Tuple[Path, int, float]]: (entry directory, size in bytes, last use timestamp) for every entry.
+        """
+        if not self.cache_dir.exists():
+            return []
+
+        entries = []
+        for entry in self.cache_dir.iterdir():
+            # Other processes may write or evict entries meanwhile: skip the entries that vanish while listed.
+            try:
+                if not entry.is_dir():
+                    continue
+                size = sum(file.stat().st_size for file in entry.iterdir() if file.is_file())
+                entries.append((entry, size, entry.stat().st_mtime))
+            except OSError:
+                continue
+        return entries
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """
+        Remove the least recently used entries until the cache fits in `max_bytes`.
+
+        Args:
+            keep (Optional[str], optional): Key of an entry that must not be evicted. Defaults to None.
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for entry, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
@@ -1,9 +1,10 @@
 from app.models.ASFT_Data import ASFT_Data
 from app.utils.functions.excel_functions import (
-    write_column_to_excel,
+    write_block_to_excel,
     merge_columns_into_thirds,
     merge_rows_in_range,
 )
+from app.utils.instrumentation import timed
 from app.utils.functions.report_functions import (
     validate_attributes,
     validate_lengths,
@@ -15,6 +16,8 @@ from app.utils.functions.report_functions import (
 )
 
 from pathlib import Path
+from typing import Optional
+import pandas as pd
 
 
 from openpyxl.worksheet.worksheet import Worksheet
@@ -23,6 +26,7 @@ from openpyxl.worksheet.worksheet import Worksheet
 START_ROW = 11
 START_COL = 2
 MERGE_RANGE = 10
+REPORT_ATTRIBUTES = ["iata", "runway", "numbering", "separation", "equipment", "tyre_type"]
 
 
 def populate_header_data(L: ASFT_Data, R: ASFT_Data, ws: Worksheet) -> None:
@@ -50,48 +54,64 @@ def populate_header_data(L: ASFT_Data, R: ASFT_Data, ws: Worksheet) -> None:
     ws["H8"] = R.date.time()
 
 
-def write_report_no_chainage(L: ASFT_Data, R: ASFT_Data, output_folder: str) -> None:
-    validate_attributes(L, R, ["iata", "runway", "numbering", "separation", "equipment", "tyre_type"])
+def write_report_no_chainage(L: ASFT_Data, R: ASFT_Data, output_folder: str, name: Optional[str] = None) -> None:
+    validate_attributes(L, R, REPORT_ATTRIBUTES)
     validate_lengths(L, R)
 
-    L.measurements["Average Friction 100m"] = friction_interval_mean(L.measurements, "Friction")
-    L.measurements["Thirds"] = friction_thirds(L)
-    R.measurements["Average Friction 100m"] = friction_interval_mean(R.measurements, "Friction")
-    R.measurements["Thirds"] = friction_thirds(R)
+    L_measurements = L.measurements
+    R_measurements = R.measurements
+    L_measurements["Average Friction 100m"] = friction_interval_mean(L_measurements, "Friction")
+    L_measurements["Thirds"] = friction_thirds(L)
+    R_measurements["Average Friction 100m"] = friction_interval_mean(R_measurements, "Friction")
+    R_measurements["Thirds"] = friction_thirds(R)
 
-    name = get_file_name(L)
+    title = get_file_name(L)
+    name = name or title
 
-    wb, ws = setup_workbook("app/templates/report_template_without_chainage.xlsx", name)
+    with timed("render", name):
+        wb, ws = setup_workbook("report_template_without_chainage.xlsx", title)
 
-    populate_header_data(L, R, ws)
+        populate_header_data(L, R, ws)
 
-    write_column_to_excel(ws, START_ROW, "B", L.measurements["Distance"], format="General")
-    write_column_to_excel(ws, START_ROW, "C", L.measurements["Friction"], format="0.00")
-    write_column_to_excel(ws, START_ROW, "D", L.measurements["Average Friction 100m"], format="0.00")
-    write_column_to_excel(ws, START_ROW, "E", L.measurements["Thirds"], format="0.00")
-    write_column_to_excel(ws, START_ROW, "F", R.measurements["Distance"], format="General")
-    write_column_to_excel(ws, START_ROW, "G", R.measurements["Friction"], format="0.00")
-    write_column_to_excel(ws, START_ROW, "H", R.measurements["Average Friction 100m"], format="0.00")
-    write_column_to_excel(ws, START_ROW, "I", R.measurements["Thirds"], format="0.00")
+        block = pd.DataFrame(
+            {
+                "B": L_measurements["Distance"],
+                "C": L_measurements["Friction"],
+                "D": L_measurements["Average Friction 100m"],
+                "E": L_measurements["Thirds"],
+                "F": R_measurements["Distance"],
+                "G": R_measurements["Friction"],
+                "H": R_measurements["Average Friction 100m"],
+                "I": R_measurements["Thirds"],
+            }
+        )
+        formats = {**dict.fromkeys(block.columns, "0.00"), "B": "General", "F": "General"}
+        write_block_to_excel(ws, START_ROW, "B", block, formats)
 
-    merge_rows_in_range(len(L), "D", ws, START_ROW, MERGE_RANGE)
-    merge_rows_in_range(len(R), "H", ws, START_ROW, MERGE_RANGE)
+        merge_rows_in_range(len(L), "D", ws, START_ROW, MERGE_RANGE)
+        merge_rows_in_range(len(R), "H", ws, START_ROW, MERGE_RANGE)
 
-    merge_columns_into_thirds(len(L), "E", ws, START_ROW)
-    merge_columns_into_thirds(len(R), "I", ws, START_ROW)
+        merge_columns_into_thirds(len(L), "E", ws, START_ROW)
+        merge_columns_into_thirds(len(R), "I", ws, START_ROW)
 
-    center_and_bold_cells(ws, START_ROW, START_COL)
+        center_and_bold_cells(ws, START_ROW, START_COL, START_ROW + len(block) - 1, START_COL + len(block.columns) - 1)
 
     output_folder_path = Path(output_folder)
     output_file_path = output_folder_path / f"Datos {name}.xlsx"
 
-    wb.save(str(output_file_path))
+    with timed("save", output_file_path):
+        wb.save(str(output_file_path))
 
 
 def write_report_with_chainage(
-    L: ASFT_Data, R: ASFT_Data, runway_length: int, starting_point: int, output_folder: str
+    L: ASFT_Data,
+    R: ASFT_Data,
+    runway_length: int,
+    starting_point: int,
+    output_folder: str,
+    name: Optional[str] = None,
 ) -> None:
-    validate_attributes(L, R, ["iata", "runway", "numbering", "separation", "equipment", "tyre_type"])
+    validate_attributes(L, R, REPORT_ATTRIBUTES)
     validate_lengths(L, R)
 
     L.runway_length = runway_length
@@ -111,30 +131,39 @@ def write_report_with_chainage(
     R_chainage["Average Friction 100m"] = friction_interval_mean(R_chainage, "Friction")
     R_chainage["Thirds"] = friction_thirds(R)
 
-    name = get_file_name(L)
+    title = get_file_name(L)
+    name = name or title
 
-    wb, ws = setup_workbook("app/templates/report_template_with_chainage.xlsx", name)
+    with timed("render", name):
+        wb, ws = setup_workbook("report_template_with_chainage.xlsx", title)
 
-    populate_header_data(L, R, ws)
+        populate_header_data(L, R, ws)
 
-    write_column_to_excel(ws, START_ROW, "B", L_chainage["Chainage"], format="General")
-    write_column_to_excel(ws, START_ROW, "C", L_chainage["Distance"], format="General")
-    write_column_to_excel(ws, START_ROW, "D", L_chainage["Friction"], format="0.00")
-    write_column_to_excel(ws, START_ROW, "E", L_chainage["Average Friction 100m"], format="0.00")
-    write_column_to_excel(ws, START_ROW, "F", L_chainage["Thirds"], format="0.00")
-    write_column_to_excel(ws, START_ROW, "G", R_chainage["Friction"], format="0.00")
-    write_column_to_excel(ws, START_ROW, "H", R_chainage["Average Friction 100m"], format="0.00")
-    write_column_to_excel(ws, START_ROW, "I", R_chainage["Thirds"], format="0.00")
+        block = pd.DataFrame(
+            {
+                "B": L_chainage["Chainage"],
+                "C": L_chainage["Distance"],
+                "D": L_chainage["Friction"],
+                "E": L_chainage["Average Friction 100m"],
+                "F": L_chainage["Thirds"],
+                "G": R_chainage["Friction"],
+                "H": R_chainage["Average Friction 100m"],
+                "I": R_chainage["Thirds"],
+            }
+        )
+        formats = {**dict.fromkeys(block.columns, "0.00"), "B": "General", "C": "General"}
+        write_block_to_excel(ws, START_ROW, "B", block, formats)
 
-    merge_rows_in_range(len(L), "E", ws, START_ROW, MERGE_RANGE)
-    merge_rows_in_range(len(R), "H", ws, START_ROW, MERGE_RANGE)
+        merge_rows_in_range(len(L), "E", ws, START_ROW, MERGE_RANGE)
+        merge_rows_in_range(len(R), "H", ws, START_ROW, MERGE_RANGE)
 
-    merge_columns_into_thirds(len(L), "F", ws, START_ROW)
-    merge_columns_into_thirds(len(R), "I", ws, START_ROW)
+        merge_columns_into_thirds(len(L), "F", ws, START_ROW)
+        merge_columns_into_thirds(len(R), "I", ws, START_ROW)
 
-    center_and_bold_cells(ws, START_ROW, START_COL)
+        center_and_bold_cells(ws, START_ROW, START_COL, START_ROW + len(block) - 1, START_COL + len(block.columns) - 1)
 
     output_folder_path = Path(output_folder)
     output_file_path = output_folder_path / f"Datos {name}.xlsx"
 
-    wb.save(str(output_file_path))
+    with timed("save", output_file_path):
+        wb.save(str(output_file_path))
@@ -0,0 +1,186 @@
+from app.models.ASFT_Data import ASFT_Data
+import datetime
+import sqlite3
+import numpy as np
+import pandas as pd
+
+from app.utils.excel_db import information_table, measurements_table
+from app.utils.instrumentation import timed
+from app.utils.storage import Storage
+
+from typing import Any, List, Optional, Tuple, Union
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS information (
+    "key_1" TEXT PRIMARY KEY,
+    "key_2" TEXT,
+    "date" TIMESTAMP,
+    "iata" TEXT,
+    "numbering" TEXT,
+    "side" TEXT,
+    "separation" INTEGER,
+    "runway" TEXT,
+    "average speed" INTEGER,
+    "fric_A" REAL,
+    "fric_B" REAL,
+    "fric_C" REAL,
+    "runway length" INTEGER,
+    "starting point" INTEGER,
+    "equipment" TEXT,
+    "pilot" TEXT,
+    "ice level" INTEGER,
+    "tyre pressure" REAL,
+    "water film" TEXT,
+    "system distance" REAL,
+    "operator" TEXT,
+    "temperature" INTEGER,
+    "surface condition" TEXT,
+    "weather" TEXT,
+    "runway material" TEXT
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    "key_1" TEXT NOT NULL,
+    "chainage" INTEGER,
+    "distance" INTEGER,
+    "friction" REAL,
+    "speed" INTEGER,
+    "av. friction 100m" REAL,
+    "color code" TEXT
+);
+CREATE INDEX IF NOT EXISTS measurements_key_1 ON measurements ("key_1");
+CREATE INDEX IF NOT EXISTS information_iata ON information ("iata");
+CREATE INDEX IF NOT EXISTS information_runway ON information ("runway");
+CREATE INDEX IF NOT EXISTS information_date ON information ("date");
+"""
+
+
+class SQLiteDatabase(Storage):
+    """
+    SQLite storage of the Information and Measurements tables.
+
+    Every change made in a session is part of a single transaction, committed by `save`, so a batch of runs is
+    inserted all at once or not at all.
+
+    Example:
+        with SQLiteDatabase("db.sqlite") as db:
+            for data in runs:
+                db.add(data)
+    """
+
+    name = "sqlite"
+    suffixes = (".sqlite", ".sqlite3", ".db")
+
+    def __init__(self, db_file: Union[str, Path]) -> None:
+        super().__init__(db_file)
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def __contains__(self, key: str) -> bool:
+        row = self._execute('SELECT 1 FROM information WHERE "key_1" = ?', (key,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self._execute("SELECT COUNT(*) FROM information").fetchone()[0]
+
+    def open(self) -> None:
+        """
+        Connect to the database, creating the tables and indexes if they do not exist.
+        """
+        self._connection = sqlite3.connect(self.file_path)
+        self._connection.executescript(SCHEMA)
+
+    def add(self, data: ASFT_Data) -> None:
+        """
+        Insert the Measurements and Information rows of a run.
+
+        Args:
+            data (ASFT_Data): The run to add.
+
+        Raises:
+            Exception: If the key of the run already exists in the database.
+        """
+        if data.key_1 in self:
+            raise Exception("The key already exists in the database.")
+
+        self._insert("measurements", measurements_table(data))
+        self._insert("information", information_table(data))
+
+    def delete(self, key: str) -> None:
+        """
+        Delete the Measurements and Information rows of a run.
+
+        Args:
+            key (str): key_1 of the run.
+
+        Raises:
+            Exception: If the key does not exist in the database.
+        """
+        if key not in self:
+            raise Exception("The key does not exist in the database.")
+
+        self._execute('DELETE FROM measurements WHERE "key_1" = ?', (key,))
+        self._execute('DELETE FROM information WHERE "key_1" = ?', (key,))
+
+    def information(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: The Information table.
+        """
+        df = pd.read_sql_query("SELECT * FROM information ORDER BY rowid", self._checked_connection())
+        df["date"] = pd.to_datetime(df["date"])
+        return df
+
+    def measurements(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: The Measurements table.
+        """
+        return pd.read_sql_query("SELECT * FROM measurements ORDER BY rowid", self._checked_connection())
+
+    def save(self) -> None:
+        """
+        Commit the transaction of the session.
+        """
+        with timed("save", self.file_path):
+            self._checked_connection().commit()
+
+    def close(self) -> None:
+        """
+        Close the connection, rolling back uncommitted changes.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _checked_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            raise Exception("The database is not open.")
+        return self._connection
+
+    def _execute(self, sql: str, parameters: Tuple = ()) -> sqlite3.Cursor:
+        return self._checked_connection().execute(sql, parameters)
+
+    def _insert(self, table: str, dataframe: pd.DataFrame) -> None:
+        """
+        Insert the rows of a DataFrame in a single executemany.
+        """
+        columns = ", ".join(f'"{column}"' for column in dataframe.columns)
+        placeholders = ", ".join("?" for _ in dataframe.columns)
+        self._checked_connection().executemany(
+            f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", _sql_rows(dataframe)
+        )
+
+
+def _sql_value(value: Any) -> Any:
+    """
+    Convert a value to a type supported by sqlite3.
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(sep=" ")
+    return value
+
+
+def _sql_rows(dataframe: pd.DataFrame) -> List[Tuple]:
+    return [tuple(_sql_value(value) for value in row) for row in dataframe.itertuples(index=False)]
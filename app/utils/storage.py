@@ -0,0 +1,159 @@
+from abc import ABC, abstractmethod
+from app.models.ASFT_Data import ASFT_Data
+import pandas as pd
+
+from typing import List, Tuple, Union
+from pathlib import Path
+
+
+class Storage(ABC):
+    """
+    Base class of the database backends.
+
+    A storage is a write session over a database file holding the Information and Measurements tables built by
+    `app.utils.excel_db.information_table` and `app.utils.excel_db.measurements_table`. Used as a context manager, the
+    changes are only saved if the block exits without an exception.
+
+    Subclasses must define `name`, the file `suffixes` they handle and implement every abstract method.
+    """
+
+    name: str = ""
+    suffixes: Tuple[str, ...] = ()
+
+    def __init__(self, db_file: Union[str, Path]) -> None:
+        self.file_path: Path = Path(db_file)
+
+    def __enter__(self) -> "Storage":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is None:
+                self.save()
+        finally:
+            self.close()
+
+    @abstractmethod
+    def __contains__(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def open(self) -> None:
+        """
+        Open the database, creating it if it does not exist.
+        """
+
+    @abstractmethod
+    def add(self, data: ASFT_Data) -> None:
+        """
+        Add the Measurements and Information rows of a run.
+
+        Args:
+            data (ASFT_Data): The run to add.
+
+        Raises:
+            Exception: If the key of the run already exists in the database.
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Delete the Measurements and Information rows of a run.
+
+        Args:
+            key (str): key_1 of the run.
+
+        Raises:
+            Exception: If the key does not exist in the database.
+        """
+
+    def replace(self, data: ASFT_Data) -> None:
+        """
+        Add a run, deleting the rows previously stored under its key if there are any.
+
+        Args:
+            data (ASFT_Data): The run to add.
+        """
+        if data.key_1 in self:
+            self.delete(data.key_1)
+        self.add(data)
+
+    @abstractmethod
+    def information(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: The Information table.
+        """
+
+    @abstractmethod
+    def measurements(self) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: The Measurements table.
+        """
+
+    @abstractmethod
+    def save(self) -> None:
+        """
+        Persist the changes made in the session.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Release the database, discarding unsaved changes.
+        """
+
+
+class StorageGroup(Storage):
+    """
+    Several storages written together, e.g. the Excel database and a Parquet copy for analytics.
+
+    The first storage is the primary one: key lookups and table reads go to it, and it is saved last.
+    """
+
+    def __init__(self, primary: Storage, *mirrors: Storage) -> None:
+        super().__init__(primary.file_path)
+        self.storages: List[Storage] = [primary, *mirrors]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.storages[0]
+
+    def __len__(self) -> int:
+        return len(self.storages[0])
+
+    def open(self) -> None:
+        for storage in self.storages:
+            storage.open()
+
+    def add(self, data: ASFT_Data) -> None:
+        if data.key_1 in self:
+            raise Exception("The key already exists in the database.")
+        for storage in self.storages:
+            storage.replace(data)
+
+    def delete(self, key: str) -> None:
+        if key not in self:
+            raise Exception("The key does not exist in the database.")
+        for storage in self.storages:
+            if key in storage:
+                storage.delete(key)
+
+    def information(self) -> pd.DataFrame:
+        return self.storages[0].information()
+
+    def measurements(self) -> pd.DataFrame:
+        return self.storages[0].measurements()
+
+    def save(self) -> None:
+        for storage in reversed(self.storages):
+            storage.save()
+
+    def close(self) -> None:
+        for storage in self.storages:
+            storage.close()
@@ -0,0 +1,254 @@
+"""
+Benchmark suite timing every stage of the pipeline over the sample corpus (sample/AEP, sample/EQS and sample/RGL).
+
+Each stage reports its wall time, files per second and the peak RSS of the process while the stage runs, sampled
+every few milliseconds from /proc/self/statm. Where /proc is not available the column falls back to the peak RSS of
+the whole process so far (ru_maxrss), which only grows from stage to stage. The results can be written as JSON and
+compared with the results of another version:
+
+    python -m benchmarks.pipeline --output before.json
+    python -m benchmarks.pipeline --output after.json --compare before.json
+"""
+from app.models.ASFT_Data import ASFT_Data
+from app.utils.batch_report import pair_runs
+from app.utils.excel_db import ExcelDatabase, add_data_to_db, information_table, measurements_table
+from app.utils.functions.excel_functions import write_dataframes_to_excel
+from app.utils.report import write_report_no_chainage, write_report_with_chainage
+
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+import datetime
+import json
+import platform
+import resource
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import click
+import pandas as pd
+
+SAMPLE_FOLDERS = ["sample/AEP", "sample/EQS", "sample/RGL"]
+DB_SIZES = [0, 50, 200]
+
+
+class StageResult(NamedTuple):
+    name: str
+    files: int
+    wall_s: float
+    files_per_s: float
+    peak_rss_mb: float
+
+
+SAMPLE_INTERVAL_S = 0.005
+
+
+def peak_rss_mb() -> float:
+    """
+    Returns:
+        float: Peak resident set size of the process so far, in MB (ru_maxrss is in KB on Linux and bytes on macOS).
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def rss_mb() -> Optional[float]:
+    """
+    Returns:
+        Optional[float]: Current resident set size of the process, in MB, or None if /proc/self/statm is not available.
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as file:
+            pages = int(file.read().split()[1])
+    except OSError:
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+
+class RssSampler:
+    """
+    Samples the RSS of the process in a background thread while the block runs and keeps the highest value.
+    """
+
+    def __init__(self) -> None:
+        self.peak_mb: Optional[float] = rss_mb()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def __enter__(self) -> "RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._done.set()
+        self._thread.join()
+        self._update()
+
+    def _sample(self) -> None:
+        while not self._done.wait(SAMPLE_INTERVAL_S):
+            self._update()
+
+    def _update(self) -> None:
+        current = rss_mb()
+        if current is not None and (self.peak_mb is None or current > self.peak_mb):
+            self.peak_mb = current
+
+
+def run_stage(name: str, items: List, function: Callable, files: Optional[int] = None) -> StageResult:
+    """
+    Time `function` over every item and sample the peak RSS while it runs. `files` is the number of files processed,
+    when it differs from the items.
+    """
+    with RssSampler() as sampler:
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        wall = time.perf_counter() - start
+    files = len(items) if files is None else files
+    peak = sampler.peak_mb if sampler.peak_mb is not None else peak_rss_mb()
+    result = StageResult(name, files, wall, files / wall if wall else 0.0, peak)
+    print(
+        f"{name:<40} {files:>5} files {wall:>9.3f} s {result.files_per_s:>9.1f} files/s {result.peak_rss_mb:>8.1f} MB"
+    )
+    return result
+
+
+def set_chainage(L: ASFT_Data, R: ASFT_Data) -> Tuple[int, int]:
+    """
+    Runway length and starting point that fit the measurements of a pair, 100 m longer than the longest run.
+    """
+    runway_length = 10 * max(len(L), len(R)) + 100
+    starting_point = runway_length - 10 if int(L.numbering) > 18 else 10
+    for data in (L, R):
+        data.runway_length = runway_length
+        data.starting_point = starting_point
+        data.weather = "Bueno"
+        data.runway_material = "Asfalto"
+        data.operator = "benchmark"
+        data.temperature = 20
+        data.surface_condition = "Seco"
+    return runway_length, starting_point
+
+
+def prefill_db(db_file: Path, runs: List[ASFT_Data], size: int) -> None:
+    """
+    Write a database holding `size` runs, copies of the sample runs under new keys.
+    """
+    if not runs or not size:
+        return
+
+    measurements, information = [], []
+    for n in range(size):
+        data = runs[n % len(runs)]
+        key = f"{data.key_1}-{n}"
+        measurements.append(measurements_table(data).assign(key_1=key))
+        information.append(information_table(data).assign(key_1=key))
+    write_dataframes_to_excel({"Measurements": pd.concat(measurements), "Information": pd.concat(information)}, db_file)
+
+
+def git_version() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def benchmark(folders: List[str], db_sizes: List[int]) -> List[StageResult]:
+    pdfs = sorted(str(pdf) for folder in folders for pdf in Path(folder).glob("*.pdf"))
+    results: List[StageResult] = []
+
+    tables: Dict[str, Dict[str, pd.DataFrame]] = {}
+
+    def construct(pdf: str) -> None:
+        tables[pdf] = ASFT_Data(pdf).tables
+
+    results.append(run_stage("parse (ASFT_Data)", pdfs, construct))
+
+    runs = [ASFT_Data(pdf, tables=tables[pdf]) for pdf in pdfs]
+    results.append(run_stage("derive (measurements)", runs, lambda data: data.measurements))
+
+    pairs, _, _ = pair_runs(runs)
+    runs_by_file = {str(data.file_path): data for data in runs}
+    pair_runs_list = [(runs_by_file[pair.left_file], runs_by_file[pair.right_file]) for pair in pairs]
+    for L, R in pair_runs_list:
+        set_chainage(L, R)
+    paired = [data for pair in pair_runs_list for data in pair]
+    results.append(
+        run_stage("align (measurements_with_chainage)", paired, lambda data: data.measurements_with_chainage)
+    )
+
+    averages = [(data, data.measurements["Av. Friction 100m"]) for data in runs]
+    results.append(run_stage("color (_color_assignment)", averages, lambda item: item[0]._color_assignment(item[1])))
+
+    with tempfile.TemporaryDirectory() as output_folder:
+
+        def with_chainage(pair: Tuple[ASFT_Data, ASFT_Data]) -> None:
+            L, R = pair
+            write_report_with_chainage(L, R, L.runway_length, L.starting_point, output_folder)
+
+        def no_chainage(pair: Tuple[ASFT_Data, ASFT_Data]) -> None:
+            write_report_no_chainage(*pair, output_folder)
+
+        results.append(run_stage("render (report with chainage)", pair_runs_list, with_chainage, 2 * len(pairs)))
+        results.append(run_stage("render (report no chainage)", pair_runs_list, no_chainage, 2 * len(pairs)))
+
+        for size in db_sizes:
+            db_file = Path(output_folder) / f"db_{size}.xlsx"
+            prefill_db(db_file, paired, size)
+            results.append(
+                run_stage(f"save (add_data_to_db, {size} runs)", paired, lambda data: add_data_to_db(data, db_file))
+            )
+
+        db_file = Path(output_folder) / "db_session.xlsx"
+
+        def session(items: List[ASFT_Data]) -> None:
+            with ExcelDatabase(db_file) as db:
+                for data in items:
+                    db.add(data)
+
+        results.append(run_stage("save (ExcelDatabase session)", [paired], session, len(paired)))
+
+    return results
+
+
+def compare(results: List[StageResult], baseline_file: str) -> None:
+    with open(baseline_file, encoding="utf-8") as file:
+        baseline = {stage["name"]: stage for stage in json.load(file)["stages"]}
+    print(f"\nCompared with {baseline_file}:")
+    for result in results:
+        before = baseline.get(result.name)
+        if before is None or not result.wall_s:
+            continue
+        speedup = before["wall_s"] / result.wall_s
+        print(f"{result.name:<40} {before['wall_s']:>9.3f} s -> {result.wall_s:>9.3f} s ({speedup:.2f}x)")
+
+
+@click.command()
+@click.option("--folder", "folders", multiple=True, default=SAMPLE_FOLDERS, show_default=True, help="Sample folders.")
+@click.option("--db-size", "db_sizes", multiple=True, type=int, default=DB_SIZES, show_default=True)
+@click.option("--output", type=click.Path(dir_okay=False), default=None, help="JSON file for the results.")
+@click.option("--compare", "baseline", type=click.Path(exists=True, dir_okay=False), default=None)
+def main(folders, db_sizes, output, baseline):
+    results = benchmark(list(folders), list(db_sizes))
+
+    if output is not None:
+        report = {
+            "version": git_version(),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "stages": [result._asdict() for result in results],
+        }
+        with open(output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if baseline is not None:
+        compare(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Per-report time of writing the measurement columns into the report template, cell by cell with
+write_column_to_excel (before) and in one pass with write_block_to_excel (after), with the number formats of the
+reports and with a font and number format per column.
+
+Usage:
+    python -m benchmarks.report_writer [--rows 250] [--repeat 20]
+"""
+from app.utils.functions.excel_functions import write_block_to_excel, write_column_to_excel
+from app.utils.functions.report_functions import setup_workbook
+from app.utils.report import START_ROW
+
+import time
+import click
+import numpy as np
+import pandas as pd
+from openpyxl.styles import Font
+
+TEMPLATE = "report_template_without_chainage.xlsx"
+FORMATS = {**dict.fromkeys("BCDEFGHI", "0.00"), "B": "General", "F": "General"}
+FONT_FORMATS = dict.fromkeys("BCDEFGHI", {"number_format": "0.000", "font": Font(bold=True, color="FF0000")})
+
+
+def report_block(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    distance = np.arange(10, 10 * rows + 1, 10)
+    friction = rng.uniform(0.3, 1.0, rows).round(2)
+    return pd.DataFrame(
+        {
+            "B": distance,
+            "C": friction,
+            "D": friction.mean(),
+            "E": friction.mean(),
+            "F": distance,
+            "G": friction[::-1],
+            "H": friction.mean(),
+            "I": friction.mean(),
+        }
+    )
+
+
+def write_by_column(ws, block: pd.DataFrame, formats: dict) -> None:
+    for column in block.columns:
+        write_column_to_excel(ws, START_ROW, column, block[column], format=formats[column])
+
+
+def write_by_block(ws, block: pd.DataFrame, formats: dict) -> None:
+    write_block_to_excel(ws, START_ROW, "B", block, formats)
+
+
+def time_writer(writer, block: pd.DataFrame, formats: dict, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        _, ws = setup_workbook(TEMPLATE, "benchmark")
+        start = time.perf_counter()
+        writer(ws, block, formats)
+        times.append(time.perf_counter() - start)
+    return float(np.median(times))
+
+
+@click.command()
+@click.option("--rows", default=250, help="Measurement rows per report.")
+@click.option("--repeat", default=20, help="Reports written per writer.")
+def main(rows, repeat):
+    block = report_block(rows)
+    for label, formats in (("report number formats", FORMATS), ("font and number format", FONT_FORMATS)):
+        before = time_writer(write_by_column, block, formats, repeat)
+        after = time_writer(write_by_block, block, formats, repeat)
+        print(label)
+        print(f"  write_column_to_excel x {len(block.columns)}: {before * 1000:.2f} ms per report")
+        print(f"  write_block_to_excel:      {after * 1000:.2f} ms per report ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
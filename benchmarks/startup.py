@@ -0,0 +1,88 @@
+"""
+Startup-time check of the CLI entry points.
+
+Each command is run with --help in a fresh interpreter, which reports its wall time and the heavy dependencies it
+imported. Printing the help must not import any of HEAVY_MODULES; the check fails if one does:
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --repeat 10 --output startup.json
+"""
+from typing import List, NamedTuple, Optional
+import json
+import statistics
+import subprocess
+import sys
+import time
+import click
+
+ENTRY_POINTS = [
+    "app.cli.create_db",
+    "app.cli.create_reports",
+    "app.cli.create_report_no_chainage",
+    "app.cli.create_report_with_chainage",
+    "app.cli.export_db",
+    "app.cli.manage_cache",
+    "app.cli.check_parsers",
+]
+HEAVY_MODULES = ["camelot", "cv2", "pdfminer", "pandas", "numpy", "openpyxl", "pyarrow"]
+
+# Runs the entry point like `python -m`, then prints the heavy modules it imported on exit.
+PROBE = """
+import atexit, runpy, sys
+heavy = {heavy!r}
+atexit.register(lambda: print("IMPORTED", *[m for m in heavy if m in sys.modules], file=sys.stderr))
+sys.argv = [{module!r}, "--help"]
+runpy.run_module({module!r}, run_name="__main__", alter_sys=True)
+"""
+
+
+class StartupResult(NamedTuple):
+    module: str
+    median_s: float
+    min_s: float
+    imported: List[str]
+
+
+def measure(module: str, repeat: int) -> StartupResult:
+    """
+    Run `python -m <module> --help` `repeat` times.
+    """
+    times = []
+    imported: List[str] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process = subprocess.run(
+            [sys.executable, "-c", PROBE.format(heavy=HEAVY_MODULES, module=module)], capture_output=True, text=True
+        )
+        times.append(time.perf_counter() - start)
+        if process.returncode != 0:
+            raise click.ClickException(f"{module} --help failed:\n{process.stderr}")
+        for line in process.stderr.splitlines():
+            if line.startswith("IMPORTED"):
+                imported = line.split()[1:]
+
+    result = StartupResult(module, statistics.median(times), min(times), imported)
+    print(f"{module:<40} {result.median_s:>7.3f} s {result.min_s:>7.3f} s  {' '.join(imported) or '-'}")
+    return result
+
+
+@click.command()
+@click.option("--module", "modules", multiple=True, default=ENTRY_POINTS, show_default=True, help="Entry points.")
+@click.option("--repeat", type=int, default=5, show_default=True, help="Runs per entry point.")
+@click.option("--output", type=click.Path(dir_okay=False), default=None, help="JSON file for the results.")
+def main(modules, repeat, output: Optional[str]):
+    print(f"{'entry point':<40} {'median':>9} {'min':>9}  heavy imports")
+    results = [measure(module, repeat) for module in modules]
+
+    if output is not None:
+        with open(output, "w", encoding="utf-8") as file:
+            json.dump({"python": sys.version, "entry_points": [result._asdict() for result in results]}, file, indent=2)
+
+    slow = [result.module for result in results if result.imported]
+    if slow:
+        print(f"{len(slow)} entry points import heavy dependencies to print their help: {', '.join(slow)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
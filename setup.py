@@ -6,6 +6,7 @@ setup(
     description="Python app for managing ASFT reports",
     author='Lucas Ariel Tkacz',
     packages=find_packages(),
+    package_data={"app.templates": ["*.xlsx"]},
 )
 
 # pip install -e .
\ No newline at end of file
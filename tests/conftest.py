@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+from app.models.ASFT_Data import ASFT_Data
+from app.utils.functions.util_functions import concurrent_ASFT
+from app.utils.parse_cache import ParseCache
+
+SAMPLE = Path(__file__).resolve().parent.parent / "sample"
+RGL = SAMPLE / "RGL"
+RGL_07_L3 = RGL / "RGL RWY 07 L3_230310_111912.pdf"
+RGL_07_R3 = RGL / "RGL RWY 07 R3_230310_112928.pdf"
+
+
+@pytest.fixture(scope="session")
+def rgl_cache(tmp_path_factory):
+    """
+    Parse cache holding every table of the RGL sample, parsed once per session since camelot takes a few seconds per
+    file.
+    """
+    cache = ParseCache(tmp_path_factory.mktemp("parse_cache"))
+    concurrent_ASFT(sorted(str(pdf) for pdf in RGL.glob("*.pdf")), cache=cache)
+    return cache
+
+
+@pytest.fixture
+def rgl_pair(rgl_cache):
+    """
+    Fresh ASFT_Data objects of the RGL 07 3 m pair (left, right).
+    """
+    return ASFT_Data(RGL_07_L3, rgl_cache), ASFT_Data(RGL_07_R3, rgl_cache)
+
+
+@pytest.fixture
+def db_runs(rgl_pair):
+    """
+    The RGL 07 3 m pair with every value the database tables need.
+    """
+    for data in rgl_pair:
+        data.runway_length = 10 * len(data) + 100
+        data.starting_point = 10
+        data.operator = "test"
+        data.temperature = 20
+        data.surface_condition = "Seco"
+        data.weather = "Bueno"
+        data.runway_material = "Asfalto"
+    return rgl_pair
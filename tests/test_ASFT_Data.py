@@ -0,0 +1,44 @@
+from app.models.ASFT_Data import ASFT_Data, Smoothing
+
+from conftest import RGL_07_L3
+
+
+def test_header(rgl_cache):
+    data = ASFT_Data(RGL_07_L3, rgl_cache)
+    assert data.key_1 == "2303101119RGL07L3"
+    assert (data.iata, data.numbering, data.side, data.separation, data.runway) == ("RGL", "07", "L", 3, "07-25")
+
+
+def test_measurements_copies_do_not_share_data(rgl_cache):
+    data = ASFT_Data(RGL_07_L3, rgl_cache)
+    friction = data.measurements.loc[0, "Friction"]
+
+    measurements = data.measurements
+    measurements.loc[0, "Friction"] = 9.99
+    measurements["Color Code"] = "red"
+
+    assert data.measurements.loc[0, "Friction"] == friction
+    assert (data.measurements["Color Code"] != "red").any()
+
+
+def test_measurements_follow_smoothing(rgl_cache):
+    data = ASFT_Data(RGL_07_L3, rgl_cache)
+    assert list(data.measurements.columns) == ["Distance", "Friction", "Speed", "Av. Friction 100m", "Color Code"]
+    assert data.measurements["Av. Friction 100m"].iloc[0] == 0.0
+
+    data.smoothing = Smoothing(window_size=1)
+    assert (data.measurements["Av. Friction 100m"] == data.measurements["Friction"]).all()
+
+
+def test_header_is_parsed_once_and_reset_with_the_tables(rgl_cache):
+    data = ASFT_Data(RGL_07_L3, rgl_cache)
+    header = data.header
+
+    assert data.header is header
+    assert header.date.strftime(ASFT_Data.DATE_FORMAT) == "23-03-10 11:19:12"
+    for field, value in header._asdict().items():
+        assert getattr(data, field) == value
+
+    data._load_tables({"friction_measure_report": data.friction_measure_report})
+    assert data.header is not header
+    assert data.header == header
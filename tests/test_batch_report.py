@@ -0,0 +1,70 @@
+from conftest import RGL, RGL_07_L3, RGL_07_R3
+
+from app.models.ASFT_Data import ASFT_Data
+from app.utils.batch_report import ReportSettings, batch_reports, pair_runs, write_reports
+
+SETTINGS = ReportSettings("Bueno", "Asfalto", runway_length=3400, starting_point_1=10, starting_point_2=3390)
+
+
+def rgl_runs(cache):
+    return [ASFT_Data(pdf, cache) for pdf in sorted(RGL.glob("*.pdf"))]
+
+
+def test_pair_runs_pairs_left_and_right_runs(rgl_cache):
+    pairs, unpaired, mismatched = pair_runs(rgl_runs(rgl_cache))
+
+    assert sorted(pair.name for pair in pairs) == ["RGL RWY07 3m 2023-03-10", "RGL RWY25 3m 2023-03-10"]
+    for pair in pairs:
+        assert ASFT_Data(pair.left_file, rgl_cache).side == "L"
+        assert ASFT_Data(pair.right_file, rgl_cache).side == "R"
+    assert len(unpaired) == 2
+    assert mismatched == []
+
+
+def test_pair_runs_skips_runs_with_unreadable_header(rgl_cache):
+    tables = ASFT_Data(RGL_07_L3, rgl_cache).tables
+    tables["friction_measure_report"] = tables["friction_measure_report"].assign(Configuration="bogus")
+    broken = ASFT_Data(RGL_07_L3, tables=tables)
+
+    pairs, unpaired, _ = pair_runs(rgl_runs(rgl_cache) + [broken])
+
+    assert len(pairs) == 2
+    assert any(message.startswith(f"{broken.filename}: skipped") for message in unpaired)
+
+
+def test_batch_reports_writes_rgl_reports(rgl_cache, tmp_path):
+    for chainage in (False, True):
+        output_folder = tmp_path / str(chainage)
+        output_folder.mkdir()
+
+        result = batch_reports(rgl_runs(rgl_cache), SETTINGS, output_folder, chainage, rgl_cache, max_workers=2)
+
+        assert result.failed == []
+        assert sorted(result.written) == ["RGL RWY07 3m 2023-03-10", "RGL RWY25 3m 2023-03-10"]
+        assert sorted(path.name for path in output_folder.iterdir()) == [
+            "Datos RGL RWY07 3m 2023-03-10.xlsx",
+            "Datos RGL RWY25 3m 2023-03-10.xlsx",
+        ]
+
+
+def test_pairs_of_the_same_day_get_unique_report_names(rgl_cache, tmp_path):
+    later = []
+    for pdf in (RGL_07_L3, RGL_07_R3):
+        tables = ASFT_Data(pdf, rgl_cache).tables
+        report = tables["friction_measure_report"]
+        date = report["Date and Time"].str.replace("23-03-10 11:", "23-03-10 13:")
+        tables["friction_measure_report"] = report.assign(**{"Date and Time": date})
+        later.append(ASFT_Data(pdf, tables=tables))
+
+    pairs, _, _ = pair_runs(rgl_runs(rgl_cache) + later)
+
+    assert sorted(pair.name for pair in pairs) == [
+        "RGL RWY07 3m 2023-03-10 111912",
+        "RGL RWY07 3m 2023-03-10 131912",
+        "RGL RWY25 3m 2023-03-10",
+    ]
+
+    written, failed = write_reports(pairs, SETTINGS, tmp_path, False, rgl_cache, max_workers=2)
+
+    assert failed == []
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(f"Datos {pair.name}.xlsx" for pair in pairs)
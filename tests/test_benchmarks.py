@@ -0,0 +1,39 @@
+import shutil
+import time
+
+from benchmarks.pipeline import RssSampler, benchmark, rss_mb
+
+from conftest import RGL_07_L3, RGL_07_R3
+
+
+def test_pipeline_benchmark_runs_on_one_pair(tmp_path):
+    for pdf in (RGL_07_L3, RGL_07_R3):
+        shutil.copy(pdf, tmp_path)
+
+    results = benchmark([str(tmp_path)], [0, 2])
+
+    assert [result.name for result in results] == [
+        "parse (ASFT_Data)",
+        "derive (measurements)",
+        "align (measurements_with_chainage)",
+        "color (_color_assignment)",
+        "render (report with chainage)",
+        "render (report no chainage)",
+        "save (add_data_to_db, 0 runs)",
+        "save (add_data_to_db, 2 runs)",
+        "save (ExcelDatabase session)",
+    ]
+    assert all(result.files == 2 for result in results)
+    assert all(result.wall_s > 0 for result in results)
+    assert all(result.peak_rss_mb > 0 for result in results)
+
+
+def test_rss_sampler_reports_the_peak_of_the_block():
+    with RssSampler() as sampler:
+        block = bytearray(64 * 1024 * 1024)
+        block[::4096] = b"x" * len(block[::4096])
+        time.sleep(0.05)
+        del block
+    after = rss_mb()
+
+    assert sampler.peak_mb >= after + 32
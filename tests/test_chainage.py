@@ -0,0 +1,56 @@
+import pandas as pd
+import pytest
+
+from app.models.ASFT_Data import ASFT_Data
+
+from conftest import RGL_07_L3, RGL_07_R3
+
+
+def reference_chainage(data: ASFT_Data) -> pd.DataFrame:
+    """
+    The original row by row alignment of the measurements with the chainage table.
+    """
+    chainage = list(range(0, data.runway_length + 1, 10))
+    if chainage[-1] != data.runway_length:
+        chainage.append(data.runway_length)
+    chainage = pd.DataFrame(chainage, columns=["Chainage"])
+    if 19 <= int(data.numbering) <= 36:
+        chainage = chainage[::-1].reset_index(drop=True)
+
+    start_index = chainage[chainage["Chainage"] == data.starting_point].index[0]
+    measurements = data.measurements
+    for col in measurements.columns:
+        fill = "white" if col == "Color Code" else 0
+        chainage[col] = pd.Series(fill, index=chainage.index, dtype=measurements[col].dtype)
+        for i, value in enumerate(measurements[col]):
+            chainage.at[start_index + i, col] = value
+    return chainage
+
+
+@pytest.mark.parametrize("pdf", [RGL_07_L3, RGL_07_R3])
+@pytest.mark.parametrize("numbering", ["07", "25"])
+def test_measurements_with_chainage_matches_the_reference(rgl_cache, pdf, numbering):
+    data = ASFT_Data(pdf, rgl_cache)
+    data._header = data.header._replace(numbering=numbering)
+    data.runway_length = 10 * len(data) + 105
+    data.starting_point = 20 if numbering == "07" else data.runway_length - 25
+
+    result = data.measurements_with_chainage
+
+    pd.testing.assert_frame_equal(result, reference_chainage(data), check_dtype=False)
+    assert result["Chainage"].iloc[-1] == (data.runway_length if numbering == "07" else 0)
+
+
+def test_measurements_with_chainage_errors(rgl_cache):
+    data = ASFT_Data(RGL_07_L3, rgl_cache)
+    with pytest.raises(ValueError, match="set the runway length"):
+        data.measurements_with_chainage
+
+    data.runway_length = 10 * len(data) + 100
+    data.starting_point = 15
+    with pytest.raises(ValueError, match="not on the chainage table"):
+        data.measurements_with_chainage
+
+    data.starting_point = 200
+    with pytest.raises(ValueError, match="overflows the chainage table"):
+        data.measurements_with_chainage
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+from app.models.color_policy import COLORS, RED, ColorPolicy, classify_friction, color_names
+
+
+def reference_colors(values):
+    """
+    The original per-value color assignment of ASFT_Data, with 'red' propagated through shifted masks.
+    """
+
+    def color_assign(friction_average):
+        if friction_average == 0.0:
+            return "white"
+        elif friction_average < 0.5:
+            return "red"
+        elif friction_average < 0.6:
+            return "yellow"
+        return "green"
+
+    colors = pd.Series(values).apply(color_assign)
+    mask = colors == "red"
+    for i in range(-5, 5):
+        mask |= colors.shift(i) == "red"
+    colors.loc[mask] = "red"
+    return list(colors)
+
+
+def test_classify_friction_matches_the_reference():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        values = rng.choice([0.0, 0.45, 0.5, 0.55, 0.6, 0.8], size=rng.integers(1, 40))
+        assert list(color_names(classify_friction(values))) == reference_colors(values)
+
+
+def test_classify_friction_policy():
+    values = np.array([0.7, 0.7, 0.65, 0.7, 0.7])
+    policy = ColorPolicy(red_below=0.66, yellow_below=0.68, spread_before=1, spread_after=0)
+    assert list(color_names(classify_friction(values, policy))) == ["green", "red", "red", "green", "green"]
+    assert classify_friction(np.array([]), policy).dtype == np.uint8
+
+
+def test_red_is_not_propagated_across_groups():
+    values = np.array([0.8, 0.8, 0.8, 0.4, 0.8, 0.8])
+    groups = np.array([1, 1, 1, 2, 2, 2])
+
+    codes = classify_friction(values, groups=groups)
+
+    assert list(codes == RED) == [False, False, False, True, True, True]
+    assert list(color_names(classify_friction(values))) == ["red"] * 6
+    assert set(COLORS) == {"white", "red", "yellow", "green"}
@@ -0,0 +1,85 @@
+import pytest
+from openpyxl import load_workbook
+
+from app.utils.excel_db import ExcelDatabase, KeyLocation
+
+
+def test_index_is_rebuilt_from_the_sheets(db_runs, tmp_path):
+    L, R = db_runs
+    db_file = tmp_path / "db.xlsx"
+    with ExcelDatabase(db_file) as db:
+        db.add(L)
+        db.add(R)
+
+    wb = load_workbook(db_file)
+    wb.remove(wb[ExcelDatabase.INDEX_SHEET])
+    wb.save(db_file)
+
+    with ExcelDatabase(db_file) as db:
+        assert db.locate(L.key_1) == KeyLocation(2, 1 + L.runway_length // 10 + 1, 2)
+        db.delete(L.key_1)
+        assert db.locate(R.key_1).information_row == 2
+
+
+def test_measurements_without_information_row(db_runs, tmp_path):
+    L, R = db_runs
+    db_file = tmp_path / "db.xlsx"
+    with ExcelDatabase(db_file) as db:
+        db.add(L)
+        db.add(R)
+
+    wb = load_workbook(db_file)
+    wb["Information"].delete_rows(2, 1)
+    wb.save(db_file)
+
+    with pytest.raises(Exception, match=f"{L.key_1} has Measurements rows but no Information row"):
+        with ExcelDatabase(db_file):
+            pass
+
+
+def test_index_is_rebuilt_after_a_sheet_is_sorted(db_runs, tmp_path):
+    L, R = db_runs
+    db_file = tmp_path / "db.xlsx"
+    with ExcelDatabase(db_file) as db:
+        db.add(L)
+        db.add(R)
+
+    wb = load_workbook(db_file)
+    ws = wb["Information"]
+    rows = [[cell.value for cell in row] for row in ws.iter_rows(min_row=2, max_row=3)]
+    for row_idx, values in zip((3, 2), rows):
+        for col_idx, value in enumerate(values, start=1):
+            ws.cell(row_idx, col_idx, value)
+    wb.save(db_file)
+
+    with ExcelDatabase(db_file) as db:
+        db.delete(L.key_1)
+
+    with ExcelDatabase(db_file) as db:
+        assert R.key_1 in db and L.key_1 not in db
+        assert list(db.information()["key_1"]) == [R.key_1]
+        assert set(db.measurements()["key_1"]) == {R.key_1}
+
+
+def test_runs_without_measurements_rows_are_indexed(db_runs, tmp_path):
+    L, R = db_runs
+    db_file = tmp_path / "db.xlsx"
+    with ExcelDatabase(db_file) as db:
+        db.add(L)
+        db.add(R)
+
+    wb = load_workbook(db_file)
+    location = KeyLocation(*[cell.value for cell in wb[ExcelDatabase.INDEX_SHEET][2]][1:])
+    wb["Measurements"].delete_rows(location.first_row, location.last_row - location.first_row + 1)
+    wb.remove(wb[ExcelDatabase.INDEX_SHEET])
+    wb.save(db_file)
+
+    with ExcelDatabase(db_file) as db:
+        assert db.locate(L.key_1) == KeyLocation(None, None, 2)
+        with pytest.raises(Exception, match="already exists"):
+            db.add(L)
+
+    with ExcelDatabase(db_file) as db:
+        assert not db._changed
+        db.delete(L.key_1)
+        assert db.locate(R.key_1) == KeyLocation(2, 1 + R.runway_length // 10 + 1, 2)
@@ -0,0 +1,84 @@
+import os
+import stat
+
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+
+from app.utils.functions.excel_functions import (
+    append_dataframe_to_excel,
+    write_block_to_excel,
+    write_column_to_excel,
+    save_workbook_atomic,
+    write_dataframes_to_excel,
+)
+
+
+def mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_save_workbook_atomic_uses_umask_for_new_files(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        save_workbook_atomic(Workbook(), tmp_path / "new.xlsx")
+    finally:
+        os.umask(umask)
+    assert mode(tmp_path / "new.xlsx") == 0o644
+    assert [path.name for path in tmp_path.iterdir()] == ["new.xlsx"]
+
+
+def test_save_workbook_atomic_keeps_mode_of_replaced_file(tmp_path):
+    excel_file = tmp_path / "shared.xlsx"
+    save_workbook_atomic(Workbook(), excel_file)
+    os.chmod(excel_file, 0o664)
+
+    save_workbook_atomic(Workbook(), excel_file)
+
+    assert mode(excel_file) == 0o664
+
+
+def test_write_dataframes_to_excel(tmp_path):
+    excel_file = tmp_path / "db.xlsx"
+    write_dataframes_to_excel({"Data": pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})}, excel_file)
+
+    ws = load_workbook(excel_file)["Data"]
+    assert [[cell.value for cell in row] for row in ws.iter_rows()] == [["a", "b"], [1, "x"], [2, "y"]]
+    assert mode(excel_file) == 0o666 & ~current_umask()
+
+
+def test_append_dataframe_to_excel(tmp_path):
+    excel_file = tmp_path / "db.xlsx"
+    append_dataframe_to_excel(pd.DataFrame({"a": [1], "b": ["x"]}), excel_file, "Data")
+    append_dataframe_to_excel(pd.DataFrame({"a": [2], "b": ["y"]}), excel_file, "Data")
+    append_dataframe_to_excel(pd.DataFrame({"c": [3.5]}), excel_file, "Other")
+
+    wb = load_workbook(excel_file)
+    assert [[cell.value for cell in row] for row in wb["Data"].iter_rows()] == [["a", "b"], [1, "x"], [2, "y"]]
+    assert [[cell.value for cell in row] for row in wb["Other"].iter_rows()] == [["c"], [3.5]]
+
+
+def test_write_block_to_excel_matches_write_column_to_excel():
+    data = pd.DataFrame({"Distance": [10, 20, 30], "Friction": [0.5, 0.61, 0.7], "Color": ["red", "green", "green"]})
+    formats = {"Distance": "General", "Friction": "0.00", "Color": {"font": Font(bold=True), "missing": 1}}
+    by_block, by_column = Workbook().active, Workbook().active
+    for ws in (by_block, by_column):
+        ws["C3"].font = Font(italic=True)
+
+    write_block_to_excel(by_block, 2, "B", data, formats)
+    for column, name in zip("BCD", data.columns):
+        write_column_to_excel(by_column, 2, column, data[name], formats[name])
+
+    for block_row, column_row in zip(by_block.iter_rows(min_row=2, min_col=2), by_column.iter_rows(min_row=2, min_col=2)):
+        for block_cell, column_cell in zip(block_row, column_row):
+            assert block_cell.value == column_cell.value
+            assert block_cell.number_format == column_cell.number_format
+            assert (block_cell.font.b, block_cell.font.i) == (column_cell.font.b, column_cell.font.i)
+    assert by_block["C3"].font.italic and not by_block["C4"].font.italic
+    assert by_block["D2"].font.bold and by_block["D4"].font.bold
+
+
+def current_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
@@ -0,0 +1,71 @@
+import json
+import time
+
+from app.cli.progress import Progress
+from app.utils.instrumentation import StageTiming, TimingRecorder, add_hook, emit, remove_hook, timed
+
+
+def test_nested_stages_exclude_each_other():
+    with TimingRecorder() as recorder:
+        with timed("align", "a.pdf"):
+            time.sleep(0.02)
+            with timed("derive", "a.pdf"):
+                time.sleep(0.05)
+
+    derive, align = recorder.timings
+    assert (derive.stage, align.stage) == ("derive", "align")
+    assert derive.seconds >= 0.05
+    assert 0.02 <= align.seconds < 0.05
+
+
+def test_nothing_is_recorded_without_hooks():
+    timings = []
+    with timed("parse", "a.pdf"):
+        pass
+    add_hook(timings.append)
+    try:
+        emit([StageTiming("b.pdf", "parse", 1.0)])
+    finally:
+        remove_hook(timings.append)
+    emit([StageTiming("c.pdf", "parse", 1.0)])
+
+    assert timings == [StageTiming("b.pdf", "parse", 1.0)]
+
+
+def test_summary_and_json(tmp_path):
+    recorder = TimingRecorder()
+    recorder(StageTiming("b.pdf", "save", 1.0))
+    recorder(StageTiming("a.pdf", "parse", 1.0))
+    recorder(StageTiming("a.pdf", "parse", 2.0))
+    recorder(StageTiming("b.pdf", "parse", 1.0))
+
+    summary = recorder.summary()
+
+    assert list(summary) == ["parse", "save"]
+    assert summary["parse"] == {"files": 2, "total_s": 4.0, "mean_s": 2.0, "max_s": 3.0}
+
+    recorder.to_json(tmp_path / "timings.json")
+    report = json.loads((tmp_path / "timings.json").read_text(encoding="utf-8"))
+    assert report["stages"] == summary
+    assert report["timings"][0] == {"file": "b.pdf", "stage": "save", "seconds": 1.0}
+
+
+def test_progress_text():
+    progress = Progress(4)
+    assert progress.text.startswith("0/4 archivos")
+
+    text = progress.update(2)
+    assert text.startswith("2/4 archivos, ")
+    assert ", faltan " in text
+    assert "faltan" not in progress.update(2)
+
+
+def test_runs_report_their_stages(db_runs):
+    data = db_runs[0]
+    with TimingRecorder() as recorder:
+        data.measurements_with_chainage
+
+    assert [(timing.file, timing.stage) for timing in recorder.timings] == [
+        (str(data.file_path), "derive"),
+        (str(data.file_path), "align"),
+    ]
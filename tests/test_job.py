@@ -0,0 +1,91 @@
+import json
+
+import click
+import pytest
+from click.testing import CliRunner
+from inquirer import Text
+
+from app.cli import create_db
+from app.cli.job import ask_missing, load_job, resolve_options
+
+from conftest import RGL
+
+
+def test_load_job_reads_json_and_yaml(tmp_path):
+    json_job = tmp_path / "job.json"
+    json_job.write_text(json.dumps({"runway-length": 2500, "operator": "test"}), encoding="utf-8")
+    yaml_job = tmp_path / "job.yml"
+    yaml_job.write_text("runway-length: 2500\noperator: test\n", encoding="utf-8")
+
+    assert load_job(str(json_job)) == {"runway_length": 2500, "operator": "test"}
+    assert load_job(str(yaml_job)) == {"runway_length": 2500, "operator": "test"}
+    assert load_job(None) == {}
+
+
+def test_load_job_rejects_files_without_a_mapping(tmp_path):
+    job = tmp_path / "job.json"
+    job.write_text("[1, 2]", encoding="utf-8")
+    with pytest.raises(click.UsageError, match="mapping"):
+        load_job(str(job))
+
+
+def test_command_line_options_override_the_job_file(tmp_path):
+    job = tmp_path / "job.json"
+    job.write_text(json.dumps({"operator": "job", "weather": "Bueno"}), encoding="utf-8")
+
+    with click.Context(create_db.main):
+        values = resolve_options(str(job), {"operator": "cli", "weather": None, "temperature": 20})
+
+    assert values == {"operator": "cli", "weather": "Bueno", "temperature": 20}
+
+
+def test_job_values_are_converted_by_their_options(tmp_path):
+    job = tmp_path / "job.json"
+    job.write_text(
+        json.dumps({"folder": str(RGL), "db": "db.xlsx", "starting-point-1": "10", "runway_length": 2500}),
+        encoding="utf-8",
+    )
+
+    with click.Context(create_db.main):
+        values = resolve_options(str(job), {})
+
+    assert values == {"folder_path": str(RGL), "db_file": "db.xlsx", "starting_point_1": 10, "runway_length": 2500}
+
+
+@pytest.mark.parametrize(
+    "job_values, message",
+    [
+        ({"temperature": "warm"}, "Invalid value for 'temperature'"),
+        ({"weather": "Nieve"}, "Invalid value for 'weather'"),
+        ({"folder": "missing folder"}, "Invalid value for 'folder'"),
+        ({"job": "other.json"}, "Unknown option 'job'"),
+        ({"temprature": 20}, "Unknown option 'temprature'"),
+    ],
+)
+def test_invalid_job_values_are_rejected(tmp_path, job_values, message):
+    job = tmp_path / "job.json"
+    job.write_text(json.dumps(job_values), encoding="utf-8")
+
+    result = CliRunner().invoke(create_db.main, ["--job", str(job)])
+
+    assert result.exit_code == 2
+    assert message in result.output
+
+
+def test_ask_missing_without_a_terminal():
+    questions = [Text("operator", message="Operador:"), Text("temperature", message="Temperatura:")]
+
+    assert ask_missing(questions, {"operator": "test", "temperature": 20}) == {"operator": "test", "temperature": 20}
+    with pytest.raises(click.UsageError, match="Missing values: temperature"):
+        ask_missing(questions, {"operator": "test"})
+
+
+def test_create_db_reports_missing_values_instead_of_prompting(tmp_path):
+    job = tmp_path / "job.json"
+    job.write_text(json.dumps({"folder": str(RGL), "db": str(tmp_path / "db.xlsx")}), encoding="utf-8")
+
+    result = CliRunner().invoke(create_db.main, ["--job", str(job), "--runway-length", "2500"])
+
+    assert result.exit_code == 2
+    assert "Missing values: starting_point_1, starting_point_2, operator," in result.output
+    assert not (tmp_path / "db.xlsx").exists()
@@ -0,0 +1,55 @@
+from app.models.ASFT_Data import ASFT_Data
+from app.models.parsers import TextLayerParser
+from app.utils.parse_cache import ParseCache
+
+from conftest import RGL_07_L3
+
+
+class CountingParser(TextLayerParser):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def read_header(self, file_path):
+        self.calls.append("header")
+        return super().read_header(file_path)
+
+    def read_measurements(self, file_path):
+        self.calls.append("measurements")
+        return super().read_measurements(file_path)
+
+
+def test_sections_are_parsed_on_first_access():
+    parser = CountingParser()
+    data = ASFT_Data(RGL_07_L3, parser=parser)
+    assert parser.calls == []
+
+    assert data.key_1 == "2303101119RGL07L3"
+    assert data.iata == "RGL"
+    assert parser.calls == ["header"]
+
+    assert len(data) == len(data.measurements) > 0
+    assert parser.calls == ["header", "measurements"]
+
+
+def test_cached_sections_are_not_parsed_again(tmp_path):
+    cache = ParseCache(tmp_path)
+    first = ASFT_Data(RGL_07_L3, cache, parser=CountingParser())
+    tables = first.tables
+
+    parser = CountingParser()
+    second = ASFT_Data(RGL_07_L3, cache, parser=parser)
+    assert second.key_1 == first.key_1
+    assert second.tables["measurements"].equals(tables["measurements"])
+    assert parser.calls == []
+
+
+def test_tables_given_by_a_worker_are_not_parsed_again():
+    first = ASFT_Data(RGL_07_L3, parser=TextLayerParser())
+    parser = CountingParser()
+
+    data = ASFT_Data(RGL_07_L3, tables=first.header_tables, parser=parser)
+    assert data.key_1 == first.key_1
+    assert parser.calls == []
+    data.measurements
+    assert parser.calls == ["measurements"]
@@ -0,0 +1,82 @@
+import os
+import shutil
+
+from app.utils.manifest import DUPLICATE, FAILED, OK, IngestManifest
+
+
+def make_files(folder, count):
+    folder.mkdir()
+    files = []
+    for i in range(count):
+        file = folder / f"run_{i}.pdf"
+        file.write_bytes(f"run {i}".encode())
+        files.append(file)
+    return files
+
+
+def test_done_files_are_skipped_after_save(tmp_path):
+    db_file = tmp_path / "db.xlsx"
+    db_file.touch()
+    files = make_files(tmp_path / "runs", 4)
+
+    manifest = IngestManifest(db_file)
+    assert manifest.pending(files) == files
+    manifest.record(files[0], OK, key_1="key_0")
+    manifest.record(files[1], DUPLICATE, key_1="key_1")
+    manifest.record(files[2], FAILED, error="ValueError: broken")
+    assert not manifest.file_path.exists()
+    manifest.save()
+
+    manifest = IngestManifest(db_file)
+    assert manifest.file_path == tmp_path / "db.xlsx.manifest.json"
+    assert manifest.records[str(files[0])].key_1 == "key_0"
+    assert manifest.records[str(files[2])].error == "ValueError: broken"
+    assert manifest.pending(files) == files[2:]
+
+
+def test_changed_files_are_pending_again(tmp_path):
+    db_file = tmp_path / "db.xlsx"
+    db_file.touch()
+    files = make_files(tmp_path / "runs", 2)
+    manifest = IngestManifest(db_file)
+    for file in files:
+        manifest.record(file, OK)
+    manifest.save()
+
+    files[0].write_bytes(b"run 0, measured again")
+    stat = files[1].stat()
+    os.utime(files[1], (stat.st_atime, stat.st_mtime + 60))
+
+    assert IngestManifest(db_file).pending(files) == [files[0]]
+
+
+def test_moved_files_are_matched_by_contents(tmp_path):
+    db_file = tmp_path / "db.xlsx"
+    db_file.touch()
+    files = make_files(tmp_path / "runs", 2)
+    manifest = IngestManifest(db_file)
+    manifest.record(files[0], OK, key_1="key_0")
+    manifest.save()
+
+    moved = tmp_path / "moved.pdf"
+    shutil.copy(files[0], moved)
+    manifest = IngestManifest(db_file)
+
+    assert manifest.pending([moved, files[1]]) == [files[1]]
+    assert manifest.records[str(moved)].key_1 == "key_0"
+
+
+def test_every_file_is_pending_once_the_database_is_deleted(tmp_path):
+    db_file = tmp_path / "db.xlsx"
+    db_file.touch()
+    files = make_files(tmp_path / "runs", 2)
+    manifest = IngestManifest(db_file)
+    for file in files:
+        manifest.record(file, OK)
+    manifest.save()
+
+    db_file.unlink()
+
+    manifest = IngestManifest(db_file)
+    assert manifest.records == {}
+    assert manifest.pending(files) == files
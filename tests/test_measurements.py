@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.models.ASFT_Data import ASFT_Data
+from app.models.measurements import CompactMeasurements
+
+from conftest import RGL_07_L3
+
+
+def test_round_trip_of_a_run(rgl_cache):
+    data = ASFT_Data(RGL_07_L3, rgl_cache)
+    measurements = data.measurements
+
+    compact = data.compact_measurements
+
+    assert compact.distance.dtype == np.int32
+    assert compact.speed.dtype == np.uint8
+    assert compact.friction.dtype == np.int16
+    assert compact.average.dtype == np.int16
+    assert compact.color_codes.dtype == np.uint8
+    assert len(compact) == len(data)
+    assert compact.nbytes == 10 * len(data)
+    pd.testing.assert_frame_equal(compact.to_frame(), measurements, check_dtype=False)
+    assert compact.to_frame(categorical=True)["Color Code"].dtype == "category"
+
+
+def test_values_that_do_not_fit_are_kept_exactly():
+    compact = CompactMeasurements(
+        distance=[10, 20], friction=[0.125, 0.5], speed=[60, 300], average=[0.5, np.nan], color_codes=None
+    )
+
+    assert compact.friction.dtype == np.float64
+    assert compact.speed.dtype == np.int16
+    assert compact.average.dtype == np.float64
+    frame = compact.to_frame()
+    assert list(frame.columns) == ["Distance", "Friction", "Speed", "Av. Friction 100m"]
+    assert list(frame["Friction"]) == [0.125, 0.5]
+    assert list(frame["Speed"]) == [60, 300]
+
+
+def test_invalid_measurements_are_rejected():
+    with pytest.raises(ValueError, match="same length"):
+        CompactMeasurements([10, 20], [0.5], [60, 60])
+
+    frame = pd.DataFrame({"Distance": [10], "Friction": [0.5], "Speed": [60], "Color Code": ["blue"]})
+    with pytest.raises(ValueError, match="Unknown color code"):
+        CompactMeasurements.from_frame(frame)
@@ -0,0 +1,35 @@
+import pandas as pd
+import pytest
+
+from app.utils.parquet_db import ParquetDatabase
+
+
+def test_failed_delete_keeps_the_partition(db_runs, tmp_path, monkeypatch):
+    L, R = db_runs
+    db_file = tmp_path / "db.parquet"
+    with ParquetDatabase(db_file) as db:
+        db.add(L)
+        db.add(R)
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(pd.DataFrame, "to_parquet", fail)
+        with pytest.raises(OSError, match="disk full"):
+            with ParquetDatabase(db_file) as db:
+                db.delete(L.key_1)
+
+    with ParquetDatabase(db_file) as db:
+        assert set(db.information()["key_1"]) == {L.key_1, R.key_1}
+        assert set(db.measurements()["key_1"]) == {L.key_1, R.key_1}
+        db.delete(L.key_1)
+
+    with ParquetDatabase(db_file) as db:
+        assert list(db.information()["key_1"]) == [R.key_1]
+        assert set(db.measurements()["key_1"]) == {R.key_1}
+        db.delete(R.key_1)
+
+    with ParquetDatabase(db_file) as db:
+        assert len(db) == 0
+    assert not any(path.name.startswith(".") for path in db_file.rglob("*"))
@@ -0,0 +1,50 @@
+import pathlib
+
+import pandas as pd
+
+from app.utils.parse_cache import ParseCache
+
+TABLE = pd.DataFrame({"Distance": [10, 20], "Friction": [0.71, 0.65], "Speed": [59, 62]})
+
+
+def test_put_and_get(tmp_path):
+    pdf = tmp_path / "run.pdf"
+    pdf.write_bytes(b"%PDF-1.4 run")
+    cache = ParseCache(tmp_path / "cache")
+    key = cache.key(pdf, namespace="camelot-1")
+
+    assert cache.get(key, "measurements") is None
+    cache.put(key, {"measurements": TABLE})
+
+    pd.testing.assert_frame_equal(cache.get(key, "measurements"), TABLE)
+    assert cache.get(key, "result_summary") is None
+    assert cache.key(pdf, namespace="text-1") != key
+    assert cache.invalidate(pdf, namespace="camelot-1")
+    assert cache.get(key, "measurements") is None
+
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    cache = ParseCache(tmp_path, max_bytes=1)
+    cache.put("old", {"measurements": TABLE})
+    cache.put("new", {"measurements": TABLE})
+
+    assert cache.get("old", "measurements") is None
+    assert cache.get("new", "measurements") is not None
+
+
+def test_entries_removed_by_another_process_are_skipped(tmp_path, monkeypatch):
+    cache = ParseCache(tmp_path)
+    cache.put("gone", {"measurements": TABLE})
+    cache.put("kept", {"measurements": TABLE})
+
+    stat = pathlib.Path.stat
+
+    def racing_stat(self, *args, **kwargs):
+        if "gone" in self.parts:
+            raise FileNotFoundError(self)
+        return stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(pathlib.Path, "stat", racing_stat)
+
+    assert [entry.name for entry, _, _ in cache._entries()] == ["kept"]
+    cache.put("another", {"measurements": TABLE})
@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+from app.models.ASFT_Data import ASFT_Data
+from app.models.parsers import PARSERS, ParserBackend, TextLayerParser, get_parser
+
+from conftest import RGL_07_L3
+
+
+def test_incomplete_parser_fails_on_creation():
+    class Incomplete(ParserBackend):
+        name = "incomplete"
+
+        def read_header(self, file_path):
+            return pd.DataFrame(), pd.DataFrame()
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_get_parser():
+    for name, parser in PARSERS.items():
+        assert isinstance(get_parser(name), parser)
+    with pytest.raises(ValueError):
+        get_parser("unknown")
+
+
+def test_text_layer_parser_matches_camelot(rgl_cache):
+    # The cached tables were extracted by the default camelot backend.
+    camelot_tables = ASFT_Data(RGL_07_L3, rgl_cache).tables
+    fmr, rs = TextLayerParser().read_header(RGL_07_L3)
+
+    pd.testing.assert_frame_equal(fmr, camelot_tables["friction_measure_report"])
+    pd.testing.assert_frame_equal(rs, camelot_tables["result_summary"])
+    pd.testing.assert_frame_equal(
+        TextLayerParser().read_measurements(RGL_07_L3), camelot_tables["measurements"], check_dtype=False
+    )
@@ -0,0 +1,41 @@
+from openpyxl import load_workbook
+
+from app.utils.report import START_ROW, write_report_no_chainage, write_report_with_chainage
+
+
+def test_write_report_no_chainage(rgl_pair, tmp_path):
+    L, R = rgl_pair
+    L.weather = "Bueno"
+    L.runway_material = "Asfalto"
+
+    write_report_no_chainage(L, R, tmp_path)
+
+    ws = load_workbook(tmp_path / "Datos RGL RWY07 3m 2023-03-10.xlsx").active
+    assert ws.title == "RGL RWY07 3m 2023-03-10"
+    assert ws["C3"].value == "RGL"
+    assert ws["E7"].value == "Bueno"
+
+    last_row = START_ROW + len(L) - 1
+    assert [ws[f"B{row}"].value for row in (START_ROW, last_row)] == list(L.measurements["Distance"].iloc[[0, -1]])
+    assert ws[f"C{START_ROW}"].value == L.measurements["Friction"].iloc[0]
+    assert ws[f"G{last_row}"].value == R.measurements["Friction"].iloc[-1]
+    assert ws[f"C{START_ROW}"].number_format == "0.00"
+    assert ws[f"B{START_ROW}"].number_format == "General"
+    assert ws[f"I{last_row}"].border.bottom.style == "medium"
+    assert ws[f"E{START_ROW}"].alignment.horizontal == "center"
+
+
+def test_write_report_with_chainage(rgl_pair, tmp_path):
+    L, R = rgl_pair
+    runway_length = 10 * len(L) + 100
+
+    write_report_with_chainage(L, R, runway_length, 10, tmp_path)
+
+    ws = load_workbook(tmp_path / "Datos RGL RWY07 3m 2023-03-10.xlsx").active
+    last_row = START_ROW + len(L) - 1
+    assert ws[f"B{START_ROW}"].value == 10
+    assert ws[f"B{last_row}"].value == 10 * len(L)
+    assert ws[f"C{START_ROW}"].value == L.measurements["Distance"].iloc[0]
+    assert ws[f"D{START_ROW}"].value == L.measurements["Friction"].iloc[0]
+    assert ws[f"D{START_ROW}"].number_format == "0.00"
+    assert ws[f"B{last_row + 1}"].value is None
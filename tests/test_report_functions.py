@@ -0,0 +1,89 @@
+from copy import copy
+from io import BytesIO
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+
+from app.utils.functions.report_functions import (
+    _template,
+    center_and_bold_cells,
+    load_template,
+    setup_workbook,
+)
+
+TEMPLATES = ["report_template_without_chainage.xlsx", "report_template_with_chainage.xlsx"]
+
+
+def test_load_template_returns_independent_usable_workbooks():
+    for template_name in TEMPLATES:
+        first = load_template(template_name)
+        second = load_template(template_name)
+        assert first is not second
+
+        first.active["C3"] = "AEP"
+        assert second.active["C3"].value != "AEP"
+
+        # Styles must survive loading, otherwise reading a font or saving raises IndexError.
+        assert second.active["C3"].font is not None
+        buffer = BytesIO()
+        second.save(buffer)
+        assert load_workbook(BytesIO(buffer.getvalue())).active.max_row == second.active.max_row
+
+
+def test_load_template_copies_the_parsed_template():
+    for template_name in TEMPLATES:
+        template = _template(template_name)
+        wb = load_template(template_name)
+        assert load_template(template_name) is not wb and _template(template_name) is template
+
+        buffer = BytesIO()
+        wb.save(buffer)
+        saved = load_workbook(BytesIO(buffer.getvalue())).active
+        assert set(map(str, saved.merged_cells.ranges)) == set(map(str, template.active.merged_cells.ranges))
+        for saved_row, template_row in zip(saved.iter_rows(), template.active.iter_rows()):
+            for saved_cell, template_cell in zip(saved_row, template_row):
+                assert saved_cell.value == template_cell.value
+                assert copy(saved_cell.font) == copy(template_cell.font)
+                assert copy(saved_cell.border) == copy(template_cell.border)
+                assert saved_cell.number_format == template_cell.number_format
+
+        fonts = len(template._fonts)
+        wb.active["C3"].font = Font(name="Arial", size=30)
+        center_and_bold_cells(wb.active, 3, 3, 3, 3)
+        assert len(template._fonts) == fonts
+        assert "Report cell" not in template.named_styles
+        assert template.active["C3"].font.name != "Arial"
+
+
+def test_setup_workbook_sets_title():
+    wb, ws = setup_workbook("report_template_with_chainage.xlsx", "AEP RWY13 3m 2022-05-20")
+    assert wb.active is ws
+    assert ws.title == "AEP RWY13 3m 2022-05-20"
+
+
+def test_center_and_bold_cells_keeps_number_format_and_font():
+    wb = Workbook()
+    ws = wb.active
+    for row in range(1, 5):
+        for column in range(1, 4):
+            cell = ws.cell(row=row, column=column, value=row * column)
+            cell.number_format = "0.00" if column == 2 else "General"
+    ws["C4"].font = Font(bold=True)
+
+    center_and_bold_cells(ws, 1, 1, 4, 3)
+
+    assert ws["A1"].border.left.style is None
+    for row in ws.iter_rows(min_row=2, max_row=4, max_col=3):
+        for cell in row:
+            assert cell.border.left.style == "medium"
+            assert cell.alignment.horizontal == "center"
+    assert ws["B2"].number_format == "0.00"
+    assert ws["A2"].number_format == "General"
+    assert ws["C4"].font.b
+    assert not ws["C3"].font.b
+    # One named style per combination of number format, font and fill.
+    assert len([name for name in wb.named_styles if name.startswith("Report cell")]) == 3
+
+    buffer = BytesIO()
+    wb.save(buffer)
+    assert load_workbook(BytesIO(buffer.getvalue())).active["B2"].border.left.style == "medium"
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from app.models.ASFT_Data import Smoothing
+from app.models.color_policy import ColorPolicy
+from app.models.run_collection import RunCollection
+from app.utils.functions.report_functions import friction_interval_mean, friction_thirds
+
+
+def test_run_collection_matches_each_run(rgl_pair):
+    runs = list(rgl_pair)
+    collection = RunCollection.from_runs(runs)
+    derived = collection.derived()
+
+    assert len(collection) == 2
+    assert list(collection.keys) == [run.key_1 for run in runs]
+    for run in runs:
+        rows = derived[derived["key_1"] == run.key_1].reset_index(drop=True)
+        measurements = run.measurements
+
+        pd.testing.assert_frame_equal(rows[list(measurements.columns)], measurements, check_dtype=False)
+        assert list(rows["Thirds"]) == friction_thirds(run)
+        np.testing.assert_allclose(rows["Average Friction 100m"], friction_interval_mean(measurements, "Friction"))
+
+
+def test_run_collection_follows_smoothing_and_policy(rgl_pair):
+    run = rgl_pair[0]
+    run.smoothing = Smoothing(window_size=5, center=False)
+    run.color_policy = ColorPolicy(red_below=0.7, spread_before=2, spread_after=1)
+
+    colors = RunCollection.from_runs([run]).color_codes(run.smoothing, run.color_policy)
+
+    assert list(colors) == list(run.measurements["Color Code"])
+
+
+def test_run_collection_from_db_drops_the_chainage_padding(db_runs):
+    run = db_runs[0]
+    padded = run.measurements_with_chainage
+    measurements = pd.DataFrame(
+        {
+            "key_1": run.key_1,
+            "distance": padded["Distance"],
+            "friction": padded["Friction"],
+            "speed": padded["Speed"],
+        }
+    )
+    information = pd.DataFrame([{"key_1": run.key_1, "fric_A": run.fric_A, "fric_B": run.fric_B, "fric_C": run.fric_C}])
+
+    collection = RunCollection.from_db(measurements, information)
+
+    assert len(collection.measurements) == len(run)
+    assert list(collection.color_codes()) == list(run.measurements["Color Code"])
+    assert len(RunCollection.from_runs([])) == 0
@@ -0,0 +1,10 @@
+import pytest
+
+from benchmarks.startup import ENTRY_POINTS, measure
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_help_does_not_import_heavy_modules(module):
+    result = measure(module, repeat=1)
+
+    assert result.imported == []
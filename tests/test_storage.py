@@ -0,0 +1,50 @@
+import pytest
+
+from app.utils.databases import get_storage
+from app.utils.excel_db import INFORMATION_COLUMNS, MEASUREMENT_COLUMNS, information_table, measurements_table
+from app.utils.storage import Storage
+
+DB_FILES = ["db.xlsx", "db.sqlite", "db.parquet"]
+
+
+def test_incomplete_storage_fails_on_creation(tmp_path):
+    class Incomplete(Storage):
+        name = "incomplete"
+
+        def __contains__(self, key):
+            return False
+
+    with pytest.raises(TypeError):
+        Incomplete(tmp_path / "db")
+
+
+@pytest.mark.parametrize("db_file", DB_FILES)
+def test_add_delete_and_replace(db_file, db_runs, tmp_path):
+    L, R = db_runs
+    db_file = tmp_path / db_file
+
+    with get_storage(db_file) as db:
+        db.add(L)
+        db.add(R)
+        with pytest.raises(Exception):
+            db.add(L)
+
+    with get_storage(db_file) as db:
+        assert len(db) == 2
+        assert L.key_1 in db and R.key_1 in db
+        assert list(db.information().columns) == INFORMATION_COLUMNS == list(information_table(L).columns)
+        assert list(db.measurements().columns) == MEASUREMENT_COLUMNS == list(measurements_table(L).columns)
+        assert set(db.measurements()["key_1"]) == {L.key_1, R.key_1}
+
+        db.delete(L.key_1)
+        assert L.key_1 not in db
+        with pytest.raises(Exception):
+            db.delete(L.key_1)
+        db.replace(R)
+
+    with get_storage(db_file) as db:
+        assert len(db) == 1
+        assert list(db.information()["key_1"]) == [R.key_1]
+        measurements = db.measurements()
+        assert list(measurements["key_1"].unique()) == [R.key_1]
+        assert (measurements["distance"] != 0).sum() == len(R)
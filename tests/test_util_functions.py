@@ -0,0 +1,72 @@
+import os
+
+import pandas as pd
+
+from app.models.ASFT_Data import ASFT_Data
+from app.models.parsers import ParserBackend
+from app.utils.functions.util_functions import ParseError, concurrent_ASFT, iter_ASFT
+
+from conftest import RGL, RGL_07_L3
+
+
+class CrashingParser(ParserBackend):
+    """
+    Kills the worker process, as the OS does when a worker runs out of memory.
+    """
+
+    name = "crashing"
+
+    def read_header(self, file_path):
+        os._exit(1)
+
+    def read_measurements(self, file_path):
+        os._exit(1)
+
+
+def test_iter_ASFT_yields_every_run(rgl_cache):
+    pdfs = sorted(str(pdf) for pdf in RGL.glob("*.pdf"))
+
+    runs = list(iter_ASFT(pdfs, cache=rgl_cache, max_workers=2, max_in_flight=2))
+
+    assert sorted(str(run.file_path) for run in runs) == pdfs
+    assert all(isinstance(run, ASFT_Data) for run in runs)
+
+
+def test_iter_ASFT_reports_failed_files(rgl_cache, tmp_path):
+    not_a_pdf = tmp_path / "not_a_pdf.pdf"
+    not_a_pdf.write_text("")
+
+    results = list(iter_ASFT([str(RGL_07_L3), str(not_a_pdf)], cache=rgl_cache, max_workers=2))
+
+    errors = [result for result in results if isinstance(result, ParseError)]
+    assert [error.file_path for error in errors] == [str(not_a_pdf)]
+
+
+def test_iter_ASFT_reports_every_file_when_a_worker_dies(tmp_path):
+    pdfs = []
+    for n in range(4):
+        pdf = tmp_path / f"{n}.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        pdfs.append(str(pdf))
+
+    results = list(iter_ASFT(pdfs, max_workers=1, max_in_flight=1, parser=CrashingParser()))
+
+    assert sorted(result.file_path for result in results) == pdfs
+    assert all(isinstance(result, ParseError) and result.error_type == "BrokenProcessPool" for result in results)
+
+
+def test_concurrent_ASFT_keeps_the_given_order(rgl_cache):
+    pdfs = sorted(str(pdf) for pdf in RGL.glob("*.pdf"))[::-1]
+
+    runs = concurrent_ASFT(pdfs, cache=rgl_cache, max_workers=2, header_only=True)
+
+    assert [str(run.file_path) for run in runs] == pdfs
+    assert isinstance(runs[0].header_tables["result_summary"], pd.DataFrame)
+
+
+def test_concurrent_ASFT_with_one_worker_and_no_files(rgl_cache):
+    assert concurrent_ASFT([], cache=rgl_cache) == []
+
+    runs = concurrent_ASFT(str(RGL_07_L3), [str(RGL_07_L3)], cache=rgl_cache, max_workers=1, chunksize=2)
+
+    assert [run.key_1 for run in runs] == ["2303101119RGL07L3"] * 2